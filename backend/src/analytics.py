@@ -0,0 +1,163 @@
+"""
+Grouped statistics over hand histories.
+
+Every function takes a hand-history array (e.g. from
+hand_history.open_history) or an iterable of chunks of one (from
+hand_history.iter_history), and reduces each chunk with np.bincount, so a
+history is scanned once in constant memory however large it is.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Union
+import numpy as np
+from card import CARDS, NUM_RANKS
+from hand_history import NO_ACTION
+
+
+History = Union[np.ndarray, Iterable[np.ndarray]]
+
+# Blackjack value (aces 11) of each rank code, for dealer up cards
+_RANK_VALUES = np.array([CARDS[code].value for code in range(NUM_RANKS)], dtype=np.intp)
+
+# Player totals and dealer up-card values index grids directly
+TOTALS = 22
+UP_VALUES = 12
+
+
+def _chunks(history: History) -> Iterable[np.ndarray]:
+    return [history] if isinstance(history, np.ndarray) else history
+
+
+class _GroupedSums:
+    """Per-group count, sum and sum of squares accumulated with bincount"""
+    
+    def __init__(self, size: int):
+        self.count = np.zeros(size, dtype=np.int64)
+        self.total = np.zeros(size)
+        self.squares = np.zeros(size)
+    
+    def add(self, groups: np.ndarray, values: np.ndarray):
+        size = len(self.count)
+        self.count += np.bincount(groups, minlength=size)
+        self.total += np.bincount(groups, weights=values, minlength=size)
+        self.squares += np.bincount(groups, weights=values * values, minlength=size)
+    
+    def result(self) -> Dict[str, np.ndarray]:
+        count = self.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, self.total / count, 0.0)
+            variance = np.where(count > 1, (self.squares - count * mean ** 2) / (count - 1), 0.0)
+            variance = np.maximum(variance, 0.0)
+            std_error = np.where(count > 1, np.sqrt(variance / count), 0.0)
+        return {'count': count, 'mean': mean, 'variance': variance, 'std_error': std_error}
+
+
+def _unit_net(chunk: np.ndarray) -> np.ndarray:
+    return chunk['net'].astype(np.float64) / chunk['bet']
+
+
+def ev_by_true_count(history: History, bin_width: float = 1.0,
+                     low: float = -10, high: float = 10) -> Dict[str, np.ndarray]:
+    """
+    EV per unit bet grouped by true count at bet time.
+    
+    Bins are [edge, edge + bin_width) for the returned left edges; counts
+    outside [low, high) fall into the first or last bin.
+    """
+    num_bins = int(np.ceil((high - low) / bin_width))
+    sums = _GroupedSums(num_bins)
+    for chunk in _chunks(history):
+        bins = np.floor((chunk['true_count'] - low) / bin_width).astype(np.intp)
+        sums.add(np.clip(bins, 0, num_bins - 1), _unit_net(chunk))
+    stats = sums.result()
+    stats['edges'] = low + bin_width * np.arange(num_bins)
+    return stats
+
+
+def ev_by_total_and_up_card(history: History) -> Dict[str, np.ndarray]:
+    """
+    EV per unit bet grouped by initial hand and dealer up card.
+    
+    Arrays have shape (2, TOTALS, UP_VALUES) and are indexed by
+    [soft, player total, up-card value (aces 11)].
+    """
+    size = 2 * TOTALS * UP_VALUES
+    sums = _GroupedSums(size)
+    for chunk in _chunks(history):
+        up_value = _RANK_VALUES[chunk['dealer_cards'][:, 0]]
+        groups = (chunk['soft'].astype(np.intp) * TOTALS + chunk['player_total']) * UP_VALUES + up_value
+        sums.add(groups, _unit_net(chunk))
+    return {name: values.reshape(2, TOTALS, UP_VALUES) for name, values in sums.result().items()}
+
+
+def bet_unit_counts(bets: np.ndarray, min_bet: float, counts: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Number of bets of each whole number of min_bet units, indexed by units
+    and added to counts when given (so bets can be counted a chunk at a time).
+    """
+    chunk_counts = np.bincount((np.asarray(bets, dtype=np.float64) / min_bet).astype(np.intp))
+    if counts is None:
+        return chunk_counts
+    if len(chunk_counts) > len(counts):
+        counts = np.pad(counts, (0, len(chunk_counts) - len(counts)))
+    counts[:len(chunk_counts)] += chunk_counts
+    return counts
+
+
+def unit_counts_to_distribution(counts: np.ndarray) -> Dict[int, int]:
+    """{units: number of bets} for the non-zero entries of bet_unit_counts"""
+    return {int(units): int(counts[units]) for units in np.flatnonzero(counts)}
+
+
+def bet_distribution(history: History, min_bet: float) -> Dict[int, int]:
+    """Number of rounds bet at each whole number of min_bet units"""
+    counts = None
+    for chunk in _chunks(history):
+        counts = bet_unit_counts(chunk['bet'], min_bet, counts)
+    return unit_counts_to_distribution(counts) if counts is not None else {}
+
+
+_COMPARISONS = {
+    'greater': np.greater,
+    'greater_equal': np.greater_equal,
+    'less': np.less,
+    'less_equal': np.less_equal,
+}
+
+
+def deviation_frequency(history: History, deviations: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """
+    How often each ConfigurableStrategy deviation fires on the first decision.
+    
+    A round is an opportunity for a deviation when the initial hard total
+    and up card match it (for the 8,8 no-split deviation, when the initial
+    hand is a pair of eights), and the deviation fires when the true count
+    also meets its condition. The count is the one recorded at bet time.
+    """
+    opportunities = {name: 0 for name in deviations}
+    fired = {name: 0 for name in deviations}
+    
+    for chunk in _chunks(history):
+        decided = chunk['actions'][:, 0] != NO_ACTION
+        total = chunk['player_total'].astype(np.intp)
+        hard_total = total - 10 * chunk['soft']
+        up_value = _RANK_VALUES[chunk['dealer_cards'][:, 0]]
+        true_count = chunk['true_count']
+        
+        for name, deviation in deviations.items():
+            match = decided & (hard_total == deviation['player_total']) & \
+                (up_value == deviation['dealer_card'])
+            if 'no_split' in name.lower():
+                match &= (chunk['pair'] == 1) & (total == 16)
+            compare = _COMPARISONS.get(deviation['comparison'])
+            opportunities[name] += int(match.sum())
+            if compare is not None:
+                fired[name] += int((match & compare(true_count, deviation['count_threshold'])).sum())
+    
+    return {
+        name: {
+            'opportunities': opportunities[name],
+            'fired': fired[name],
+            'rate': fired[name] / opportunities[name] if opportunities[name] else 0.0
+        }
+        for name in deviations
+    }
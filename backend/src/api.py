@@ -4,15 +4,21 @@ from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 import uuid
 import asyncio
+import functools
+from contextlib import asynccontextmanager
 from concurrent.futures import ThreadPoolExecutor
 
 from game import BlackjackGame, Action, GameState
 from strategy import ComputerPlayer, StrategyType, BettingStrategy, BasicStrategy
 from simulator import BlackjackSimulator
+from seeding import spawn_seeds
+from running_stats import Z_95
 from statistics import BlackjackStatistics
+from dealer_probabilities import unseen_composition
+from strategy_generator import basic_strategy_table, basic_strategy_tables, RuleSet
 from configurable_strategy import ConfigurableStrategy
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer
 import json
-import time
 
 
 class BetRequest(BaseModel):
@@ -30,6 +36,10 @@ class SimulationRequest(BaseModel):
     starting_bankroll: int = 1000
     base_bet: int = 10
     num_simulations: int = 1
+    seed: Optional[int] = None
+    # Stop each simulation once EV per unit bet is this precise; num_hands is the cap
+    target_std_error: Optional[float] = None
+    target_ci_width: Optional[float] = None
 
 
 class StrategyComparisonRequest(BaseModel):
@@ -37,6 +47,8 @@ class StrategyComparisonRequest(BaseModel):
     num_simulations: int = 5
     starting_bankroll: int = 1000
     base_bet: int = 10
+    seed: Optional[int] = None
+    paired: bool = False
 
 
 class CustomStrategyRequest(BaseModel):
@@ -50,6 +62,7 @@ class CustomStrategyRequest(BaseModel):
     min_bet: float = 10
     num_decks: int = 6
     penetration: float = 72
+    seed: Optional[int] = None
 
 
 class StrategyConfig(BaseModel):
@@ -72,7 +85,16 @@ game_sessions: Dict[str, GameSession] = {}
 # Thread pool for running simulations
 executor = ThreadPoolExecutor(max_workers=4)
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the generated basic strategy for the default rules in the
+    # background (generated on the first run, then read from the disk cache)
+    asyncio.get_event_loop().run_in_executor(executor, basic_strategy_table, RuleSet())
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Enable CORS for frontend
 app.add_middleware(
@@ -235,8 +257,14 @@ async def run_simulation(request: SimulationRequest):
         # Run simulations asynchronously
         loop = asyncio.get_event_loop()
         results = []
+        simulation_seeds = spawn_seeds(request.seed, request.num_simulations)
         
-        for _ in range(request.num_simulations):
+        # A 95% CI is 2 * 1.96 standard errors wide
+        target_std_error = request.target_std_error
+        if request.target_ci_width is not None:
+            target_std_error = request.target_ci_width / (2 * Z_95)
+        
+        for simulation_seed in simulation_seeds:
             player = ComputerPlayer(
                 playing_strategy=StrategyType(request.playing_strategy),
                 betting_strategy=BettingStrategy(request.betting_strategy),
@@ -246,10 +274,8 @@ async def run_simulation(request: SimulationRequest):
             
             result = await loop.run_in_executor(
                 executor,
-                simulator.simulate_hands,
-                player,
-                request.num_hands,
-                False
+                functools.partial(simulator.simulate_hands, player, request.num_hands,
+                                  seed=simulation_seed, target_std_error=target_std_error)
             )
             results.append(result.to_dict())
         
@@ -267,7 +293,7 @@ async def run_simulation(request: SimulationRequest):
             },
             "simulations": results
         }
-        
+    
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -285,12 +311,27 @@ async def compare_strategies(request: StrategyComparisonRequest):
         request.num_hands,
         request.num_simulations,
         request.starting_bankroll,
-        request.base_bet
+        request.base_bet,
+        request.seed,
+        request.paired
     )
     
     return results
 
 
+@app.get("/api/strategy/basic-table")
+async def get_basic_strategy_table(num_decks: int = 6, surrender: bool = False):
+    """Get the basic strategy tables generated for a rule set"""
+    if not 1 <= num_decks <= 8:
+        raise HTTPException(status_code=400, detail="num_decks must be between 1 and 8")
+    rules = RuleSet(num_decks=num_decks, surrender=surrender)
+    
+    loop = asyncio.get_event_loop()
+    hard, soft, split = await loop.run_in_executor(executor, basic_strategy_tables, rules)
+    return {"rules": {"num_decks": num_decks, "surrender": surrender},
+            "hard": hard, "soft": soft, "split": split}
+
+
 @app.get("/api/strategies")
 def get_available_strategies():
     """Get list of available playing and betting strategies"""
@@ -353,21 +394,32 @@ def get_statistics(session_id: str):
         current_hand = game.player_hands[game.current_hand_index]
         dealer_up_card = game.dealer_hand.cards[0]
         
+        # Dealer odds are exact for the unseen cards; play only reaches the
+        # player's turn when the dealer has no natural
+        composition = unseen_composition(game.deck, game.dealer_hand.cards[1:])
+        dealer_probs = BlackjackStatistics.calculate_dealer_final_value_probabilities(
+            dealer_up_card, composition, no_blackjack=True
+        )
+        
         # Calculate bust probability
         bust_prob = BlackjackStatistics.calculate_bust_probability(current_hand)
         
         # Calculate dealer bust probability
-        dealer_bust_prob = BlackjackStatistics.calculate_dealer_bust_probability(dealer_up_card)
+        dealer_bust_prob = dealer_probs['bust']
         
         # Get win/lose/push probabilities
-        outcome_probs = BlackjackStatistics.calculate_win_probability(current_hand, dealer_up_card)
+        outcome_probs = BlackjackStatistics.calculate_win_probability(
+            current_hand, dealer_up_card, composition, no_blackjack=True
+        )
         
         # Get recommended action
         basic_strategy = BasicStrategy()
         valid_actions = game.get_valid_actions()
         can_double = Action.DOUBLE in valid_actions
         can_split = Action.SPLIT in valid_actions
-        recommended_action = basic_strategy.get_action(current_hand, dealer_up_card, can_double, can_split)
+        can_surrender = Action.SURRENDER in valid_actions
+        recommended_action = basic_strategy.get_action(current_hand, dealer_up_card, can_double, can_split,
+                                                       can_surrender)
         
         # Get explanation for recommendation
         explanation = BlackjackStatistics.get_recommended_action_explanation(
@@ -378,7 +430,7 @@ def get_statistics(session_id: str):
         ev_by_action = {}
         for action in valid_actions:
             ev = BlackjackStatistics.calculate_expected_value(
-                action.value, current_hand, dealer_up_card, current_hand.bet
+                action.value, current_hand, dealer_up_card, current_hand.bet, composition
             )
             ev_by_action[action.value] = ev
         
@@ -394,7 +446,7 @@ def get_statistics(session_id: str):
             "dealer": {
                 "up_card": dealer_up_card.to_dict(),
                 "bust_probability": dealer_bust_prob,
-                "final_value_probabilities": BlackjackStatistics.calculate_dealer_final_value_probabilities(dealer_up_card)
+                "final_value_probabilities": dealer_probs
             },
             "outcome_probabilities": outcome_probs,
             "recommendation": {
@@ -472,116 +524,15 @@ async def simulate_custom_strategy(request: CustomStrategyRequest):
     
     # Run simulation
     strategy = ConfigurableStrategy(config, total_decks=request.num_decks)
-    game = BlackjackGame(num_decks=request.num_decks, shuffle_threshold=request.penetration/100)
-    
-    stats = {
-        'total_hands': 0,
-        'wins': 0,
-        'losses': 0,
-        'pushes': 0,
-        'blackjacks': 0,
-        'total_wagered': 0,
-        'total_won_lost': 0,
-        'bet_distribution': {}
-    }
-    
-    bankroll = request.starting_bankroll
-    max_bankroll = bankroll
-    min_bankroll = bankroll
-    
-    start_time = time.time()
-    strategy.reset_count()
-    
-    for hand_num in range(request.num_hands):
-        if bankroll < request.min_bet:
-            break
-            
-        if game.deck.needs_shuffle():
-            game.deck.shuffle()
-            strategy.reset_count()
-            
-        bet_amount = strategy.get_bet_amount(request.min_bet)
-        bet_amount = min(bet_amount, bankroll)
-        
-        bet_key = int(bet_amount / request.min_bet)
-        stats['bet_distribution'][str(bet_key)] = stats['bet_distribution'].get(str(bet_key), 0) + 1
-        
-        game.player_bankroll = bankroll
-        game.place_bet(bet_amount)
-        game.deal_initial_cards()
-        
-        for card in game.player_hands[0].cards:
-            strategy.observe_card(card)
-        strategy.observe_card(game.dealer_hand.cards[0])
-        
-        while game.state == GameState.PLAYER_TURN:
-            current_hand = game.player_hands[game.current_hand_index]
-            dealer_up_card = game.dealer_hand.cards[0]
-            can_split = len(game.player_hands) == 1 and game.player_hands[0].can_split()
-            
-            action = strategy.get_action(current_hand, dealer_up_card, can_split)
-            result = game.player_action(action)
-            if not result:
-                break
-                
-            if action in [Action.HIT, Action.DOUBLE]:
-                if game.state == GameState.PLAYER_TURN and game.current_hand_index < len(game.player_hands):
-                    new_hand = game.player_hands[game.current_hand_index]
-                    if len(new_hand.cards) > len(current_hand.cards):
-                        strategy.observe_card(new_hand.cards[-1])
-        
-        if game.state == GameState.DEALER_TURN:
-            dealer_start_cards = len(game.dealer_hand.cards)
-            game._play_dealer_hand()
-            for i in range(dealer_start_cards, len(game.dealer_hand.cards)):
-                strategy.observe_card(game.dealer_hand.cards[i])
-        
-        stats['total_hands'] += 1
-        stats['total_wagered'] += bet_amount * len(game.player_hands)
-        
-        for hand_result in game.get_round_results():
-            result = hand_result['result']
-            net = hand_result['net']
-            
-            if 'win' in result.lower() or result == 'blackjack':
-                stats['wins'] += 1
-                if result == 'blackjack':
-                    stats['blackjacks'] += 1
-            elif 'lose' in result.lower() or 'bust' in result.lower():
-                stats['losses'] += 1
-            else:
-                stats['pushes'] += 1
-                
-            stats['total_won_lost'] += net
-            bankroll += net
-        
-        max_bankroll = max(max_bankroll, bankroll)
-        min_bankroll = min(min_bankroll, bankroll)
-        
-        game.reset_round()
-    
-    elapsed_time = time.time() - start_time
-    
-    return {
-        'final_bankroll': bankroll,
-        'starting_bankroll': request.starting_bankroll,
-        'win_rate': stats['wins'] / stats['total_hands'] if stats['total_hands'] > 0 else 0,
-        'loss_rate': stats['losses'] / stats['total_hands'] if stats['total_hands'] > 0 else 0,
-        'push_rate': stats['pushes'] / stats['total_hands'] if stats['total_hands'] > 0 else 0,
-        'avg_bet': stats['total_wagered'] / stats['total_hands'] if stats['total_hands'] > 0 else 0,
-        'roi': stats['total_won_lost'] / stats['total_wagered'] if stats['total_wagered'] > 0 else 0,
-        'hands_per_hour': (stats['total_hands'] / elapsed_time * 3600) if elapsed_time > 0 else 0,
-        'max_bankroll': max_bankroll,
-        'min_bankroll': min_bankroll,
-        'total_hands': stats['total_hands'],
-        'wins': stats['wins'],
-        'losses': stats['losses'],
-        'pushes': stats['pushes'],
-        'blackjacks': stats['blackjacks'],
-        'total_wagered': stats['total_wagered'],
-        'total_won_lost': stats['total_won_lost'],
-        'bet_distribution': stats['bet_distribution']
-    }
+    stats = run_strategy_simulation(CountingStrategyPlayer(strategy), request.num_hands,
+                                    num_decks=request.num_decks, penetration=request.penetration,
+                                    min_bet=request.min_bet, bankroll=request.starting_bankroll,
+                                    seed=request.seed)
+    
+    # JSON object keys must be strings
+    stats['bet_distribution'] = {str(units): count
+                                 for units, count in stats['bet_distribution'].items()}
+    return stats
 
 
 @app.get("/api/strategy/default-config")
@@ -29,10 +29,24 @@ class Rank(Enum):
         self.symbol = symbol
 
 
+# Integer codes used by the array-backed shoe. A card code is
+# suit_index * NUM_RANKS + rank_code, so it fits comfortably in a uint8.
+RANKS: Tuple[Rank, ...] = tuple(Rank)
+SUITS: Tuple[Suit, ...] = tuple(Suit)
+NUM_RANKS = len(RANKS)
+NUM_CARD_CODES = NUM_RANKS * len(SUITS)
+RANK_CODES = {rank: code for code, rank in enumerate(RANKS)}
+
+
 class Card:
+    __slots__ = ('rank', 'suit', 'rank_code', 'value', 'is_ace', '_count_value')
+    
     def __init__(self, rank: Rank, suit: Suit):
         self.rank = rank
         self.suit = suit
+        self.rank_code = RANK_CODES[rank]
+        self.value = rank.points
+        self.is_ace = rank == Rank.ACE
         self._count_value = self._calculate_count_value()
     
     def _calculate_count_value(self) -> int:
@@ -43,10 +57,6 @@ class Card:
             return -1
         return 0
     
-    @property
-    def value(self) -> int:
-        return self.rank.points
-    
     @property
     def count_value(self) -> int:
         return self._count_value
@@ -62,4 +72,19 @@ class Card:
             "rank": self.rank.symbol,
             "suit": self.suit.value,
             "value": self.value
-        }
\ No newline at end of file
+        }
+    
+    @property
+    def code(self) -> int:
+        """Integer card code (suit_index * NUM_RANKS + rank_code)"""
+        return SUITS.index(self.suit) * NUM_RANKS + self.rank_code
+
+
+# Flyweight cards indexed by card code. Cards are never mutated, so the
+# array-backed shoe hands out these shared instances instead of allocating.
+CARDS: Tuple[Card, ...] = tuple(Card(rank, suit) for suit in SUITS for rank in RANKS)
+
+
+def card_from_code(code: int) -> Card:
+    """Return the shared Card instance for an integer card code"""
+    return CARDS[code]
@@ -0,0 +1,164 @@
+"""
+Card tapes: the cards of a simulation recorded once and recounted under any counting system.
+
+A counting system only changes a round through its bet (and through any
+playing deviations keyed to the count). With play held fixed, the cards
+dealt are identical under every count, so a simulation recorded once can
+be re-scored for many counting systems without dealing again: the tape
+keeps the rank of every dealt card, where the shoe was reshuffled and how
+many cards had been dealt when each round was bet.
+
+recount() turns that into a (rounds x ranks) matrix of the cards seen
+since the shuffle at each bet, and a single matrix multiply against a
+(configs x ranks) matrix of card values gives every system's running count
+at every bet. True counts (with the ace adjustment of
+ConfigurableCountingSystem) and betting ramps are then computed for all
+systems at once, and each system's bets are laid onto the recorded round
+outcomes with outcome_tape.replay_bets.
+
+Results are exact for the recording strategy's own play: systems whose
+count would trigger different playing deviations are scored as if they
+played like the recording strategy, so recounts rank count systems for a
+fixed play and the best should be confirmed by full simulation.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+import numpy as np
+from card import Card, RANKS, NUM_RANKS, RANK_CODES, Rank
+from hand import Hand
+from game import Action
+from outcome_tape import OutcomeTape, replay_bets
+from simulation_engine import SimulationStrategy
+
+
+ACE_CODE = RANK_CODES[Rank.ACE]
+
+
+class CardTape(SimulationStrategy):
+    """
+    Wrapper that plays a SimulationStrategy unchanged while recording the
+    cards dealt, the shuffles and the cards dealt before each bet. Pass an
+    OutcomeTape to run_strategy_simulation as well to record the outcomes.
+    """
+    
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self._rank_codes: List[int] = []
+        self._shuffles: List[int] = []
+        self._bets: List[int] = []
+    
+    def bet(self, min_bet: float) -> float:
+        self._bets.append(len(self._rank_codes))
+        return self.strategy.bet(min_bet)
+    
+    def act(self, hand: Hand, dealer_up_card: Card, can_double: bool,
+            can_split: bool, can_surrender: bool) -> Action:
+        return self.strategy.act(hand, dealer_up_card, can_double, can_split, can_surrender)
+    
+    def observe(self, card: Card):
+        self._rank_codes.append(card.rank_code)
+        self.strategy.observe(card)
+    
+    def reset(self):
+        self._shuffles.append(len(self._rank_codes))
+        self.strategy.reset()
+    
+    def true_count(self) -> float:
+        return self.strategy.true_count()
+    
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(rank codes in deal order, cards dealt at each shuffle, cards dealt at each bet)"""
+        return (np.array(self._rank_codes, dtype=np.uint8),
+                np.array(self._shuffles, dtype=np.int64),
+                np.array(self._bets, dtype=np.int64))
+
+
+def seen_rank_counts(rank_codes: np.ndarray, shuffles: np.ndarray, bets: np.ndarray) -> np.ndarray:
+    """
+    (rounds x NUM_RANKS) counts of each rank dealt between the last shuffle
+    and each bet.
+    
+    Cards are binned into the segments between consecutive bet and shuffle
+    positions, so only those positions are accumulated, not every card.
+    """
+    boundaries = np.unique(np.concatenate([[0], shuffles, bets, [len(rank_codes)]]))
+    segment = np.searchsorted(boundaries, np.arange(len(rank_codes)), side='right') - 1
+    counts = np.bincount(segment * NUM_RANKS + rank_codes,
+                         minlength=len(boundaries) * NUM_RANKS).reshape(len(boundaries), NUM_RANKS)
+    # cumulative[k] counts the cards before boundaries[k]
+    cumulative = np.zeros_like(counts)
+    np.cumsum(counts[:-1], axis=0, out=cumulative[1:])
+    
+    bet_rows = np.searchsorted(boundaries, bets)
+    # Shuffles at or before each bet (a shuffle at the bet position comes first)
+    shuffle_rows = np.searchsorted(boundaries, shuffles)
+    last_shuffle = np.searchsorted(shuffles, bets, side='right') - 1
+    start_rows = np.where(last_shuffle >= 0, shuffle_rows[np.maximum(last_shuffle, 0)], 0)
+    return cumulative[bet_rows] - cumulative[start_rows]
+
+
+def value_matrix(configs: Sequence[Dict[str, Any]]) -> np.ndarray:
+    """(configs x NUM_RANKS) card values of ConfigurableStrategy configs, unlisted ranks 0"""
+    values = np.zeros((len(configs), NUM_RANKS))
+    for row, config in enumerate(configs):
+        card_values = config['counting']['card_values']
+        for code, rank in enumerate(RANKS):
+            values[row, code] = card_values.get(rank.name, 0)
+    return values
+
+
+def true_counts(seen: np.ndarray, configs: Sequence[Dict[str, Any]], total_decks: int = 6) -> np.ndarray:
+    """
+    (rounds x configs) true counts at each bet, computed like
+    ConfigurableCountingSystem.get_true_count for every config at once.
+    """
+    running = seen @ value_matrix(configs).T
+    ace_adjustment = np.array([config['counting']['ace_adjustment'] for config in configs],
+                              dtype=np.float64)
+    
+    cards_remaining = total_decks * 52 - seen.sum(axis=1)
+    decks_remaining = np.where(cards_remaining > 0, cards_remaining, 52) / 52
+    aces_remaining = total_decks * 4 - seen[:, ACE_CODE]
+    extra_aces = aces_remaining - decks_remaining * 4
+    
+    adjusted = running + extra_aces[:, None] * ace_adjustment
+    return np.where((cards_remaining > 0)[:, None], adjusted / decks_remaining[:, None], 0.0)
+
+
+def ramp_bet_matrix(counts: np.ndarray, configs: Sequence[Dict[str, Any]],
+                    min_bet: float = 10) -> np.ndarray:
+    """(rounds x configs) bets of each config's betting ramp, as ConfigurableStrategy.get_bet_amount"""
+    threshold = np.array([config['betting']['count_threshold'] for config in configs], dtype=np.float64)
+    increment = np.array([config['betting']['count_increment'] for config in configs], dtype=np.float64)
+    max_units = np.array([config['betting']['max_bet_units'] for config in configs], dtype=np.float64)
+    
+    units = np.minimum(1 + np.floor((counts - threshold) / increment), max_units)
+    return np.where(counts < threshold, min_bet, min_bet * units)
+
+
+def recount(card_tape: CardTape, outcome_tape: OutcomeTape, configs: Sequence[Dict[str, Any]],
+            total_decks: int = 6, min_bet: float = 10, bankroll: float = 10000,
+            block_size: int = 64) -> List[Dict[str, Any]]:
+    """
+    Replay every config's counting system and betting ramp over a recorded
+    simulation, returning outcome_tape.replay_bets results per config with
+    'roi' as the return on the amount wagered (as run_strategy_simulation
+    reports it) rather than on the bankroll.
+    
+    Configs are recounted block_size at a time to bound the (rounds x
+    configs) matrices. The recording should use a bankroll large enough
+    never to limit doubles or splits (see outcome_tape).
+    """
+    rank_codes, shuffles, bets = card_tape.to_arrays()
+    tape = outcome_tape.to_array()
+    seen = seen_rank_counts(rank_codes, shuffles, bets[:len(tape)])
+    
+    results = []
+    for start in range(0, len(configs), block_size):
+        block = configs[start:start + block_size]
+        block_bets = ramp_bet_matrix(true_counts(seen, block, total_decks), block, min_bet)
+        for column in range(len(block)):
+            result = replay_bets(tape, block_bets[:, column], bankroll, min_bet)
+            result['roi'] = result['profit_loss'] / result['total_wagered'] if result['total_wagered'] > 0 else 0
+            results.append(result)
+    return results
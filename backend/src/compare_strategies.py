@@ -15,6 +15,7 @@ class Args:
         self.hands = hands
         self.decks = 6
         self.penetration = 72
+        self.seed = None
         self.min_bet = 10
         self.bankroll = 50000  # Larger bankroll to avoid bust
         self.verbose = False
@@ -2,7 +2,7 @@
 Configurable version of Dad's strategy for optimization
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from card import Card, Rank
 from hand import Hand
 from strategy import BasicStrategy
@@ -104,6 +104,13 @@ class ConfigurableStrategy(BasicStrategy):
         self.deviations = config['deviations']
         self.insurance_config = config['insurance']
         
+        # Deviations indexed by (player_total, dealer_card) so a decision only
+        # looks at the deviations that can apply to it
+        self._deviation_index: Dict[Tuple[int, int], List[Tuple[str, Dict]]] = {}
+        for dev_name, deviation in self.deviations.items():
+            key = (deviation['player_total'], deviation['dealer_card'])
+            self._deviation_index.setdefault(key, []).append((dev_name, deviation))
+        
     def observe_card(self, card: Card):
         """Update count when card is seen"""
         self.counting_system.count_card(card)
@@ -138,19 +145,19 @@ class ConfigurableStrategy(BasicStrategy):
         threshold = self.insurance_config['ace_excess_threshold']
         return ace_excess_per_deck >= threshold
         
-    def get_action(self, player_hand: Hand, dealer_up_card: Card, can_split: bool = True) -> Action:
+    def get_action(self, player_hand: Hand, dealer_up_card: Card, can_split: bool = True,
+                   can_double: bool = True, can_surrender: bool = True) -> Action:
         """Get action with configurable deviations"""
-        true_count = self.counting_system.get_true_count(self.total_decks)
-        
         # Get basic values
         _, player_total = player_hand.get_values()  # Hard total
         dealer_value = dealer_up_card.value
         
         # Check for applicable deviations
-        for dev_name, deviation in self.deviations.items():
-            if (player_total == deviation['player_total'] and 
-                dealer_value == deviation['dealer_card']):
-                
+        candidates = self._deviation_index.get((player_total, dealer_value))
+        if candidates:
+            true_count = self.counting_system.get_true_count(self.total_decks)
+            
+            for dev_name, deviation in candidates:
                 # Special case for 8,8 vs 10
                 if 'no_split' in dev_name.lower() and can_split:
                     if len(player_hand.cards) == 2 and all(c.rank == Rank.EIGHT for c in player_hand.cards):
@@ -165,11 +172,11 @@ class ConfigurableStrategy(BasicStrategy):
                     elif action_str == 'STAND':
                         return Action.STAND
                     elif action_str == 'DOUBLE':
-                        if len(player_hand.cards) == 2:
+                        if can_double and len(player_hand.cards) == 2:
                             return Action.DOUBLE
                     
         # Otherwise use basic strategy
-        return super().get_action(player_hand, dealer_up_card, can_split)
+        return super().get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
     
     def _check_count_condition(self, true_count: float, deviation: Dict) -> bool:
         """Check if count meets deviation condition"""
@@ -7,6 +7,7 @@ from strategy import StrategyType, BettingStrategy, BasicStrategy
 from hand import Hand
 from card import Card
 from game import Action
+from strategy_table import CompiledStrategy
 
 
 class CustomStrategy:
@@ -31,6 +32,12 @@ class CustomStrategy:
         
         # Validate the strategy
         self._validate_strategy()
+        
+        # Undefined or '?' decisions fall back to basic strategy
+        self.compiled_table = CompiledStrategy(
+            self.hard_strategy, self.soft_strategy, self.split_strategy,
+            fallback=BasicStrategy.compiled_table()
+        )
     
     def _validate_strategy(self):
         """Validate that the strategy tables are complete"""
@@ -63,47 +70,9 @@ class CustomStrategy:
                 print(f"  ... and {len(missing) - 10} more")
     
     def get_action(self, player_hand: Hand, dealer_up_card: Card, 
-                   can_double: bool = True, can_split: bool = True) -> Action:
+                   can_double: bool = True, can_split: bool = True, can_surrender: bool = True) -> Action:
         """Get action based on custom strategy"""
-        dealer_key = 'A' if dealer_up_card.rank.symbol == 'A' else dealer_up_card.value
-        
-        # Check for splitting pairs first
-        if can_split and player_hand.can_split() and len(player_hand.cards) == 2:
-            pair_value = player_hand.cards[0].value
-            if pair_value in self.split_strategy and dealer_key in self.split_strategy[pair_value]:
-                if self.split_strategy[pair_value][dealer_key] == 'Y':
-                    return Action.SPLIT
-        
-        # Check soft vs hard hands
-        if player_hand.is_soft:
-            strategy_table = self.soft_strategy
-        else:
-            strategy_table = self.hard_strategy
-        
-        total = player_hand.value
-        
-        # Get action from strategy table
-        if total in strategy_table and dealer_key in strategy_table[total]:
-            action_code = strategy_table[total][dealer_key]
-        else:
-            # Fallback to basic strategy if not defined
-            print(f"No custom strategy for {total} vs {dealer_key}, using basic strategy")
-            return BasicStrategy.get_action(player_hand, dealer_up_card, can_double, can_split)
-        
-        # Convert strategy code to Action
-        if action_code == 'H':
-            return Action.HIT
-        elif action_code == 'S':
-            return Action.STAND
-        elif action_code == 'D':
-            return Action.DOUBLE if can_double else Action.HIT
-        elif action_code == 'R':
-            return Action.SURRENDER
-        elif action_code == '?':
-            # Fallback to basic strategy for undefined
-            return BasicStrategy.get_action(player_hand, dealer_up_card, can_double, can_split)
-        else:
-            return Action.STAND
+        return self.compiled_table.get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
     
     def get_bet(self, base_bet: int, last_result: str = None, 
                 win_streak: int = 0, loss_streak: int = 0,
@@ -85,6 +85,8 @@ class DadCountingSystem:
 class DadStrategy(BasicStrategy):
     """Dad's complete strategy with counting and deviations"""
     
+    DEVIATION_TOTALS = frozenset({11, 12, 13, 16})
+    
     def __init__(self, total_decks: int = 6):
         super().__init__()
         self.counting_system = DadCountingSystem()
@@ -123,14 +125,19 @@ class DadStrategy(BasicStrategy):
         ace_excess_per_deck = self.counting_system.get_ace_excess_per_deck(self.total_decks)
         return ace_excess_per_deck >= 1
         
-    def get_action(self, player_hand: Hand, dealer_up_card: Card, can_split: bool = True) -> Action:
+    def get_action(self, player_hand: Hand, dealer_up_card: Card, can_split: bool = True,
+                   can_double: bool = True, can_surrender: bool = True) -> Action:
         """Get action with count-based deviations"""
-        true_count = self.counting_system.get_true_count(self.total_decks)
-        
         # Check for count-based deviations
         _, player_total = player_hand.get_values()  # Get hard total
         dealer_value = dealer_up_card.value
         
+        # Every deviation below is for one of these totals
+        if player_total not in self.DEVIATION_TOTALS:
+            return super().get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
+        
+        true_count = self.counting_system.get_true_count(self.total_decks)
+        
         # 16 vs 10: Stand if true count > 0
         if player_total == 16 and dealer_value == 10 and true_count > 0:
             return Action.STAND
@@ -153,7 +160,7 @@ class DadStrategy(BasicStrategy):
             
         # 11 vs 5 or 6: Double if true count > +10
         if player_total == 11 and dealer_value in [5, 6] and true_count > 10:
-            if len(player_hand.cards) == 2:  # Can only double on first two cards
+            if can_double and len(player_hand.cards) == 2:  # Can only double on first two cards
                 return Action.DOUBLE
                 
         # 8,8 vs 10: Stand (don't split) if count is positive
@@ -163,4 +170,4 @@ class DadStrategy(BasicStrategy):
             return Action.STAND
             
         # Otherwise use basic strategy
-        return super().get_action(player_hand, dealer_up_card, can_split)
\ No newline at end of file
+        return super().get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
\ No newline at end of file
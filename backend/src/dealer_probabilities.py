@@ -0,0 +1,207 @@
+"""
+Exact dealer outcome probabilities for a given shoe composition.
+
+The dealer draws to 17 and stands on all 17s. Every set of cards the
+dealer can draw after each up card is enumerated once at import; outcomes
+for a composition are then an exact weighted sum over those sets computed
+with NumPy. Results are memoized on (up card, composition) in an LRU
+cache, so repeated statistics requests for the same shoe state are free.
+
+A composition is a tuple of 10 counts of undealt cards by blackjack value:
+index 0 is twos through index 8 for ten-valued cards and index 9 for aces.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+from card import Card, RANKS
+from game import DEALER_STAND_VALUE
+
+
+NUM_VALUES = 10
+ACE_INDEX = 9
+TEN_INDEX = 8
+
+# Outcome tuple layout: final totals 17-21, bust, then dealer natural
+FINAL_TOTALS = (17, 18, 19, 20, 21)
+BUST = 5
+BLACKJACK = 6
+NUM_OUTCOMES = 7
+
+Composition = Tuple[int, ...]
+
+# Hard value (aces 1) of the card at each composition index
+_HARD_VALUES = tuple(range(2, 11)) + (1,)
+
+
+def value_index(card: Card) -> int:
+    """Composition index of card"""
+    return ACE_INDEX if card.is_ace else card.value - 2
+
+
+def composition_from_ranks(remaining_by_rank: Sequence[int]) -> Composition:
+    """Collapse per-rank counts (card.RANKS order, e.g. Deck.remaining_by_rank) to values"""
+    counts = [0] * NUM_VALUES
+    for rank, count in zip(RANKS, remaining_by_rank):
+        counts[ACE_INDEX if rank.value[0] == 11 else rank.value[0] - 2] += count
+    return tuple(counts)
+
+
+def full_shoe(num_decks: int = 6) -> Composition:
+    """Composition of an undealt shoe"""
+    return tuple([4 * num_decks] * 8 + [16 * num_decks, 4 * num_decks])
+
+
+def remove_cards(composition: Composition, cards: Iterable[Card]) -> Composition:
+    counts = list(composition)
+    for card in cards:
+        counts[value_index(card)] -= 1
+    return tuple(counts)
+
+
+def add_cards(composition: Composition, cards: Iterable[Card]) -> Composition:
+    counts = list(composition)
+    for card in cards:
+        counts[value_index(card)] += 1
+    return tuple(counts)
+
+
+def unseen_composition(deck, hidden_cards: Iterable[Card] = ()) -> Composition:
+    """
+    Composition of the cards the player has not seen: those left in deck
+    plus hidden_cards that were dealt face down (the dealer's hole card).
+    """
+    return add_cards(composition_from_ranks(deck.get_remaining_composition()), hidden_cards)
+
+
+def _hand_value(hard: int, aces: int) -> int:
+    return hard + 10 if aces and hard <= 11 else hard
+
+
+def _build_draws(up_index: int) -> Tuple[np.ndarray, ...]:
+    """
+    Every multiset of cards the dealer can draw after up_index, with the
+    number of orders in which it is drawn (stopping at 17) and its outcome.
+    
+    The probability of one order depends only on the multiset: it is the
+    product of falling factorials of the counts drawn of each value over
+    the falling factorial of the shoe size, so a composition's outcome
+    probabilities are a weighted sum over these rows.
+    """
+    up_hard = _HARD_VALUES[up_index]
+    up_aces = int(up_index == ACE_INDEX)
+    drawing = {(0,) * NUM_VALUES: 1}
+    final: Dict[Composition, list] = {}
+    first = True
+    while drawing:
+        next_drawing: Dict[Composition, int] = {}
+        for drawn, orders in drawing.items():
+            hard = up_hard + sum(n * v for n, v in zip(drawn, _HARD_VALUES))
+            aces = up_aces + drawn[ACE_INDEX]
+            for index in range(NUM_VALUES):
+                counts = drawn[:index] + (drawn[index] + 1,) + drawn[index + 1:]
+                new_hard = hard + _HARD_VALUES[index]
+                value = _hand_value(new_hard, aces + (index == ACE_INDEX))
+                if first and value == 21:
+                    outcome = BLACKJACK
+                elif value >= DEALER_STAND_VALUE:
+                    outcome = value - 17 if value <= 21 else BUST
+                else:
+                    next_drawing[counts] = next_drawing.get(counts, 0) + orders
+                    continue
+                row = final.setdefault(counts, [outcome, 0])
+                row[1] += orders
+        drawing = next_drawing
+        first = False
+    
+    counts = np.array(list(final), dtype=np.intp)
+    outcomes = np.array([row[0] for row in final.values()], dtype=np.intp)
+    orders = np.array([row[1] for row in final.values()], dtype=np.float64)
+    return counts, outcomes, orders
+
+
+class _DrawTable:
+    """
+    A dealer draw table laid out for NumPy: factor_index[k, row] indexes the
+    flattened per-value falling factorials for the k-th value drawn in row
+    (padded with a count of 0, whose factor is 1), so a row's numerator is
+    the product down axis 0.
+    """
+    
+    def __init__(self, counts: np.ndarray, outcomes: np.ndarray, orders: np.ndarray):
+        self.outcomes = outcomes
+        self.orders = orders
+        self.lengths = counts.sum(axis=1)
+        width = int((counts > 0).sum(axis=1).max())
+        self.factor_index = np.zeros((width, len(counts)), dtype=np.intp)
+        for row, drawn in enumerate(counts):
+            columns = np.flatnonzero(drawn)
+            self.factor_index[:len(columns), row] = columns * (_MAX_LENGTH + 1) + drawn[columns]
+
+
+def _falling_factorials(size: int, length: int) -> np.ndarray:
+    """[n, d] = n * (n - 1) * ... (d factors) for n < size, d <= length, 0 once exhausted"""
+    factors = np.maximum(np.arange(size, dtype=np.float64)[:, None] - np.arange(length), 0.0)
+    result = np.ones((size, length + 1))
+    np.cumprod(factors, axis=1, out=result[:, 1:])
+    return result
+
+
+_DRAWS = [_build_draws(index) for index in range(NUM_VALUES)]
+# Most cards the dealer can draw
+_MAX_LENGTH = max(int(counts.sum(axis=1).max()) for counts, _, _ in _DRAWS)
+_TABLES = [_DrawTable(*draws) for draws in _DRAWS]
+
+# Falling factorials of card counts, extended when a larger shoe is seen
+_factorials = _falling_factorials(52 * 8 + 1, _MAX_LENGTH)
+
+
+def _factorial_rows(counts) -> np.ndarray:
+    global _factorials
+    size = max(counts) + 1
+    if size > len(_factorials):
+        _factorials = _falling_factorials(size, _MAX_LENGTH)
+    return _factorials[list(counts)]
+
+
+@lru_cache(maxsize=4096)
+def dealer_outcomes(up_index: int, composition: Composition,
+                    no_blackjack: bool = False) -> Tuple[float, ...]:
+    """
+    Probabilities of the dealer's final outcome given the up card's
+    composition index and the composition of the unseen cards (which must
+    include the hole card).
+    
+    Returns NUM_OUTCOMES entries: totals 17-21 (without naturals), bust and
+    dealer natural. With no_blackjack the hole card is known not to make a
+    natural (the player is only asked to act when it does not), so the
+    natural probability is 0 and the rest are conditioned on that.
+    """
+    table = _TABLES[up_index]
+    total_cards = sum(composition)
+    factorials = _factorial_rows(composition + (total_cards,))
+    per_value = factorials[:NUM_VALUES].ravel()
+    shoe = factorials[NUM_VALUES]
+    weights = per_value.take(table.factor_index).prod(axis=0)
+    # A multiset larger than the shoe already has a zero factor
+    weights *= table.orders / np.where(shoe > 0, shoe, 1.0)[table.lengths]
+    outcome = np.bincount(table.outcomes, weights=weights, minlength=NUM_OUTCOMES)
+    if no_blackjack:
+        natural = outcome[BLACKJACK]
+        outcome[BLACKJACK] = 0.0
+        if natural < 1.0:
+            outcome /= 1.0 - natural
+    return tuple(outcome.tolist())
+
+
+def final_value_probabilities(up_card: Card, composition: Composition,
+                              no_blackjack: bool = False) -> Dict:
+    """
+    Dealer final value distribution in BlackjackStatistics' format:
+    {17: p, ..., 21: p, 'bust': p}, with naturals counted as 21.
+    """
+    outcome = dealer_outcomes(value_index(up_card), composition, no_blackjack)
+    probabilities = {total: outcome[k] for k, total in enumerate(FINAL_TOTALS)}
+    probabilities[21] += outcome[BLACKJACK]
+    probabilities['bust'] = outcome[BUST]
+    return probabilities
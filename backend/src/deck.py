@@ -1,17 +1,88 @@
-import random
-from typing import List, Optional
-from card import Card, Suit, Rank
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from card import Card, Suit, Rank, RANKS, CARDS, NUM_RANKS, NUM_CARD_CODES
+from seeding import SeedLike, as_seed_sequence, spawn_rng
+
+
+# Hi-Lo value per rank code, for the array shoe's deal path
+_HI_LO_BY_RANK = [CARDS[code].count_value for code in range(NUM_RANKS)]
+
+
+def shuffle_position(size: int, shuffle_threshold: float) -> int:
+    """Number of cards dealt from a shoe of size cards when Deck reshuffles"""
+    for dealt in range(size + 1):
+        if (size - dealt) / size <= shuffle_threshold:
+            return dealt
+    return size
 
 
 class Deck:
-    def __init__(self, num_decks: int = 1, shuffle_threshold: float = 0.25):
+    def __init__(self, num_decks: int = 1, shuffle_threshold: float = 0.25,
+                 seed: SeedLike = None):
         self.num_decks = num_decks
         self.shuffle_threshold = shuffle_threshold
+        self.seed_sequence = as_seed_sequence(seed)
         self.cards: List[Card] = []
         self.dealt_cards: List[Card] = []
+        self._count_systems: Dict[str, List[int]] = {}
+        self._system_counts: Dict[str, int] = {}
+        self._card_observers: List[Callable[[Card], None]] = []
+        self._shuffle_observers: List[Callable[[], None]] = []
         self._initialize_deck()
         self.shuffle()
     
+    def _reset_counts(self):
+        """Reset the incremental counts for a freshly shuffled shoe"""
+        self._running_count = 0
+        self.remaining_by_rank = [4 * self.num_decks] * NUM_RANKS
+        for name in self._count_systems:
+            self._system_counts[name] = 0
+        for on_shuffle in self._shuffle_observers:
+            on_shuffle()
+    
+    def add_observer(self, on_card: Callable[[Card], None],
+                     on_shuffle: Optional[Callable[[], None]] = None):
+        """
+        Call on_card with every card dealt and on_shuffle whenever the shoe
+        is reshuffled, e.g. a counting system's count_card and reset.
+        
+        A card that triggers the reshuffle is published before on_shuffle.
+        """
+        self._card_observers.append(on_card)
+        if on_shuffle is not None:
+            self._shuffle_observers.append(on_shuffle)
+    
+    def remove_observer(self, on_card: Callable[[Card], None],
+                        on_shuffle: Optional[Callable[[], None]] = None):
+        """Stop calling observers added with add_observer"""
+        if on_card in self._card_observers:
+            self._card_observers.remove(on_card)
+        if on_shuffle is not None and on_shuffle in self._shuffle_observers:
+            self._shuffle_observers.remove(on_shuffle)
+    
+    def register_count_system(self, name: str, card_values: Dict[Rank, int]):
+        """
+        Track an additional linear count system incrementally.
+        Ranks missing from card_values count as 0.
+        """
+        weights = [card_values.get(rank, 0) for rank in RANKS]
+        self._count_systems[name] = weights
+        dealt_by_rank = [4 * self.num_decks - left for left in self.remaining_by_rank]
+        self._system_counts[name] = sum(w * n for w, n in zip(weights, dealt_by_rank))
+    
+    def unregister_count_system(self, name: str):
+        """Stop tracking a count system registered with register_count_system"""
+        self._count_systems.pop(name, None)
+        self._system_counts.pop(name, None)
+    
+    def get_count(self, name: str) -> int:
+        """Get the running count of a registered count system"""
+        return self._system_counts[name]
+    
+    def get_remaining_composition(self) -> List[int]:
+        """Undealt cards per rank code (see card.RANKS)"""
+        return list(self.remaining_by_rank)
+    
     def _initialize_deck(self):
         """Create a fresh deck with specified number of standard decks"""
         self.cards = []
@@ -25,7 +96,11 @@ class Deck:
         """Shuffle the deck and reset dealt cards"""
         self.cards.extend(self.dealt_cards)
         self.dealt_cards = []
-        random.shuffle(self.cards)
+        # Each shoe gets its own stream spawned from the deck's seed
+        order = spawn_rng(self.seed_sequence).permutation(len(self.cards)).tolist()
+        cards = self.cards
+        self.cards = [cards[i] for i in order]
+        self._reset_counts()
     
     def deal(self) -> Optional[Card]:
         """Deal a single card from the deck"""
@@ -35,6 +110,17 @@ class Deck:
         card = self.cards.pop()
         self.dealt_cards.append(card)
         
+        # Keep counts and composition current so queries stay O(1)
+        self._running_count += card.count_value
+        rank_code = card.rank_code
+        self.remaining_by_rank[rank_code] -= 1
+        if self._count_systems:
+            for name, weights in self._count_systems.items():
+                self._system_counts[name] += weights[rank_code]
+        if self._card_observers:
+            for on_card in self._card_observers:
+                on_card(card)
+        
         # Check if we need to shuffle
         if self.needs_shuffle():
             self.shuffle()
@@ -61,7 +147,7 @@ class Deck:
     
     def get_running_count(self) -> int:
         """Get the running count for card counting"""
-        return sum(card.count_value for card in self.dealt_cards)
+        return self._running_count
     
     def get_true_count(self) -> float:
         """Get the true count (running count / decks remaining)"""
@@ -69,4 +155,143 @@ class Deck:
         decks_remaining = self.remaining_cards / 52
         if decks_remaining < 0.5:  # Avoid division by very small numbers
             decks_remaining = 0.5
-        return running_count / decks_remaining
\ No newline at end of file
+        return running_count / decks_remaining
+
+
+class ArrayDeck(Deck):
+    """
+    Shoe stored as a uint8 array of card codes with a deal cursor.
+    
+    Shuffling permutes the array in place with a NumPy Generator and dealing
+    just advances the cursor, so no Card objects are created or moved during
+    play. Cards are materialized on demand as shared flyweight instances.
+    """
+    
+    def __init__(self, num_decks: int = 1, shuffle_threshold: float = 0.25,
+                 seed: SeedLike = None):
+        self.num_decks = num_decks
+        self.shuffle_threshold = shuffle_threshold
+        self.seed_sequence = as_seed_sequence(seed)
+        self._count_systems: Dict[str, List[int]] = {}
+        self._system_counts: Dict[str, int] = {}
+        self._card_observers: List[Callable[[Card], None]] = []
+        self._shuffle_observers: List[Callable[[], None]] = []
+        self.codes = np.tile(np.arange(NUM_CARD_CODES, dtype=np.uint8), num_decks)
+        self.size = len(self.codes)
+        self.position = 0
+        self._shuffle_at = self._first_shuffle_position()
+        self._order: List[int] = []
+        self.shuffle()
+    
+    def _first_shuffle_position(self) -> int:
+        """Smallest number of dealt cards at which needs_shuffle() is true"""
+        return shuffle_position(self.size, self.shuffle_threshold)
+    
+    def shuffle(self):
+        """Shuffle the whole shoe in place and reset the deal cursor"""
+        spawn_rng(self.seed_sequence).shuffle(self.codes)
+        # Plain ints index the flyweight tuple faster than NumPy scalars
+        self._order = self.codes.tolist()
+        self.position = 0
+        self._reset_counts()
+    
+    def deal(self) -> Optional[Card]:
+        """Deal a single card from the shoe"""
+        position = self.position
+        if position >= self.size:
+            return None
+        
+        code = self._order[position]
+        self.position = position + 1
+        
+        rank_code = code % NUM_RANKS
+        self._running_count += _HI_LO_BY_RANK[rank_code]
+        self.remaining_by_rank[rank_code] -= 1
+        if self._count_systems:
+            for name, weights in self._count_systems.items():
+                self._system_counts[name] += weights[rank_code]
+        
+        card = CARDS[code]
+        if self._card_observers:
+            for on_card in self._card_observers:
+                on_card(card)
+        
+        if self.position >= self._shuffle_at:
+            self.shuffle()
+        
+        return card
+    
+    def needs_shuffle(self) -> bool:
+        """Check if shoe needs shuffling based on threshold"""
+        return self.position >= self._shuffle_at
+    
+    @property
+    def cards(self) -> List[Card]:
+        """Undealt cards, in the same order Deck keeps them (next card last)"""
+        return [CARDS[code] for code in reversed(self._order[self.position:])]
+    
+    @property
+    def dealt_cards(self) -> List[Card]:
+        """Cards dealt since the last shuffle, in deal order"""
+        return [CARDS[code] for code in self._order[:self.position]]
+    
+    @property
+    def remaining_cards(self) -> int:
+        return self.size - self.position
+    
+    @property
+    def penetration(self) -> float:
+        """Return the percentage of cards dealt"""
+        return self.position / self.size
+
+
+class ShoeBuffer:
+    """
+    Shared, lazily generated sequence of shuffled shoes.
+    
+    Shoe n is shuffled exactly as the nth shoe of ArrayDeck(num_decks,
+    seed=seed), so decks replaying the buffer see the same cards as an
+    ArrayDeck with that seed. Shoes are kept until evict_before() drops them.
+    """
+    
+    def __init__(self, num_decks: int = 1, seed: SeedLike = None):
+        self.num_decks = num_decks
+        self.seed_sequence = as_seed_sequence(seed)
+        self.codes = np.tile(np.arange(NUM_CARD_CODES, dtype=np.uint8), num_decks)
+        self._shoes: Dict[int, List[int]] = {}
+        self._generated = 0
+    
+    def shoe(self, index: int) -> List[int]:
+        """Card codes of shoe index in deal order, shuffling new shoes as needed"""
+        while self._generated <= index:
+            spawn_rng(self.seed_sequence).shuffle(self.codes)
+            self._shoes[self._generated] = self.codes.tolist()
+            self._generated += 1
+        if index not in self._shoes:
+            raise ValueError(f"Shoe {index} has already been evicted")
+        return self._shoes[index]
+    
+    def evict_before(self, index: int):
+        """Drop every buffered shoe before index"""
+        for old in [n for n in self._shoes if n < index]:
+            del self._shoes[old]
+    
+    @property
+    def buffered_shoes(self) -> int:
+        return len(self._shoes)
+
+
+class ReplayDeck(ArrayDeck):
+    """ArrayDeck that takes its shoes, in order, from a shared ShoeBuffer"""
+    
+    def __init__(self, source: ShoeBuffer, shuffle_threshold: float = 0.25):
+        self.source = source
+        self.shoe_index = -1
+        super().__init__(source.num_decks, shuffle_threshold)
+    
+    def shuffle(self):
+        """Move on to the next shoe of the buffer"""
+        self.shoe_index += 1
+        self._order = self.source.shoe(self.shoe_index)
+        self.position = 0
+        self._reset_counts()
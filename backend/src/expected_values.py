@@ -0,0 +1,152 @@
+"""
+Exact expected values of every player action for a given shoe composition.
+
+Each decision is solved by combinatorial analysis: the player's draws are
+enumerated over the unseen cards, and every total the player stands on is
+compared with the exact dealer outcome probabilities for the cards left
+at that point (dealer_probabilities). Subproblems are memoized on (player
+hand, up card, composition) in LRU caches shared by all actions, so the
+hit, double and split calculations reuse each other's results, and the
+hands reached by hitting are already solved when their next decision
+comes up.
+
+EVs are per unit of the hand's bet and, like the game, assume the dealer
+has no natural: decisions are only asked for when it does not. Splits
+are evaluated as two hands that each draw their second card from the
+composition after the split and then hit, stand or double; split hands
+cannot re-split or surrender, and A-10 after a split is 21, not a natural.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+from card import Card
+from hand import Hand
+from game import Action
+from dealer_probabilities import (
+    Composition, dealer_outcomes, value_index, FINAL_TOTALS, BUST, NUM_VALUES, ACE_INDEX
+)
+
+
+SURRENDER_EV = -0.5
+
+# Hard value (aces 1) of the card at each composition index
+_HARD_VALUES = tuple(range(2, 11)) + (1,)
+
+
+def hand_state(hand: Hand) -> Tuple[int, bool]:
+    """(hard total counting aces as 1, whether the hand holds an ace)"""
+    hard = 0
+    has_ace = False
+    for card in hand.cards:
+        if card.is_ace:
+            hard += 1
+            has_ace = True
+        else:
+            hard += card.value
+    return hard, has_ace
+
+
+def _value(hard: int, has_ace: bool) -> int:
+    return hard + 10 if has_ace and hard <= 11 else hard
+
+
+def _drawn(composition: Composition, index: int) -> Composition:
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+@lru_cache(maxsize=1 << 15)
+def stand_ev(total: int, up_index: int, composition: Composition) -> float:
+    """EV of standing on total against the up card at composition index up_index"""
+    if total > 21:
+        return -1.0
+    outcome = dealer_outcomes(up_index, composition, True)
+    ev = outcome[BUST]
+    for k, dealer_total in enumerate(FINAL_TOTALS):
+        if total > dealer_total:
+            ev += outcome[k]
+        elif total < dealer_total:
+            ev -= outcome[k]
+    return ev
+
+
+@lru_cache(maxsize=1 << 16)
+def _play_ev(hard: int, has_ace: bool, up_index: int, composition: Composition) -> float:
+    """EV of a hand that can only hit or stand, played optimally"""
+    value = _value(hard, has_ace)
+    if value > 21:
+        return -1.0
+    ev = stand_ev(value, up_index, composition)
+    if value < 21:
+        ev = max(ev, hit_ev(hard, has_ace, up_index, composition))
+    return ev
+
+
+def hit_ev(hard: int, has_ace: bool, up_index: int, composition: Composition) -> float:
+    """EV of taking a card and then playing optimally"""
+    ev = 0.0
+    for index in range(NUM_VALUES):
+        count = composition[index]
+        if count:
+            ev += count * _play_ev(hard + _HARD_VALUES[index], has_ace or index == ACE_INDEX,
+                                   up_index, _drawn(composition, index))
+    return ev / sum(composition)
+
+
+def double_ev(hard: int, has_ace: bool, up_index: int, composition: Composition) -> float:
+    """EV of doubling: twice the bet on exactly one more card"""
+    ev = 0.0
+    for index in range(NUM_VALUES):
+        count = composition[index]
+        if count:
+            value = _value(hard + _HARD_VALUES[index], has_ace or index == ACE_INDEX)
+            ev += count * stand_ev(value, up_index, _drawn(composition, index))
+    return 2 * ev / sum(composition)
+
+
+@lru_cache(maxsize=1 << 12)
+def split_ev(pair_index: int, up_index: int, composition: Composition) -> float:
+    """EV per unit of the original bet of splitting a pair (both cards already out of composition)"""
+    ev = 0.0
+    pair_hard = _HARD_VALUES[pair_index]
+    for index in range(NUM_VALUES):
+        count = composition[index]
+        if not count:
+            continue
+        hard = pair_hard + _HARD_VALUES[index]
+        has_ace = pair_index == ACE_INDEX or index == ACE_INDEX
+        drawn = _drawn(composition, index)
+        ev += count * max(_play_ev(hard, has_ace, up_index, drawn), double_ev(hard, has_ace, up_index, drawn))
+    # Both hands play alike, so the split is worth twice one hand
+    return 2 * ev / sum(composition)
+
+
+def action_evs(hand: Hand, dealer_up_card: Card, composition: Composition,
+               can_double: bool = True, can_split: bool = True,
+               can_surrender: bool = True) -> Dict[Action, float]:
+    """
+    EV per unit bet of each allowed action on hand. composition holds the
+    unseen cards: the shoe less every card dealt except the hole card (see
+    dealer_probabilities.unseen_composition).
+    """
+    hard, has_ace = hand_state(hand)
+    up_index = value_index(dealer_up_card)
+    evs = {
+        Action.STAND: stand_ev(_value(hard, has_ace), up_index, composition),
+        Action.HIT: hit_ev(hard, has_ace, up_index, composition)
+    }
+    if can_double:
+        evs[Action.DOUBLE] = double_ev(hard, has_ace, up_index, composition)
+    cards = hand.cards
+    if can_split and len(cards) == 2 and cards[0].value == cards[1].value:
+        evs[Action.SPLIT] = split_ev(value_index(cards[0]), up_index, composition)
+    if can_surrender:
+        evs[Action.SURRENDER] = SURRENDER_EV
+    return evs
+
+
+def best_action(hand: Hand, dealer_up_card: Card, composition: Composition,
+                can_double: bool = True, can_split: bool = True,
+                can_surrender: bool = True) -> Action:
+    """The allowed action with the highest EV"""
+    evs = action_evs(hand, dealer_up_card, composition, can_double, can_split, can_surrender)
+    return max(evs, key=evs.get)
@@ -1,10 +1,16 @@
 from enum import Enum
 from typing import List, Optional, Tuple, Dict, Any
 from deck import Deck
+from seeding import SeedLike
 from hand import Hand
 from card import Card
 
 
+# House rules shared by BlackjackGame and the headless RoundEngine
+DEALER_STAND_VALUE = 17  # Dealer draws below this and stands on all 17s
+BLACKJACK_PAYOUT = 2.5  # Total returned per unit bet on a natural (3:2)
+
+
 class Action(Enum):
     HIT = "hit"
     STAND = "stand"
@@ -21,8 +27,9 @@ class GameState(Enum):
 
 
 class BlackjackGame:
-    def __init__(self, num_decks: int = 6, shuffle_threshold: float = 0.25):
-        self.deck = Deck(num_decks, shuffle_threshold)
+    def __init__(self, num_decks: int = 6, shuffle_threshold: float = 0.25,
+                 deck: Optional[Deck] = None, seed: SeedLike = None):
+        self.deck = deck if deck is not None else Deck(num_decks, shuffle_threshold, seed)
         self.dealer_hand = Hand()
         self.player_hands: List[Hand] = [Hand()]
         self.current_hand_index = 0
@@ -30,7 +37,7 @@ class BlackjackGame:
         self.player_bankroll = 1000  # Starting bankroll
         self.min_bet = 5
         self.max_bet = 500
-        
+    
     def place_bet(self, amount: int) -> bool:
         """Place initial bet for the round"""
         if self.state != GameState.BETTING:
@@ -70,7 +77,8 @@ class BlackjackGame:
         if self.player_hands[0].is_blackjack and self.dealer_hand.is_blackjack:
             self.state = GameState.ROUND_OVER
         elif self.player_hands[0].is_blackjack:
-            self.state = GameState.DEALER_TURN
+            # Naturals are paid 3:2 without the dealer playing
+            self.state = GameState.ROUND_OVER
         elif self.dealer_hand.is_blackjack:
             self.state = GameState.ROUND_OVER
         else:
@@ -124,8 +132,9 @@ class BlackjackGame:
         elif action == Action.SPLIT:
             # Create new hand with one card from current hand
             new_hand = Hand()
+            hand.is_split_hand = True
             new_hand.is_split_hand = True
-            new_hand.add_card(hand.cards.pop())
+            new_hand.add_card(hand.pop_card())
             new_hand.bet = hand.bet
             self.player_bankroll -= hand.bet
             
@@ -164,7 +173,7 @@ class BlackjackGame:
         
         # Dealer hits on 16 and below, stands on 17 and above
         # Most casinos hit on soft 17
-        while self.dealer_hand.value < 17:
+        while self.dealer_hand.value < DEALER_STAND_VALUE:
             self.dealer_hand.add_card(self.deck.deal())
         
         self.state = GameState.ROUND_OVER
@@ -193,12 +202,12 @@ class BlackjackGame:
             if hand.is_bust:
                 result = "lose"
                 payout = 0
+            elif player_blackjack and not dealer_blackjack:
+                result = "blackjack"
+                payout = int(hand.bet * BLACKJACK_PAYOUT)  # 3:2 payout
             elif self.dealer_hand.is_bust:
                 result = "win"
                 payout = hand.bet * 2
-            elif player_blackjack and not dealer_blackjack:
-                result = "blackjack"
-                payout = int(hand.bet * 2.5)  # 3:2 payout
             elif dealer_blackjack and not player_blackjack:
                 result = "lose"
                 payout = 0
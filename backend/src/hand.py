@@ -1,57 +1,63 @@
 from typing import List, Tuple
-from card import Card, Rank
+from card import Card
 
 
 class Hand:
+    # Totals are maintained in add_card()/pop_card() so every query in the
+    # simulation hot loop is an attribute read instead of a rescan of cards.
+    __slots__ = ('cards', 'is_split_hand', 'has_doubled', 'bet',
+                 'hard_total', 'aces', 'is_soft', 'value')
+    
     def __init__(self):
         self.cards: List[Card] = []
         self.is_split_hand = False
         self.has_doubled = False
         self.bet = 0
+        self.hard_total = 0  # Every ace counted as 1
+        self.aces = 0
+        self.is_soft = False  # An ace is counted as 11
+        self.value = 0  # Best valid value for the hand
     
     def add_card(self, card: Card):
         """Add a card to the hand"""
         self.cards.append(card)
+        if card.is_ace:
+            self.aces += 1
+            hard = self.hard_total + 1
+        else:
+            hard = self.hard_total + card.value
+        self.hard_total = hard
+        # Inlined _update_value(): this runs for every card dealt in a simulation
+        if self.aces and hard <= 11:
+            self.is_soft = True
+            self.value = hard + 10
+        else:
+            self.is_soft = False
+            self.value = hard
+    
+    def pop_card(self) -> Card:
+        """Remove and return the last card (used when splitting)"""
+        card = self.cards.pop()
+        if card.is_ace:
+            self.aces -= 1
+            self.hard_total -= 1
+        else:
+            self.hard_total -= card.value
+        self._update_value()
+        return card
+    
+    def _update_value(self):
+        """Recompute the soft flag and best value from the running totals"""
+        hard = self.hard_total
+        self.is_soft = self.aces > 0 and hard + 10 <= 21
+        self.value = hard + 10 if self.is_soft else hard
     
     def get_values(self) -> Tuple[int, int]:
         """
         Get both possible values for the hand (soft and hard).
         Returns (soft_value, hard_value)
         """
-        total = 0
-        aces = 0
-        
-        for card in self.cards:
-            if card.rank == Rank.ACE:
-                aces += 1
-                total += 11
-            else:
-                total += card.value
-        
-        # Adjust for aces
-        hard_total = total
-        while hard_total > 21 and aces > 0:
-            hard_total -= 10
-            aces -= 1
-        
-        # Soft total is when we have at least one ace counted as 11
-        soft_total = total if aces > 0 and total <= 21 else hard_total
-        
-        return (soft_total, hard_total)
-    
-    @property
-    def value(self) -> int:
-        """Get the best valid value for the hand"""
-        soft, hard = self.get_values()
-        if soft <= 21:
-            return soft
-        return hard
-    
-    @property
-    def is_soft(self) -> bool:
-        """Check if hand is soft (has ace counted as 11)"""
-        soft, hard = self.get_values()
-        return soft != hard and soft <= 21
+        return (self.value, self.hard_total)
     
     @property
     def is_bust(self) -> bool:
@@ -61,7 +67,7 @@ class Hand:
     @property
     def is_blackjack(self) -> bool:
         """Check if hand is a natural blackjack"""
-        return len(self.cards) == 2 and self.value == 21 and not self.is_split_hand
+        return self.value == 21 and len(self.cards) == 2 and not self.is_split_hand
     
     def can_split(self) -> bool:
         """Check if hand can be split"""
@@ -80,6 +86,10 @@ class Hand:
         self.is_split_hand = False
         self.has_doubled = False
         self.bet = 0
+        self.hard_total = 0
+        self.aces = 0
+        self.is_soft = False
+        self.value = 0
     
     def to_dict(self) -> dict:
         """Convert hand to dictionary for JSON serialization"""
@@ -99,4 +109,4 @@ class Hand:
     
     def __str__(self) -> str:
         cards_str = " ".join(str(card) for card in self.cards)
-        return f"{cards_str} (value: {self.value})"
\ No newline at end of file
+        return f"{cards_str} (value: {self.value})"
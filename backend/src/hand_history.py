@@ -0,0 +1,158 @@
+"""
+Append-only hand-history files with one fixed-size record per round.
+
+Records are buffered in NumPy arrays and appended to the file in bulk, and
+files are read back through numpy.memmap, so analyses can scan histories
+far larger than memory a chunk at a time.
+
+Cards are stored as rank codes (card.RANKS) padded with NO_CARD. Each hand
+stores the first action played on it; later decisions are implied by its
+cards (further cards are hits and the hand then stands, busts or reaches
+21). Rounds that split into more than MAX_HANDS hands, which takes several
+re-splits, keep their net and num_hands but only the first MAX_HANDS
+hands' cards.
+"""
+
+import os
+import struct
+from typing import Dict, Iterator
+import numpy as np
+from game import Action
+from round_engine import RoundEngine, Policy
+
+
+MAX_HANDS = 4
+MAX_CARDS = 11  # Eleven cards is the most a hand can hold without busting
+NO_CARD = 255
+NO_ACTION = 255
+NO_RESULT = 255
+
+ACTIONS = (Action.HIT, Action.STAND, Action.DOUBLE, Action.SPLIT, Action.SURRENDER)
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+HISTORY_DTYPE = np.dtype([
+    ('bet', np.float32),          # Initial bet
+    ('true_count', np.float32),   # True count when the bet was placed
+    ('net', np.float32),          # Net win/loss of the round
+    ('player_total', np.uint8),   # Value of the initial two cards
+    ('soft', np.uint8),           # Initial hand is soft
+    ('pair', np.uint8),           # Initial hand is a pair
+    ('num_hands', np.uint8),
+    ('dealer_cards', np.uint8, (MAX_CARDS,)),
+    ('player_cards', np.uint8, (MAX_HANDS, MAX_CARDS)),
+    ('actions', np.uint8, (MAX_HANDS,)),  # First action per hand (ACTION_CODES)
+    ('results', np.uint8, (MAX_HANDS,)),  # round_engine result codes
+])
+
+# The same little-endian, unaligned layout packed from Python values, which
+# is much cheaper per round than assigning fields of a NumPy record
+_RECORD = struct.Struct(f'<fffBBBB{MAX_CARDS}s{MAX_HANDS * MAX_CARDS}s{MAX_HANDS}s{MAX_HANDS}s')
+assert _RECORD.size == HISTORY_DTYPE.itemsize
+
+# NO_CARD, NO_ACTION and NO_RESULT all pad with the same byte
+_PAD = bytes((NO_CARD,))
+
+
+class HandHistoryWriter:
+    """
+    Appends rounds played by a RoundEngine to a hand-history file.
+    
+    Decisions are captured by wrapping the round's policy with
+    record_policy(); record_round() then packs the finished round into
+    the buffer, which is written out every buffer_rounds rounds and on
+    flush() or close().
+    """
+    
+    def __init__(self, path: str, buffer_rounds: int = 65536):
+        self.path = path
+        self.buffer_rounds = buffer_rounds
+        self._file = open(path, 'ab')
+        self._buffer = bytearray()
+        self._size = 0
+        self.rounds_written = os.path.getsize(path) // HISTORY_DTYPE.itemsize
+        self._first_actions: Dict[int, Action] = {}
+        self._initial = None
+    
+    def record_policy(self, policy: Policy) -> Policy:
+        """Wrap policy so the first action played on each hand is remembered"""
+        first_actions = self._first_actions
+        
+        def recording_policy(hand, dealer_up_card, can_double, can_split, can_surrender):
+            action = policy(hand, dealer_up_card, can_double, can_split, can_surrender)
+            # Record what RoundEngine will actually play
+            if action is Action.DOUBLE and not can_double:
+                action = Action.HIT
+            elif (action is Action.SPLIT and not can_split) or \
+                    (action is Action.SURRENDER and not can_surrender):
+                action = Action.STAND
+            if not first_actions:
+                self._initial = (hand.value, hand.is_soft, hand.cards[0].value == hand.cards[1].value)
+            first_actions.setdefault(id(hand), action)
+            return action
+        
+        return recording_policy
+    
+    def record_round(self, engine: RoundEngine, bet: float, true_count: float):
+        """Pack the round engine just played into the buffer"""
+        first_actions = self._first_actions
+        hands = engine.hands
+        initial = self._initial
+        if initial is None:
+            # No decisions were made: the first hand still holds the initial cards
+            first = hands[0]
+            initial = (first.value, first.is_soft, first.cards[0].value == first.cards[1].value)
+        
+        num_hands = engine.num_hands
+        stored = min(num_hands, MAX_HANDS)
+        dealer_cards = bytes([card.rank_code for card in engine.dealer_hand.cards[:MAX_CARDS]])
+        player_cards = b''.join(bytes([card.rank_code for card in hands[h].cards[:MAX_CARDS]])
+                                .ljust(MAX_CARDS, _PAD) for h in range(stored))
+        actions = bytes([ACTION_CODES[first_actions[id(hands[h])]] if id(hands[h]) in first_actions
+                         else NO_ACTION for h in range(stored)])
+        
+        self._buffer += _RECORD.pack(
+            bet, true_count, engine.net, initial[0], initial[1], initial[2], num_hands,
+            dealer_cards.ljust(MAX_CARDS, _PAD),
+            player_cards.ljust(MAX_HANDS * MAX_CARDS, _PAD),
+            actions.ljust(MAX_HANDS, _PAD),
+            bytes(engine.results[:stored]).ljust(MAX_HANDS, _PAD)
+        )
+        
+        first_actions.clear()
+        self._initial = None
+        self._size += 1
+        if self._size >= self.buffer_rounds:
+            self.flush()
+    
+    def flush(self):
+        """Append buffered rounds to the file"""
+        if self._size:
+            self._file.write(self._buffer)
+            self._file.flush()
+            self.rounds_written += self._size
+            self._buffer = bytearray()
+            self._size = 0
+    
+    def close(self):
+        self.flush()
+        self._file.close()
+    
+    def __enter__(self) -> 'HandHistoryWriter':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_history(path: str) -> np.ndarray:
+    """Memory-map a hand-history file read-only"""
+    if os.path.getsize(path) == 0:
+        return np.zeros(0, dtype=HISTORY_DTYPE)
+    return np.memmap(path, dtype=HISTORY_DTYPE, mode='r')
+
+
+def iter_history(path: str, chunk_rounds: int = 1 << 20) -> Iterator[np.ndarray]:
+    """Yield a hand-history file in chunks of up to chunk_rounds records"""
+    history = open_history(path)
+    for start in range(0, len(history), chunk_rounds):
+        yield history[start:start + chunk_rounds]
@@ -1,181 +1,302 @@
 #!/usr/bin/env python3
 """
-Grid search optimizer for blackjack strategy parameters
+Grid search optimizer for blackjack strategy parameters, with successive
+halving, model-based (Bayesian) search and card-tape recounting as
+cheaper alternatives
 """
 
 import argparse
+import heapq
 import itertools
 import json
 import time
 import csv
 import os
 from datetime import datetime
-from typing import Dict, List, Any, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+import numpy as np
 import dad_strategy_config as default_config
 from configurable_strategy import ConfigurableStrategy
-from game import BlackjackGame, GameState
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer
 from card import Rank
+from seeding import SeedLike, spawn_seeds
+from surrogate import propose_batch
+from result_store import ResultStore, result_key
+from outcome_tape import OutcomeTape
+from card_tape import CardTape, recount
 
 
 def run_simulation_with_config(config: Dict[str, Any], num_hands: int = 10000, 
                               num_decks: int = 6, bankroll: float = 10000,
-                              min_bet: float = 10) -> Dict[str, float]:
+                              min_bet: float = 10, seed: SeedLike = None) -> Dict[str, float]:
     """Run simulation with specific configuration"""
     
     strategy = ConfigurableStrategy(config, total_decks=num_decks)
-    game = BlackjackGame(num_decks=num_decks, shuffle_threshold=0.72)
-    
-    stats = {
-        'hands': 0,
-        'wins': 0,
-        'losses': 0,
-        'pushes': 0,
-        'total_wagered': 0,
-        'total_won_lost': 0
-    }
-    
-    current_bankroll = bankroll
-    strategy.reset_count()
+    stats = run_strategy_simulation(CountingStrategyPlayer(strategy), num_hands,
+                                    num_decks=num_decks, penetration=72,
+                                    min_bet=min_bet, bankroll=bankroll, seed=seed)
     
-    for hand_num in range(num_hands):
-        if current_bankroll < min_bet:
-            break
-            
-        # Check for shuffle
-        if game.deck.needs_shuffle():
-            game.deck.shuffle()
-            strategy.reset_count()
-            
-        # Get bet
-        bet_amount = strategy.get_bet_amount(min_bet)
-        bet_amount = min(bet_amount, current_bankroll)
-        
-        # Play hand
-        game.reset_round()
-        game.player_bankroll = current_bankroll
-        game.place_bet(bet_amount)
-        game.deal_initial_cards()
-        
-        # Count cards
-        for card in game.player_hands[0].cards:
-            strategy.observe_card(card)
-        strategy.observe_card(game.dealer_hand.cards[0])
-        
-        # Play out hand
-        while game.state == GameState.PLAYER_TURN:
-            hand = game.player_hands[game.current_hand_index]
-            action = strategy.get_action(hand, game.dealer_hand.cards[0])
-            if not game.player_action(action):
-                break
-                
-        # Dealer plays
-        if game.state == GameState.DEALER_TURN:
-            dealer_start = len(game.dealer_hand.cards)
-            game._play_dealer_hand()
-            for i in range(dealer_start, len(game.dealer_hand.cards)):
-                strategy.observe_card(game.dealer_hand.cards[i])
-                
-        # Results
-        stats['hands'] += 1
-        stats['total_wagered'] += bet_amount * len(game.player_hands)
-        
-        for result in game.get_round_results():
-            if 'win' in result['result'] or result['result'] == 'blackjack':
-                stats['wins'] += 1
-            elif 'lose' in result['result']:
-                stats['losses'] += 1
-            else:
-                stats['pushes'] += 1
-            stats['total_won_lost'] += result['net']
-            current_bankroll += result['net']
-    
-    # Calculate metrics
-    roi = stats['total_won_lost'] / stats['total_wagered'] if stats['total_wagered'] > 0 else 0
-    win_rate = stats['wins'] / stats['hands'] if stats['hands'] > 0 else 0
+    return {
+        'roi': stats['roi'],
+        'win_rate': stats['win_rate'],
+        'hands_played': stats['total_hands'],
+        'final_bankroll': stats['final_bankroll']
+    }
+
+
+# Table rules run_config_chunk simulates (run_simulation_with_config defaults),
+# part of every result_store key
+SIMULATION_RULES = {'num_decks': 6, 'penetration': 72, 'bankroll': 10000, 'min_bet': 10}
+
+
+# Search ranges (2 and 7 count 0 and high cards -3 throughout)
+CARD_VALUE_RANGES = {
+    'THREE': [2, 3, 4],
+    'FOUR': [3, 4, 5],
+    'FIVE': [4, 5, 6],
+    'SIX': [2, 3, 4],
+    'EIGHT': [-2, -1, 0],
+    'NINE': [-3, -2, -1],
+}
+ACE_ADJUSTMENTS = [3, 4, 5]
+BETTING_THRESHOLDS = [3, 4, 5, 6]
+BETTING_INCREMENTS = [3, 5, 7]
+
+DEVIATION_THRESHOLDS = {
+    '16_vs_10': [-1, 0, 1],
+    '12_vs_3': [3, 5, 7],
+    '12_vs_2': [8, 10, 12],
+    '13_vs_2': [-7, -5, -3],
+    '13_vs_3': [-12, -10, -8],
+    '11_vs_56': [8, 10, 12],
+    '88_vs_10': [-1, 0, 1]
+}
+
+
+def grid_size() -> int:
+    """Number of configurations generate_parameter_grid() yields"""
+    size = len(ACE_ADJUSTMENTS) * len(BETTING_THRESHOLDS) * len(BETTING_INCREMENTS)
+    for values in CARD_VALUE_RANGES.values():
+        size *= len(values)
+    return size
+
+
+# PLAY_DEVIATIONS entries whose count_threshold each DEVIATION_THRESHOLDS key sets
+DEVIATION_PLAYS = {
+    '16_vs_10': ('16_vs_10_stand',),
+    '12_vs_3': ('12_vs_3_stand',),
+    '12_vs_2': ('12_vs_2_stand',),
+    '13_vs_2': ('13_vs_2_hit',),
+    '13_vs_3': ('13_vs_3_hit',),
+    '11_vs_56': ('11_vs_5_double', '11_vs_6_double'),
+    '88_vs_10': ('88_vs_10_no_split',)
+}
+
+
+def build_config(card_values: Dict[str, int], ace_adjustment: int, count_threshold: int,
+                 count_increment: int, deviation_thresholds: Optional[Dict[str, int]] = None
+                 ) -> Dict[str, Any]:
+    """
+    ConfigurableStrategy config from the searched parameters. card_values
+    holds the CARD_VALUE_RANGES cards; deviation_thresholds maps
+    DEVIATION_THRESHOLDS keys to thresholds (default deviations otherwise).
+    """
+    deviations = default_config.PLAY_DEVIATIONS
+    if deviation_thresholds is not None:
+        deviations = {name: dict(deviation) for name, deviation in deviations.items()}
+        for key, threshold in deviation_thresholds.items():
+            for name in DEVIATION_PLAYS[key]:
+                deviations[name]['count_threshold'] = threshold
     
     return {
-        'roi': roi,
-        'win_rate': win_rate,
-        'hands_played': stats['hands'],
-        'final_bankroll': current_bankroll
+        'counting': {
+            'card_values': {
+                'TWO': 0,
+                'THREE': card_values['THREE'],
+                'FOUR': card_values['FOUR'],
+                'FIVE': card_values['FIVE'],
+                'SIX': card_values['SIX'],
+                'SEVEN': 0,
+                'EIGHT': card_values['EIGHT'],
+                'NINE': card_values['NINE'],
+                'TEN': -3,
+                'JACK': -3,
+                'QUEEN': -3,
+                'KING': -3,
+                'ACE': -3
+            },
+            'ace_adjustment': ace_adjustment
+        },
+        'betting': {
+            'count_threshold': count_threshold,
+            'count_increment': count_increment,
+            'max_bet_units': 20
+        },
+        'deviations': deviations,
+        'insurance': default_config.INSURANCE_CONFIG
     }
 
 
 def generate_parameter_grid():
     """Generate parameter combinations to test"""
     
-    # Define search ranges
-    card_value_ranges = {
-        # Keep some fixed (2, 7 always 0)
-        'THREE': [2, 3, 4],
-        'FOUR': [3, 4, 5],
-        'FIVE': [4, 5, 6],
-        'SIX': [2, 3, 4],
-        'EIGHT': [-2, -1, 0],
-        'NINE': [-3, -2, -1],
-        # High cards fixed at -3
-    }
-    
-    ace_adjustments = [3, 4, 5]
-    
-    betting_thresholds = [3, 4, 5, 6]
-    betting_increments = [3, 5, 7]
-    
-    deviation_thresholds = {
-        '16_vs_10': [-1, 0, 1],
-        '12_vs_3': [3, 5, 7],
-        '12_vs_2': [8, 10, 12],
-        '13_vs_2': [-7, -5, -3],
-        '13_vs_3': [-12, -10, -8],
-        '11_vs_56': [8, 10, 12],
-        '88_vs_10': [-1, 0, 1]
-    }
-    
     for params in itertools.product(
-        *card_value_ranges.values(),
-        ace_adjustments,
-        betting_thresholds,
-        betting_increments
+        *CARD_VALUE_RANGES.values(),
+        ACE_ADJUSTMENTS,
+        BETTING_THRESHOLDS,
+        BETTING_INCREMENTS
     ):
         # Unpack parameters
         three_val, four_val, five_val, six_val, eight_val, nine_val = params[:6]
         ace_adj, bet_thresh, bet_incr = params[6:]
         
-        # Build config
-        config = {
-            'counting': {
-                'card_values': {
-                    'TWO': 0,
-                    'THREE': three_val,
-                    'FOUR': four_val,
-                    'FIVE': five_val,
-                    'SIX': six_val,
-                    'SEVEN': 0,
-                    'EIGHT': eight_val,
-                    'NINE': nine_val,
-                    'TEN': -3,
-                    'JACK': -3,
-                    'QUEEN': -3,
-                    'KING': -3,
-                    'ACE': -3
-                },
-                'ace_adjustment': ace_adj
-            },
-            'betting': {
-                'count_threshold': bet_thresh,
-                'count_increment': bet_incr,
-                'max_bet_units': 20
-            },
-            'deviations': default_config.PLAY_DEVIATIONS,  # Keep deviations fixed for now
-            'insurance': default_config.INSURANCE_CONFIG
-        }
+        card_values = {'THREE': three_val, 'FOUR': four_val, 'FIVE': five_val,
+                       'SIX': six_val, 'EIGHT': eight_val, 'NINE': nine_val}
+        config = build_config(card_values, ace_adj, bet_thresh, bet_incr)
         
         yield config
 
 
-def optimize_strategy(num_hands: int = 10000, max_workers: int = 4, output_dir: str = 'optimization_results'):
-    """Run grid search optimization"""
+def run_config_chunk(configs: List[Dict[str, Any]], num_hands: int,
+                     seed: SeedLike = None) -> List[Tuple[Dict[str, Any], Dict[str, float]]]:
+    """Simulate a chunk of configurations in one task, pairing each with its result"""
+    return [(config, run_simulation_with_config(config, num_hands, seed=seed)) for config in configs]
+
+
+def run_indexed_chunk(indexed_configs: List[Tuple[int, Dict[str, Any]]], num_hands: int,
+                      seed: SeedLike = None) -> List[Tuple[int, Dict[str, Any], Dict[str, float]]]:
+    """run_config_chunk for (index, config) pairs, keeping the indices"""
+    return [(index, config, run_simulation_with_config(config, num_hands, seed=seed))
+            for index, config in indexed_configs]
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Lists of up to size consecutive items, consuming items lazily"""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_bounded(executor: Executor, fn: Callable, tasks: Iterable[tuple],
+                 max_in_flight: int) -> Iterator[Any]:
+    """
+    Yield fn(*task) for each task as the results complete, submitting tasks
+    lazily so at most max_in_flight are pending at any time.
+    """
+    tasks = iter(tasks)
+    pending = set()
+    while True:
+        for task in itertools.islice(tasks, max_in_flight - len(pending)):
+            pending.add(executor.submit(fn, *task))
+        if not pending:
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def evaluate_configs(executor: Executor, indexed_configs: Iterable[Tuple[int, Dict[str, Any]]],
+                     num_hands: int, seed: SeedLike, chunk_size: int, max_in_flight: int,
+                     store: Optional[ResultStore] = None
+                     ) -> Iterator[Tuple[int, Dict[str, Any], Dict[str, float]]]:
+    """
+    Yield (index, config, result) for (index, config) pairs as results
+    complete, simulating chunks with run_indexed_chunk with at most
+    max_in_flight pending, like imap_bounded.
+    
+    With a store, results already stored under the config's result_key are
+    yielded as soon as they are looked up, without simulating, and new
+    results are stored as each chunk completes.
+    """
+    def lookups():
+        """(True, stored result) for stored configs, (False, chunk) for chunks left to simulate"""
+        chunk = []
+        for index, config in indexed_configs:
+            if store is not None:
+                result = store.get(result_key(config, num_hands, seed, SIMULATION_RULES))
+                if result is not None:
+                    yield True, (index, config, result)
+                    continue
+            chunk.append((index, config))
+            if len(chunk) == chunk_size:
+                yield False, chunk
+                chunk = []
+        if chunk:
+            yield False, chunk
+    
+    # imap_bounded, passing stored results straight through
+    items = lookups()
+    pending = set()
+    while True:
+        while len(pending) < max_in_flight:
+            item = next(items, None)
+            if item is None:
+                break
+            stored, value = item
+            if stored:
+                yield value
+            else:
+                pending.add(executor.submit(run_indexed_chunk, value, num_hands, seed))
+        if not pending:
+            return
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            chunk_results = future.result()
+            if store is not None:
+                store.put_many((result_key(config, num_hands, seed, SIMULATION_RULES), config, num_hands, result)
+                               for _, config, result in chunk_results)
+            yield from chunk_results
+
+
+class TopK:
+    """
+    The k largest-ROI results seen, kept in a min-heap. Ties go to the
+    smaller order (insertion order unless given), so configs are never
+    compared and the result does not depend on completion order.
+    """
+    
+    def __init__(self, k: int):
+        self.k = k
+        self._heap = []
+        self._counter = itertools.count()
+    
+    def push(self, roi: float, entry: Dict[str, Any], order: Optional[int] = None):
+        if order is None:
+            order = next(self._counter)
+        item = (roi, -order, entry)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, item)
+    
+    def results(self) -> List[Dict[str, Any]]:
+        """Kept entries, best first"""
+        return [entry for _, _, entry in sorted(self._heap, key=lambda item: (-item[0], -item[1]))]
+
+
+def optimize_strategy(num_hands: int = 10000, max_workers: int = 4, output_dir: str = 'optimization_results',
+                      seed: SeedLike = None, top_k: int = 10, chunk_size: int = 16,
+                      configs: Optional[Iterable[Dict[str, Any]]] = None,
+                      store: Optional[ResultStore] = None):
+    """
+    Run grid search optimization.
+    
+    Every configuration plays the same shoes (one stream spawned from seed),
+    so differences in ROI come from the parameters rather than the cards.
+    
+    The grid (generate_parameter_grid() unless configs is given) is read
+    lazily and sent to the workers in chunks of chunk_size, with at most two
+    chunks per worker in flight. Every result is written to the CSV and only
+    the top_k are kept in memory, so grid size does not bound memory use.
+    
+    With a store, configurations already evaluated with the same seed are
+    read back instead of simulated (see evaluate_configs), so rerunning an
+    interrupted search with the same seed resumes it.
+    """
     
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
@@ -191,7 +312,7 @@ def optimize_strategy(num_hands: int = 10000, max_workers: int = 4, output_dir:
     
     best_config = None
     best_roi = float('-inf')
-    results = []
+    top = TopK(top_k)
     
     # Open CSV file for writing
     csv_file = open(csv_filename, 'w', newline='')
@@ -205,72 +326,70 @@ def optimize_strategy(num_hands: int = 10000, max_workers: int = 4, output_dir:
         'ace_adjustment', 'bet_threshold', 'bet_increment', 'max_bet_units'
     ])
     
-    # Generate all configurations
-    configs = list(generate_parameter_grid())
-    total_configs = len(configs)
-    print(f"Total configurations to test: {total_configs}")
+    # Count configurations without materializing the grid
+    if configs is None:
+        configs = generate_parameter_grid()
+        total_configs = grid_size()
+    else:
+        total_configs = len(configs) if hasattr(configs, '__len__') else None
+    print(f"Total configurations to test: {total_configs if total_configs is not None else 'unknown'}")
     
     start_time = time.time()
     completed = 0
+    shoe_seed = spawn_seeds(seed, 1)[0]
     
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_config = {
-            executor.submit(run_simulation_with_config, config, num_hands): config
-            for config in configs
-        }
-        
         # Process results as they complete
-        for future in as_completed(future_to_config):
-            config = future_to_config[future]
-            try:
-                result = future.result()
-                completed += 1
-                
-                # Track result
-                results.append({
-                    'config': config,
-                    'roi': result['roi'],
-                    'win_rate': result['win_rate'],
-                    'hands_played': result['hands_played'],
-                    'final_bankroll': result['final_bankroll']
-                })
-                
-                # Write to CSV
-                card_vals = config['counting']['card_values']
-                csv_writer.writerow([
-                    result['roi'], result['win_rate'], result['hands_played'], result['final_bankroll'],
-                    card_vals['TWO'], card_vals['THREE'], card_vals['FOUR'], card_vals['FIVE'],
-                    card_vals['SIX'], card_vals['SEVEN'], card_vals['EIGHT'], card_vals['NINE'],
-                    card_vals['TEN'], card_vals['JACK'], card_vals['QUEEN'], card_vals['KING'],
-                    card_vals['ACE'], config['counting']['ace_adjustment'],
-                    config['betting']['count_threshold'], config['betting']['count_increment'],
-                    config['betting']['max_bet_units']
-                ])
-                csv_file.flush()  # Ensure data is written
-                
-                # Update best if needed
-                if result['roi'] > best_roi:
-                    best_roi = result['roi']
-                    best_config = config
-                    print(f"\nNew best! ROI: {best_roi:.4%}")
-                    print(f"Card values: THREE={config['counting']['card_values']['THREE']}, "
-                          f"FOUR={config['counting']['card_values']['FOUR']}, "
-                          f"FIVE={config['counting']['card_values']['FIVE']}")
-                    print(f"Betting: threshold={config['betting']['count_threshold']}, "
-                          f"increment={config['betting']['count_increment']}")
-                
-                # Progress update
-                if completed % 10 == 0:
-                    elapsed = time.time() - start_time
-                    rate = completed / elapsed
+        for index, config, result in evaluate_configs(executor, enumerate(configs), num_hands, shoe_seed,
+                                                      chunk_size, 2 * max_workers, store):
+            completed += 1
+            
+            # Track result
+            top.push(result['roi'], {
+                'config': config,
+                'roi': result['roi'],
+                'win_rate': result['win_rate'],
+                'hands_played': result['hands_played'],
+                'final_bankroll': result['final_bankroll']
+            }, index)
+            
+            # Write to CSV
+            card_vals = config['counting']['card_values']
+            csv_writer.writerow([
+                result['roi'], result['win_rate'], result['hands_played'], result['final_bankroll'],
+                card_vals['TWO'], card_vals['THREE'], card_vals['FOUR'], card_vals['FIVE'],
+                card_vals['SIX'], card_vals['SEVEN'], card_vals['EIGHT'], card_vals['NINE'],
+                card_vals['TEN'], card_vals['JACK'], card_vals['QUEEN'], card_vals['KING'],
+                card_vals['ACE'], config['counting']['ace_adjustment'],
+                config['betting']['count_threshold'], config['betting']['count_increment'],
+                config['betting']['max_bet_units']
+            ])
+            
+            # Update best if needed
+            if result['roi'] > best_roi:
+                best_roi = result['roi']
+                best_config = config
+                print(f"\nNew best! ROI: {best_roi:.4%}")
+                print(f"Card values: THREE={config['counting']['card_values']['THREE']}, "
+                      f"FOUR={config['counting']['card_values']['FOUR']}, "
+                      f"FIVE={config['counting']['card_values']['FIVE']}")
+                print(f"Betting: threshold={config['betting']['count_threshold']}, "
+                      f"increment={config['betting']['count_increment']}")
+            
+            # Progress update
+            if completed % 10 == 0:
+                elapsed = time.time() - start_time
+                rate = completed / elapsed
+                if total_configs is not None:
                     eta = (total_configs - completed) / rate
                     print(f"\rProgress: {completed}/{total_configs} "
                           f"({completed/total_configs:.1%}) "
                           f"ETA: {eta/60:.1f} min", end='', flush=True)
-                    
-            except Exception as e:
-                print(f"\nError with config: {e}")
+                else:
+                    print(f"\rProgress: {completed} ({rate:.1f}/s)", end='', flush=True)
+            
+            if completed % chunk_size == 0:
+                csv_file.flush()  # Ensure data is written
     
     # Close CSV file
     csv_file.close()
@@ -279,27 +398,316 @@ def optimize_strategy(num_hands: int = 10000, max_workers: int = 4, output_dir:
     print(f"Total time: {(time.time() - start_time)/60:.1f} minutes")
     print(f"Results saved to: {csv_filename}")
     
-    # Sort results by ROI
-    results.sort(key=lambda x: x['roi'], reverse=True)
+    # Best results first (ties go to the earlier config whatever the completion order)
+    results = top.results()
+    if results:
+        best_config = results[0]['config']
     
     # Print top 5
     print("\nTop 5 configurations:")
     for i, result in enumerate(results[:5]):
         print(f"\n{i+1}. ROI: {result['roi']:.4%}, Win Rate: {result['win_rate']:.2%}")
-        cfg = result['config']
-        print(f"   Cards: 3={cfg['counting']['card_values']['THREE']}, "
-              f"4={cfg['counting']['card_values']['FOUR']}, "
-              f"5={cfg['counting']['card_values']['FIVE']}, "
-              f"6={cfg['counting']['card_values']['SIX']}, "
-              f"8={cfg['counting']['card_values']['EIGHT']}, "
-              f"9={cfg['counting']['card_values']['NINE']}")
-        print(f"   Ace adj: {cfg['counting']['ace_adjustment']}")
-        print(f"   Betting: threshold={cfg['betting']['count_threshold']}, "
-              f"increment={cfg['betting']['count_increment']}")
+        _print_config(result)
     
     return best_config, results, csv_filename
 
 
+def _print_config(result: Dict[str, Any]):
+    cfg = result['config']
+    card_values = cfg['counting']['card_values']
+    print(f"   Cards: 3={card_values['THREE']}, 4={card_values['FOUR']}, 5={card_values['FIVE']}, "
+          f"6={card_values['SIX']}, 8={card_values['EIGHT']}, 9={card_values['NINE']}")
+    print(f"   Ace adj: {cfg['counting']['ace_adjustment']}")
+    print(f"   Betting: threshold={cfg['betting']['count_threshold']}, "
+          f"increment={cfg['betting']['count_increment']}")
+    if cfg['deviations'] != default_config.PLAY_DEVIATIONS:
+        print("   Deviations: " + ", ".join(f"{name}={deviation['count_threshold']}"
+                                            for name, deviation in cfg['deviations'].items()))
+
+
+def successive_halving(min_hands: int = 1000, max_hands: int = 100000, eta: int = 3,
+                       max_workers: int = 4, seed: SeedLike = None, chunk_size: int = 16,
+                       configs: Optional[Iterable[Dict[str, Any]]] = None,
+                       store: Optional[ResultStore] = None):
+    """
+    Race configurations by successive halving.
+    
+    Every configuration plays min_hands; the best 1/eta (by ROI) advance and
+    play eta times as many hands, and so on until one remains or the next
+    budget would exceed max_hands. All configurations in all rounds play
+    the same shoes (common random numbers, one stream spawned from seed),
+    so each cut compares configurations on identical cards, and a longer
+    round replays the shorter one's shoes before extending them.
+    
+    The first round streams the grid like optimize_strategy and keeps only
+    its survivors. Results are read from and written to store like
+    optimize_strategy's. Returns (best config, last round's results best
+    first, per-round summaries).
+    """
+    if eta < 2:
+        raise ValueError("eta must be at least 2")
+    
+    if configs is None:
+        configs = generate_parameter_grid()
+        num_configs = grid_size()
+    else:
+        configs = list(configs)
+        num_configs = len(configs)
+    
+    shoe_seed = spawn_seeds(seed, 1)[0]
+    hands = min_hands
+    rounds = []
+    start_time = time.time()
+    print(f"Successive halving over {num_configs} configurations, eta={eta}")
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # Keep the survivors of this round (everything in the final round)
+            last_round = num_configs <= 1 or hands * eta > max_hands
+            keep = num_configs if last_round else max(1, -(-num_configs // eta))
+            top = TopK(keep)
+            
+            for index, config, result in evaluate_configs(executor, enumerate(configs), hands, shoe_seed,
+                                                          chunk_size, 2 * max_workers, store):
+                top.push(result['roi'], {
+                    'config': config,
+                    'roi': result['roi'],
+                    'win_rate': result['win_rate'],
+                    'hands_played': result['hands_played'],
+                    'final_bankroll': result['final_bankroll']
+                }, index)
+            
+            results = top.results()
+            best_roi = results[0]['roi'] if results else None
+            rounds.append({'hands': hands, 'configs': num_configs, 'kept': keep, 'best_roi': best_roi})
+            best = f"{best_roi:.4%}" if best_roi is not None else "n/a"
+            print(f"Round {len(rounds)}: {num_configs} configs x {hands:,} hands, "
+                  f"kept {keep} (best ROI {best}, "
+                  f"{(time.time() - start_time)/60:.1f} min)")
+            if last_round or not results:
+                break
+            configs = [result['config'] for result in results]
+            num_configs = keep
+            hands *= eta
+    
+    print("\nTop configurations:")
+    for i, result in enumerate(results[:5]):
+        print(f"\n{i+1}. ROI: {result['roi']:.4%}, Win Rate: {result['win_rate']:.2%}")
+        _print_config(result)
+    
+    best_config = results[0]['config'] if results else None
+    return best_config, results, rounds
+
+
+class ConfigSpace:
+    """
+    The integer parameters model_based_search varies, mapped to the unit
+    cube: the CARD_VALUE_RANGES card values, ace adjustment, betting
+    threshold and increment, and the DEVIATION_THRESHOLDS thresholds, each
+    anywhere from the lowest to the highest value the grid lists for it.
+    """
+    
+    def __init__(self):
+        ranges = [*CARD_VALUE_RANGES.values(), ACE_ADJUSTMENTS, BETTING_THRESHOLDS,
+                  BETTING_INCREMENTS, *DEVIATION_THRESHOLDS.values()]
+        self.names = [*CARD_VALUE_RANGES, 'ace_adjustment', 'count_threshold',
+                      'count_increment', *DEVIATION_THRESHOLDS]
+        self.low = np.array([min(values) for values in ranges], dtype=np.float64)
+        self.high = np.array([max(values) for values in ranges], dtype=np.float64)
+        self.dimensions = len(ranges)
+    
+    def values(self, points: np.ndarray) -> np.ndarray:
+        """Integer parameter values of unit-cube points"""
+        return np.rint(self.low + np.clip(points, 0.0, 1.0) * (self.high - self.low)).astype(int)
+    
+    def snap(self, points: np.ndarray) -> np.ndarray:
+        """Points moved onto the integer grid"""
+        return (self.values(points) - self.low) / (self.high - self.low)
+    
+    def key(self, point: np.ndarray) -> tuple:
+        return tuple(self.values(point).tolist())
+    
+    def to_config(self, point: np.ndarray) -> Dict[str, Any]:
+        params = dict(zip(self.names, self.values(point).tolist()))
+        card_values = {name: params[name] for name in CARD_VALUE_RANGES}
+        deviation_thresholds = {key: params[key] for key in DEVIATION_THRESHOLDS}
+        return build_config(card_values, params['ace_adjustment'], params['count_threshold'],
+                            params['count_increment'], deviation_thresholds)
+    
+    def from_config(self, config: Dict[str, Any]) -> np.ndarray:
+        """Unit-cube point of config (clipped to the search ranges)"""
+        card_values = config['counting']['card_values']
+        deviations = config['deviations']
+        values = [card_values[name] for name in CARD_VALUE_RANGES]
+        values += [config['counting']['ace_adjustment'], config['betting']['count_threshold'],
+                   config['betting']['count_increment']]
+        values += [deviations[DEVIATION_PLAYS[key][0]]['count_threshold'] for key in DEVIATION_THRESHOLDS]
+        return np.clip((np.array(values, dtype=np.float64) - self.low) / (self.high - self.low), 0.0, 1.0)
+    
+    def candidates(self, rng: np.random.Generator, count: int, centers: np.ndarray,
+                   spread: float = 0.15) -> np.ndarray:
+        """count uniform points plus as many scattered around centers, snapped"""
+        uniform = rng.random((count, self.dimensions))
+        local = centers[rng.integers(len(centers), size=count)]
+        local = local + rng.normal(0.0, spread, size=local.shape)
+        return self.snap(np.vstack([uniform, local]))
+
+
+def model_based_search(num_hands: int = 10000, budget: int = 200, batch_size: int = 8,
+                       initial: Optional[int] = None, max_workers: int = 4, seed: SeedLike = None,
+                       top_k: int = 10, num_candidates: int = 2048,
+                       store: Optional[ResultStore] = None):
+    """
+    Bayesian optimization over ConfigSpace, deviations included.
+    
+    The search starts from the default strategy and initial random
+    configurations (2 * batch_size by default), then repeatedly fits a
+    Gaussian-process surrogate to the ROIs seen so far and evaluates the
+    batch_size configurations with the highest expected improvement
+    (surrogate.propose_batch) in parallel, until budget configurations have
+    been simulated. Candidates are random configurations and perturbations
+    of the best ones found. All simulations play the same shoes (common
+    random numbers), as in the grid search, and configurations found in
+    store are not simulated again. The search itself is seeded too, so a
+    rerun with the same seed proposes the same batches and replays an
+    interrupted run from the store.
+    
+    Returns (best config, top_k results best first, per-batch summaries).
+    """
+    space = ConfigSpace()
+    shoe_seed, search_seed = spawn_seeds(seed, 2)
+    rng = np.random.default_rng(search_seed)
+    if initial is None:
+        initial = 2 * batch_size
+    
+    # Start from the default strategy and distinct random configurations
+    start = np.vstack([space.from_config(ConfigurableStrategy().config),
+                       space.snap(rng.random((max(initial, 1) - 1, space.dimensions)))])
+    batch = np.array(list({space.key(point): point for point in start}.values()))[:budget]
+    points, rois = [], []
+    top = TopK(top_k)
+    history = []
+    start_time = time.time()
+    print(f"Model-based search over {space.dimensions} parameters, "
+          f"{budget} configurations in batches of {batch_size}")
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while len(batch):
+            configs = [space.to_config(point) for point in batch]
+            batch_rois = [0.0] * len(batch)
+            for index, config, result in evaluate_configs(executor, enumerate(configs, len(points)), num_hands,
+                                                          shoe_seed, 1, 2 * max_workers, store):
+                batch_rois[index - len(points)] = result['roi']
+                top.push(result['roi'], {
+                    'config': config,
+                    'roi': result['roi'],
+                    'win_rate': result['win_rate'],
+                    'hands_played': result['hands_played'],
+                    'final_bankroll': result['final_bankroll']
+                }, index)
+            
+            points.extend(batch)
+            rois.extend(batch_rois)
+            history.append({'evaluations': len(points), 'batch_best_roi': max(batch_rois),
+                            'best_roi': max(rois)})
+            print(f"Batch {len(history)}: {len(points)}/{budget} configs, "
+                  f"batch best ROI {max(batch_rois):.4%}, best ROI {max(rois):.4%} "
+                  f"({(time.time() - start_time)/60:.1f} min)")
+            
+            remaining = budget - len(points)
+            if remaining <= 0:
+                break
+            best_points = np.array(points)[np.argsort(rois)[::-1][:5]]
+            batch = propose_batch(np.array(points), np.array(rois),
+                                  space.candidates(rng, num_candidates, best_points),
+                                  min(batch_size, remaining), key=space.key)
+    
+    results = top.results()
+    print("\nTop configurations:")
+    for i, result in enumerate(results[:5]):
+        print(f"\n{i+1}. ROI: {result['roi']:.4%}, Win Rate: {result['win_rate']:.2%}")
+        _print_config(result)
+    
+    best_config = results[0]['config'] if results else None
+    return best_config, results, history
+
+
+def recount_search(num_hands: int = 10000, max_workers: int = 4, seed: SeedLike = None,
+                   top_k: int = 10, block_size: int = 256,
+                   configs: Optional[Iterable[Dict[str, Any]]] = None,
+                   recording_config: Optional[Dict[str, Any]] = None,
+                   store: Optional[ResultStore] = None):
+    """
+    Screen counting systems and betting ramps by recounting one recorded
+    simulation (card_tape), then confirm the best by full simulation.
+    
+    The recording plays the grid's shoes (the same stream spawned from seed
+    as optimize_strategy) with recording_config, the default strategy
+    unless given, so its play fixes the cards of every round. Every config
+    (generate_parameter_grid() unless configs is given) is scored on that
+    tape block_size at a time, and the top_k are then simulated in full,
+    which also accounts for the playing deviations their counts trigger.
+    
+    Returns (best config, confirmed results best first, each with its
+    'recount_roi').
+    """
+    if configs is None:
+        configs = generate_parameter_grid()
+    if recording_config is None:
+        recording_config = ConfigurableStrategy().config
+    shoe_seed = spawn_seeds(seed, 1)[0]
+    start_time = time.time()
+    
+    # Record the cards and outcomes once, with a bankroll that never limits play
+    card_tape = CardTape(CountingStrategyPlayer(ConfigurableStrategy(recording_config,
+                                                                     SIMULATION_RULES['num_decks'])))
+    outcome_tape = OutcomeTape()
+    run_strategy_simulation(card_tape, num_hands, num_decks=SIMULATION_RULES['num_decks'],
+                            penetration=SIMULATION_RULES['penetration'],
+                            min_bet=SIMULATION_RULES['min_bet'], bankroll=1e12,
+                            seed=shoe_seed, tape=outcome_tape)
+    print(f"Recorded {len(outcome_tape):,} rounds in {time.time() - start_time:.1f}s")
+    
+    screened = TopK(top_k)
+    recounted = 0
+    for index, block in enumerate(chunked(configs, block_size)):
+        for offset, (config, result) in enumerate(zip(block, recount(
+                card_tape, outcome_tape, block, SIMULATION_RULES['num_decks'],
+                SIMULATION_RULES['min_bet'], SIMULATION_RULES['bankroll'], block_size))):
+            screened.push(result['roi'], {'config': config, 'recount_roi': result['roi']},
+                          index * block_size + offset)
+        recounted += len(block)
+        print(f"\rRecounted: {recounted:,} ({recounted / (time.time() - start_time):.0f}/s)",
+              end='', flush=True)
+    print()
+    
+    candidates = screened.results()
+    top = TopK(top_k)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        indexed_configs = [(i, candidate['config']) for i, candidate in enumerate(candidates)]
+        for index, config, result in evaluate_configs(executor, indexed_configs, num_hands, shoe_seed,
+                                                      1, 2 * max_workers, store):
+            top.push(result['roi'], {
+                'config': config,
+                'roi': result['roi'],
+                'recount_roi': candidates[index]['recount_roi'],
+                'win_rate': result['win_rate'],
+                'hands_played': result['hands_played'],
+                'final_bankroll': result['final_bankroll']
+            }, index)
+    
+    results = top.results()
+    print(f"Recount search complete in {(time.time() - start_time)/60:.1f} minutes")
+    print("\nTop configurations:")
+    for i, result in enumerate(results[:5]):
+        print(f"\n{i+1}. ROI: {result['roi']:.4%} (recount {result['recount_roi']:.4%}), "
+              f"Win Rate: {result['win_rate']:.2%}")
+        _print_config(result)
+    
+    best_config = results[0]['config'] if results else None
+    return best_config, results
+
+
 def main():
     parser = argparse.ArgumentParser(description='Optimize blackjack strategy parameters')
     parser.add_argument('--hands', type=int, default=10000,
@@ -310,6 +718,30 @@ def main():
                         help='Save results to JSON file')
     parser.add_argument('--quick', action='store_true',
                         help='Quick test with fewer parameters')
+    parser.add_argument('--seed', type=int,
+                        help='Random seed for reproducible shoes')
+    parser.add_argument('--top-k', type=int, default=10,
+                        help='Best configurations to keep (default: 10)')
+    parser.add_argument('--chunk-size', type=int, default=16,
+                        help='Configurations per worker task (default: 16)')
+    parser.add_argument('--halving', action='store_true',
+                        help='Race configurations by successive halving, up to --hands hands')
+    parser.add_argument('--min-hands', type=int, default=1000,
+                        help='Hands per configuration in the first halving round (default: 1,000)')
+    parser.add_argument('--eta', type=int, default=3,
+                        help='Halving rate: keep 1/eta and multiply hands by eta (default: 3)')
+    parser.add_argument('--model', action='store_true',
+                        help='Bayesian optimization over all parameters, deviations included')
+    parser.add_argument('--budget', type=int, default=200,
+                        help='Configurations the model-based search simulates (default: 200)')
+    parser.add_argument('--batch-size', type=int, default=8,
+                        help='Configurations per model-based batch (default: 8)')
+    parser.add_argument('--recount', action='store_true',
+                        help='Screen the grid by recounting one recorded simulation, then confirm the top-k')
+    parser.add_argument('--store', type=str, default=os.path.join('optimization_results', 'results.sqlite'),
+                        help='Result store shared by runs (default: optimization_results/results.sqlite)')
+    parser.add_argument('--no-store', action='store_true',
+                        help='Simulate every configuration without the result store')
     
     args = parser.parse_args()
     
@@ -318,9 +750,37 @@ def main():
         print("Running quick test with limited parameter space...")
         args.hands = 1000
     
-    best_config, results, csv_file = optimize_strategy(args.hands, args.workers)
+    store = None
+    if not args.no_store:
+        if args.seed is None:
+            # Stored results are only found again under the same seed
+            args.seed = np.random.SeedSequence().entropy
+            print(f"Seed: {args.seed} (pass --seed {args.seed} to resume this run)")
+        os.makedirs(os.path.dirname(args.store) or '.', exist_ok=True)
+        store = ResultStore(args.store)
+        print(f"Result store: {args.store} ({len(store)} results)")
+    
+    if args.model:
+        best_config, results, _ = model_based_search(args.hands, args.budget, args.batch_size,
+                                                     max_workers=args.workers, seed=args.seed,
+                                                     top_k=args.top_k, store=store)
+    elif args.recount:
+        best_config, results = recount_search(args.hands, args.workers, seed=args.seed,
+                                              top_k=args.top_k, store=store)
+    elif args.halving:
+        best_config, results, _ = successive_halving(args.min_hands, args.hands, args.eta, args.workers,
+                                                     seed=args.seed, chunk_size=args.chunk_size,
+                                                     store=store)
+    else:
+        best_config, results, csv_file = optimize_strategy(args.hands, args.workers, seed=args.seed,
+                                                           top_k=args.top_k, chunk_size=args.chunk_size,
+                                                           store=store)
+    if store is not None:
+        store.close()
     
-    if args.output:
+    if not results:
+        print("\nNo configurations were evaluated")
+    elif args.output:
         with open(args.output, 'w') as f:
             json.dump({
                 'best_config': best_config,
@@ -0,0 +1,226 @@
+"""
+Outcome tapes: per-round results recorded once and replayed under any bet sizing.
+
+Playing decisions here do not depend on the bet, so a simulation played at
+a flat bet (with a bankroll large enough never to limit doubles or splits)
+fixes everything about each round except its size. The tape keeps, per
+round, the true count when the bet was placed and the net result per unit
+bet; a betting system is then evaluated by computing its bets over the
+whole tape with NumPy and laying bet * unit_net onto the bankroll path,
+without dealing a single card.
+
+Replayed nets are exact for the recorded bet and its even multiples; other
+bets can differ by the integer rounding of 3:2 and surrender payouts unless
+the hand records are replayed too.
+
+Betting systems that react to single hands (Martingale, Reverse
+Martingale, 1-3-2-6) also need the result and payout of every hand, which
+the tape keeps as a second array of hand records; those systems are
+replayed round by round through a BettingSystem, fed the same hand results
+as in the simulator.
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+import numpy as np
+from strategy import BettingStrategy, BettingSystem
+from running_stats import RunningStats
+from round_engine import RESULT_NAMES
+
+
+# One fixed-size record per round
+TAPE_DTYPE = np.dtype([
+    ('true_count', np.float32),  # True count when the bet was placed
+    ('unit_net', np.float32),    # Net result of the round per unit bet
+    ('hands', np.uint8),         # Hands played (1 + splits)
+    ('splits', np.uint8),
+    ('doubles', np.uint8),
+])
+
+# One record per hand, in deal order ('hands' records per round)
+HAND_DTYPE = np.dtype([
+    ('result', np.uint8),         # round_engine result code
+    ('unit_payout', np.float32),  # Payout of the hand per unit of the round's bet
+])
+
+
+class OutcomeTape:
+    """Recorder for per-round outcomes, converted to a TAPE_DTYPE array on demand"""
+    
+    def __init__(self):
+        self._rows = []
+        self._hand_rows = []
+    
+    def record(self, true_count: float, unit_net: float, hands: int = 1,
+               splits: int = 0, doubles: int = 0,
+               hand_results: Iterable[Tuple[int, float]] = ()):
+        """Append one round and the (result code, unit payout) of each of its hands"""
+        self._rows.append((true_count, unit_net, hands, splits, doubles))
+        self._hand_rows.extend(hand_results)
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def to_array(self) -> np.ndarray:
+        return np.array(self._rows, dtype=TAPE_DTYPE)
+    
+    def hands_array(self) -> np.ndarray:
+        """The hand records as a HAND_DTYPE array"""
+        return np.array(self._hand_rows, dtype=HAND_DTYPE)
+    
+    def save(self, path: str):
+        """Write the tape as raw fixed-size records, and its hand records to path.hands"""
+        self.to_array().tofile(path)
+        self.hands_array().tofile(f'{path}.hands')
+    
+    @staticmethod
+    def load(path: str) -> np.ndarray:
+        """Read a tape written by save()"""
+        return np.fromfile(path, dtype=TAPE_DTYPE)
+    
+    @staticmethod
+    def load_hands(path: str) -> np.ndarray:
+        """Read the hand records of a tape written by save()"""
+        return np.fromfile(f'{path}.hands', dtype=HAND_DTYPE)
+
+
+def ramp_bets(tape: np.ndarray, betting_config: Dict[str, Any], min_bet: float = 10) -> np.ndarray:
+    """
+    Bets of a ConfigurableStrategy betting ramp over tape.
+    
+    The tape's true counts must come from the strategy's own counting
+    system (see simulation_engine.run_strategy_simulation).
+    """
+    true_count = tape['true_count'].astype(np.float64)
+    threshold = betting_config['count_threshold']
+    increment = betting_config['count_increment']
+    max_units = betting_config['max_bet_units']
+    
+    units = 1 + np.floor((true_count - threshold) / increment)
+    units = np.minimum(units, max_units)
+    return np.where(true_count < threshold, min_bet, min_bet * units)
+
+
+def replay_bets(tape: np.ndarray, bets: np.ndarray, bankroll: float = 1000,
+                min_bet: float = 10, nets: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Lay bets onto the tape's outcomes starting from bankroll. nets, if
+    given, are the exact round nets of bets (see replay_betting_strategy).
+    
+    As in the simulators, a bet is cut to the bankroll when it cannot be
+    covered and play stops once the bankroll falls below min_bet.
+    """
+    bets = np.array(bets, dtype=np.float64)
+    unit_net = tape['unit_net'].astype(np.float64)
+    nets = bets * unit_net if nets is None else np.array(nets, dtype=np.float64)
+    starting_bankroll = bankroll
+    num_rounds = len(tape)
+    start = 0
+    
+    # Each pass is exact up to the first bet the bankroll cannot cover
+    while start < num_rounds:
+        path = bankroll + np.cumsum(nets[start:])
+        before = np.empty_like(path)
+        before[0] = bankroll
+        before[1:] = path[:-1]
+        short = np.flatnonzero((before < bets[start:]) | (before < min_bet))
+        if not len(short):
+            start = num_rounds
+            break
+        first = start + int(short[0])
+        bankroll = before[short[0]]
+        if bankroll < min_bet:
+            start = first
+            break
+        bets[first] = bankroll
+        nets[first] = bankroll * unit_net[first]
+        start = first
+    
+    played = start
+    path = starting_bankroll + np.cumsum(nets[:played])
+    ending_bankroll = float(path[-1]) if played else starting_bankroll
+    total_wagered = float((bets[:played] * (tape['hands'][:played] + tape['doubles'][:played])).sum())
+    profit_loss = ending_bankroll - starting_bankroll
+    
+    unit_stats = RunningStats()
+    unit_stats.add_batch(unit_net[:played])
+    
+    return {
+        'total_hands': played,
+        'starting_bankroll': starting_bankroll,
+        'ending_bankroll': ending_bankroll,
+        'profit_loss': profit_loss,
+        'total_wagered': total_wagered,
+        'avg_bet': float(bets[:played].mean()) if played else 0,
+        'roi': (profit_loss / starting_bankroll * 100) if starting_bankroll > 0 else 0,
+        'max_bankroll': max(starting_bankroll, float(path.max())) if played else starting_bankroll,
+        'min_bankroll': min(starting_bankroll, float(path.min())) if played else starting_bankroll,
+        'bust_out': played < num_rounds,
+        'ev_per_unit': unit_stats.to_dict()
+    }
+
+
+def replay_betting_strategy(tape: np.ndarray, strategy: BettingStrategy, base_bet: int = 10,
+                            bankroll: float = 1000, min_bet: float = 5, max_bet: float = 500,
+                            hands: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Evaluate a BettingStrategy over tape, clamping bets to [min_bet, max_bet]
+    like BlackjackSimulator.
+    
+    Every system but FLAT is walked in order through a BettingSystem. Those
+    that react to hand results need the tape's hand records (hands, from
+    OutcomeTape.hands_array); Kelly only follows the count and bankroll, but
+    with hand records its odd bets are also settled exactly.
+    """
+    if strategy == BettingStrategy.FLAT:
+        bets = np.full(len(tape), float(max(min_bet, min(base_bet, max_bet))))
+        return replay_bets(tape, bets, bankroll, min_bet)
+    if hands is None and strategy != BettingStrategy.KELLY_CRITERION:
+        raise ValueError(f"Replaying {strategy.value} needs the tape's hand records")
+    
+    system = BettingSystem(strategy, base_bet, bankroll)
+    true_count = tape['true_count'].tolist()
+    unit_net = tape['unit_net'].tolist()
+    hand_counts = tape['hands'].tolist()
+    if hands is not None:
+        results = [RESULT_NAMES[code] for code in hands['result'].tolist()]
+        unit_payouts = hands['unit_payout'].tolist()
+    
+    bets = np.full(len(tape), float(min_bet))
+    nets = np.zeros(len(tape))
+    current = bankroll
+    first_hand = 0
+    for i in range(len(tape)):
+        if current < min_bet:
+            # replay_bets stops here too
+            break
+        system.bankroll = current
+        bet = max(min_bet, min(system.get_next_bet(true_count[i]), current, max_bet))
+        bets[i] = bet
+        net = bet * unit_net[i]
+        if hands is not None:
+            # The simulator updates the system after every hand of the round
+            last_hand = first_hand + hand_counts[i]
+            for j in range(first_hand, last_hand):
+                result = results[j]
+                payout = unit_payouts[j] * bet
+                # RoundEngine rounds 3:2 payouts and surrender refunds down
+                if result == 'blackjack':
+                    net += int(payout) - payout
+                    payout = int(payout)
+                elif result == 'surrender':
+                    net += bet // 2 - bet / 2
+                system.update_result(result, payout)
+            first_hand = last_hand
+        nets[i] = net
+        current += net
+    return replay_bets(tape, bets, bankroll, min_bet, nets)
+
+
+def replay_configurable(tape: np.ndarray, betting: Union[Dict[str, Any], Any],
+                        min_bet: float = 10, bankroll: float = 1000) -> Dict[str, Any]:
+    """
+    Evaluate a ConfigurableStrategy betting ramp over tape. betting is
+    either a strategy or its betting config dict.
+    """
+    betting_config = getattr(betting, 'betting_config', betting)
+    return replay_bets(tape, ramp_bets(tape, betting_config, min_bet), bankroll, min_bet)
@@ -0,0 +1,78 @@
+"""
+On-disk store of simulation results for resumable optimization runs.
+
+Every result is keyed by a stable hash of what determines it: the strategy
+config, the number of hands, the seed of the shoes and the table rules.
+The same key always replays the same simulation, so an optimizer that
+looks keys up before simulating never pays twice for a result, whether it
+was computed earlier in the run, by a run that died halfway or by an
+earlier search over overlapping configurations.
+
+Results live in a SQLite database (one row per key) and are committed
+after every batch, so at most the batch in flight is lost to a crash.
+Seeds must be reproducible for keys to match: None (fresh entropy) draws
+new shoes every time and its results are never found again.
+"""
+
+import hashlib
+import json
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Tuple
+import numpy as np
+from seeding import SeedLike
+
+
+# Bump when simulation behaviour changes so stored results are not reused
+RESULT_VERSION = 2
+
+
+def _seed_token(seed: SeedLike) -> Any:
+    if isinstance(seed, np.random.SeedSequence):
+        return {'entropy': seed.entropy, 'spawn_key': list(seed.spawn_key)}
+    return seed
+
+
+def result_key(config: Dict[str, Any], num_hands: int, seed: SeedLike,
+               rules: Dict[str, Any]) -> str:
+    """Stable hash of (config, num_hands, seed, rules)"""
+    key = json.dumps({'version': RESULT_VERSION, 'config': config, 'num_hands': num_hands,
+                      'seed': _seed_token(seed), 'rules': rules}, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ResultStore:
+    """Simulation results by result_key in a SQLite file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS results ('
+            'key TEXT PRIMARY KEY, num_hands INTEGER, config TEXT, result TEXT)'
+        )
+        self._connection.commit()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connection.execute('SELECT result FROM results WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any], int, Dict[str, Any]]]):
+        """Store (key, config, num_hands, result) entries and commit"""
+        self._connection.executemany(
+            'INSERT OR REPLACE INTO results (key, num_hands, config, result) VALUES (?, ?, ?, ?)',
+            [(key, num_hands, json.dumps(config, sort_keys=True), json.dumps(result))
+             for key, config, num_hands, result in entries]
+        )
+        self._connection.commit()
+    
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM results').fetchone()[0]
+    
+    def close(self):
+        self._connection.close()
+    
+    def __enter__(self) -> 'ResultStore':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
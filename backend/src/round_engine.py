@@ -0,0 +1,193 @@
+"""
+Headless round engine for simulations.
+
+Plays a complete round against a policy callback with the same rules as
+BlackjackGame, but without state-machine bookkeeping, per-decision action
+lists or result dicts. Outcomes are reported as integer codes and payouts
+in preallocated per-hand lists on the engine.
+"""
+
+from typing import Callable, List, Optional
+from deck import Deck
+from hand import Hand
+from card import Card
+from game import Action, DEALER_STAND_VALUE, BLACKJACK_PAYOUT
+
+
+# Per-hand result codes
+RESULT_LOSE, RESULT_PUSH, RESULT_WIN, RESULT_BLACKJACK, RESULT_SURRENDER = range(5)
+RESULT_NAMES = ('lose', 'push', 'win', 'blackjack', 'surrender')
+
+_UNLIMITED = float('inf')
+
+# policy(hand, dealer_up_card, can_double, can_split, can_surrender) -> Action
+Policy = Callable[[Hand, Card, bool, bool, bool], Action]
+
+
+class RoundEngine:
+    """Plays rounds of blackjack against a policy callback"""
+    
+    def __init__(self, deck: Deck):
+        self.deck = deck
+        self.dealer_hand = Hand()
+        self.hands: List[Hand] = [Hand()]
+        self._spare_hands: List[Hand] = []
+        
+        # Outcome of the last round, valid for the first num_hands entries
+        self.num_hands = 0
+        self.results: List[int] = [RESULT_LOSE] * 4
+        self.payouts: List[float] = [0] * 4
+        self.net = 0
+        self.total_bet = 0
+        self.splits = 0
+        self.doubles = 0
+        self.surrenders = 0
+        self.player_blackjack = False
+        self.dealer_blackjack = False
+    
+    def play_round(self, bet: float, policy: Policy, bankroll: Optional[float] = None) -> float:
+        """
+        Play one round with the given bet and return the net win/loss.
+        
+        bankroll is the money available before the bet and limits doubles
+        and splits the same way BlackjackGame does; None means unlimited.
+        Actions the policy is not allowed to take are played as HIT (for
+        DOUBLE) or STAND.
+        """
+        deal = self.deck.deal
+        dealer = self.dealer_hand
+        hands = self.hands
+        
+        # Return split hands from the previous round to the pool
+        if len(hands) > 1:
+            self._spare_hands.extend(hands[1:])
+            del hands[1:]
+        first = hands[0]
+        first.clear()
+        dealer.clear()
+        first.bet = bet
+        
+        available = (bankroll if bankroll is not None else _UNLIMITED) - bet
+        total_bet = bet
+        refunded = 0
+        self.splits = self.doubles = self.surrenders = 0
+        
+        # Deal cards (player, dealer, player, dealer)
+        first.add_card(deal())
+        dealer.add_card(deal())
+        first.add_card(deal())
+        dealer.add_card(deal())
+        
+        player_blackjack = first.is_blackjack
+        dealer_blackjack = dealer.is_blackjack
+        self.player_blackjack = player_blackjack
+        self.dealer_blackjack = dealer_blackjack
+        
+        if not dealer_blackjack:
+            if not player_blackjack:
+                up_card = dealer.cards[0]
+                index = 0
+                while index < len(hands):
+                    hand = hands[index]
+                    while True:
+                        cards = hand.cards
+                        two_cards = len(cards) == 2
+                        can_double = two_cards and not hand.has_doubled and hand.bet <= available
+                        can_split = (two_cards and not hand.is_split_hand and hand.bet <= available
+                                     and cards[0].value == cards[1].value)
+                        can_surrender = two_cards and not hand.is_split_hand
+                        
+                        action = policy(hand, up_card, can_double, can_split, can_surrender)
+                        if action is Action.DOUBLE and not can_double:
+                            action = Action.HIT
+                        
+                        if action is Action.HIT:
+                            hand.add_card(deal())
+                            if hand.value > 21:
+                                break
+                        elif action is Action.DOUBLE:
+                            available -= hand.bet
+                            total_bet += hand.bet
+                            hand.bet *= 2
+                            hand.has_doubled = True
+                            hand.add_card(deal())
+                            self.doubles += 1
+                            break
+                        elif action is Action.SPLIT and can_split:
+                            new_hand = self._spare_hands.pop() if self._spare_hands else Hand()
+                            new_hand.clear()
+                            # Neither hand can re-split, surrender or make a natural
+                            hand.is_split_hand = True
+                            new_hand.is_split_hand = True
+                            new_hand.add_card(hand.pop_card())
+                            new_hand.bet = hand.bet
+                            available -= hand.bet
+                            total_bet += hand.bet
+                            hands.insert(index + 1, new_hand)
+                            hand.add_card(deal())
+                            new_hand.add_card(deal())
+                            self.splits += 1
+                        elif action is Action.SURRENDER and can_surrender:
+                            refund = hand.bet // 2
+                            available += refund
+                            refunded += refund
+                            hand.bet = 0
+                            self.surrenders += 1
+                            break
+                        else:
+                            break
+                    index += 1
+            
+            # Dealer doesn't play if all player hands are bust, surrendered
+            # or naturals (paid before the dealer plays)
+            for hand in hands:
+                if hand.bet != 0 and hand.value <= 21 and not hand.is_blackjack:
+                    while dealer.value < DEALER_STAND_VALUE:
+                        dealer.add_card(deal())
+                    break
+        
+        # Settle every hand
+        num_hands = len(hands)
+        if num_hands > len(self.results):
+            self.results.extend([RESULT_LOSE] * num_hands)
+            self.payouts.extend([0] * num_hands)
+        results = self.results
+        payouts = self.payouts
+        
+        dealer_value = dealer.value
+        dealer_bust = dealer_value > 21
+        total_payout = 0
+        for index in range(num_hands):
+            hand = hands[index]
+            hand_bet = hand.bet
+            hand_value = hand.value
+            payout = 0
+            natural = hand.is_blackjack
+            if hand_bet == 0:
+                result = RESULT_SURRENDER
+            elif hand_value > 21:
+                result = RESULT_LOSE
+            elif natural and not dealer_blackjack:
+                result = RESULT_BLACKJACK
+                payout = int(hand_bet * BLACKJACK_PAYOUT)
+            elif dealer_bust:
+                result = RESULT_WIN
+                payout = hand_bet * 2
+            elif dealer_blackjack and not natural:
+                result = RESULT_LOSE
+            elif hand_value > dealer_value:
+                result = RESULT_WIN
+                payout = hand_bet * 2
+            elif hand_value < dealer_value:
+                result = RESULT_LOSE
+            else:
+                result = RESULT_PUSH
+                payout = hand_bet
+            results[index] = result
+            payouts[index] = payout
+            total_payout += payout
+        
+        self.num_hands = num_hands
+        self.total_bet = total_bet
+        self.net = total_payout + refunded - total_bet
+        return self.net
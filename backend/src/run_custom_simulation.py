@@ -15,6 +15,7 @@ from pathlib import Path
 import json
 
 from simulator import BlackjackSimulator
+from seeding import spawn_seeds
 from custom_strategy import CustomStrategy
 from strategy import ComputerPlayer, StrategyType, BettingStrategy
 from hand import Hand
@@ -41,7 +42,8 @@ class CustomStrategyPlayer(ComputerPlayer):
         """Use custom strategy for decisions"""
         can_double = Action.DOUBLE in valid_actions
         can_split = Action.SPLIT in valid_actions
-        return self.custom_strategy.get_action(player_hand, dealer_up_card, can_double, can_split)
+        can_surrender = Action.SURRENDER in valid_actions
+        return self.custom_strategy.get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
     
     def get_bet(self, true_count: float = 0) -> int:
         """Use custom betting strategy"""
@@ -80,6 +82,7 @@ def main():
     parser.add_argument('--decks', type=int, default=6, help='Number of decks (default: 6)')
     parser.add_argument('--output', help='Output file for detailed results (JSON)')
     parser.add_argument('--compare', action='store_true', help='Compare with basic strategy')
+    parser.add_argument('--seed', type=int, help='Random seed for reproducible shoes')
     
     args = parser.parse_args()
     
@@ -96,6 +99,9 @@ def main():
     # Create simulator
     simulator = BlackjackSimulator(num_decks=args.decks)
     
+    # The nth simulation of each strategy plays the same shoes
+    simulation_seeds = spawn_seeds(args.seed, args.simulations)
+    
     # Run simulations with custom strategy
     all_results = []
     total_profit = 0
@@ -107,7 +113,8 @@ def main():
         player = CustomStrategyPlayer(args.strategy_file, args.bankroll)
         
         # Run simulation
-        result = simulator.simulate_hands(player, args.hands, verbose=False)
+        result = simulator.simulate_hands(player, args.hands, verbose=False,
+                                          seed=simulation_seeds[i])
         all_results.append(result)
         
         total_profit += result.profit_loss
@@ -149,7 +156,8 @@ def main():
                 base_bet=25,
                 bankroll=args.bankroll
             )
-            result = simulator.simulate_hands(player, args.hands, verbose=False)
+            result = simulator.simulate_hands(player, args.hands, verbose=False,
+                                              seed=simulation_seeds[i])
             basic_results.append(result)
             basic_profit += result.profit_loss
             basic_roi += result.roi
@@ -0,0 +1,93 @@
+"""
+Streaming mean and variance accumulators for simulation results.
+
+RunningStats uses Welford's update, so adding a value is O(1) and needs no
+list of past values, and Chan's formula to merge accumulators built
+independently (e.g. by shards of one simulation).
+"""
+
+from typing import Dict, Iterable, Tuple
+import math
+import numpy as np
+
+
+# Two-sided 95% normal quantile
+Z_95 = 1.96
+
+
+class RunningStats:
+    """Count, mean and sum of squared deviations of a stream of values"""
+    
+    __slots__ = ('count', 'mean', 'm2')
+    
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+    
+    def add(self, value: float):
+        """Add one value"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+    
+    def add_batch(self, values: np.ndarray):
+        """Add an array of values at once"""
+        if len(values) == 0:
+            return
+        values = np.asarray(values, dtype=float)
+        mean = float(values.mean())
+        self.merge(RunningStats(len(values), mean, float(((values - mean) ** 2).sum())))
+    
+    def merge(self, other: 'RunningStats'):
+        """Fold another accumulator's values into this one"""
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+    
+    @classmethod
+    def combine(cls, stats: Iterable['RunningStats']) -> 'RunningStats':
+        """New accumulator holding the values of all of stats"""
+        combined = cls()
+        for item in stats:
+            combined.merge(item)
+        return combined
+    
+    @property
+    def variance(self) -> float:
+        """Sample variance (0 with fewer than two values)"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+    
+    @property
+    def std_error(self) -> float:
+        """Standard error of the mean"""
+        return math.sqrt(self.variance / self.count) if self.count > 1 else 0.0
+    
+    def confidence_interval(self, z: float = Z_95) -> Tuple[float, float]:
+        """Normal confidence interval for the mean (95% by default)"""
+        margin = z * self.std_error
+        return self.mean - margin, self.mean + margin
+    
+    def to_dict(self) -> Dict[str, float]:
+        ci_low, ci_high = self.confidence_interval()
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'variance': self.variance,
+            'std': self.std,
+            'std_error': self.std_error,
+            'ci_low': ci_low,
+            'ci_high': ci_high
+        }
@@ -0,0 +1,39 @@
+"""
+Seed handling for reproducible simulations.
+
+Every entry point takes a seed (an int, a SeedSequence or None for fresh
+OS entropy) and derives independent child streams from it with
+SeedSequence.spawn: one per worker or shard, and one per shoe inside a deck.
+The same seed therefore always replays the same shoes, however the work is
+split up.
+"""
+
+from typing import List, Optional, Union
+import numpy as np
+
+
+SeedLike = Optional[Union[int, np.random.SeedSequence]]
+
+
+def as_seed_sequence(seed: SeedLike) -> np.random.SeedSequence:
+    """
+    Fresh SeedSequence for seed.
+    
+    SeedSequences are copied rather than shared, so spawning from the result
+    never advances the caller's sequence: the same seed always yields the
+    same children.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key,
+                                      pool_size=seed.pool_size)
+    return np.random.SeedSequence(seed)
+
+
+def spawn_seeds(seed: SeedLike, count: int) -> List[np.random.SeedSequence]:
+    """Spawn count independent child seeds from seed"""
+    return as_seed_sequence(seed).spawn(count)
+
+
+def spawn_rng(seed_sequence: np.random.SeedSequence) -> np.random.Generator:
+    """Generator for the next child stream of seed_sequence"""
+    return np.random.default_rng(seed_sequence.spawn(1)[0])
@@ -7,15 +7,13 @@ import argparse
 import json
 from configurable_strategy import ConfigurableStrategy
 from simulate_dad_strategy import run_simulation, print_results
-from game import BlackjackGame, GameState, Action
-import time
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer
 
 
 def run_custom_simulation(args, config):
     """Run simulation with custom configuration"""
     
     strategy = ConfigurableStrategy(config, total_decks=args.decks)
-    game = BlackjackGame(num_decks=args.decks, shuffle_threshold=args.penetration/100)
     
     print(f"\nRunning {args.hands:,} hands simulation with custom config...")
     print(f"Decks: {args.decks}, Penetration: {args.penetration}%")
@@ -33,125 +31,10 @@ def run_custom_simulation(args, config):
           f"increment={config['betting']['count_increment']}")
     print()
     
-    # Track statistics
-    stats = {
-        'total_hands': 0,
-        'wins': 0,
-        'losses': 0,
-        'pushes': 0,
-        'blackjacks': 0,
-        'total_wagered': 0,
-        'total_won_lost': 0,
-        'bet_distribution': {}
-    }
-    
-    bankroll = args.bankroll
-    max_bankroll = bankroll
-    min_bankroll = bankroll
-    
-    start_time = time.time()
-    strategy.reset_count()
-    
-    for hand_num in range(args.hands):
-        # Check if player is bust
-        if bankroll < args.min_bet:
-            print(f"Bust out after {hand_num} hands!")
-            break
-            
-        # Check for shuffle
-        if game.deck.needs_shuffle():
-            game.deck.shuffle()
-            strategy.reset_count()
-            
-        # Get bet amount
-        bet_amount = strategy.get_bet_amount(args.min_bet)
-        bet_amount = min(bet_amount, bankroll)
-        
-        # Track bet distribution
-        bet_key = int(bet_amount / args.min_bet)
-        stats['bet_distribution'][bet_key] = stats['bet_distribution'].get(bet_key, 0) + 1
-        
-        # Start new round
-        game.player_bankroll = bankroll
-        game.place_bet(bet_amount)
-        game.deal_initial_cards()
-        
-        # Update count with dealt cards
-        for card in game.player_hands[0].cards:
-            strategy.observe_card(card)
-        strategy.observe_card(game.dealer_hand.cards[0])
-        
-        # Play the hand
-        while game.state == GameState.PLAYER_TURN:
-            current_hand = game.player_hands[game.current_hand_index]
-            dealer_up_card = game.dealer_hand.cards[0]
-            can_split = len(game.player_hands) == 1 and game.player_hands[0].can_split()
-            
-            action = strategy.get_action(current_hand, dealer_up_card, can_split)
-            result = game.player_action(action)
-            if not result:
-                break
-                
-            # Track new cards if any were dealt
-            if action in [Action.HIT, Action.DOUBLE]:
-                if game.state == GameState.PLAYER_TURN and game.current_hand_index < len(game.player_hands):
-                    new_hand = game.player_hands[game.current_hand_index]
-                    if len(new_hand.cards) > len(current_hand.cards):
-                        strategy.observe_card(new_hand.cards[-1])
-        
-        # Dealer plays
-        if game.state == GameState.DEALER_TURN:
-            dealer_start_cards = len(game.dealer_hand.cards)
-            game._play_dealer_hand()
-            for i in range(dealer_start_cards, len(game.dealer_hand.cards)):
-                strategy.observe_card(game.dealer_hand.cards[i])
-        
-        # Update stats
-        stats['total_hands'] += 1
-        stats['total_wagered'] += bet_amount * len(game.player_hands)
-        
-        # Calculate results
-        for hand_result in game.get_round_results():
-            result = hand_result['result']
-            net = hand_result['net']
-            
-            if 'win' in result.lower() or result == 'blackjack':
-                stats['wins'] += 1
-                if result == 'blackjack':
-                    stats['blackjacks'] += 1
-            elif 'lose' in result.lower() or 'bust' in result.lower():
-                stats['losses'] += 1
-            else:
-                stats['pushes'] += 1
-                
-            stats['total_won_lost'] += net
-            bankroll += net
-        
-        # Update bankroll tracking
-        max_bankroll = max(max_bankroll, bankroll)
-        min_bankroll = min(min_bankroll, bankroll)
-        
-        # Reset for next hand
-        game.reset_round()
-        
-        # Progress update
-        if hand_num > 0 and hand_num % 10000 == 0:
-            print(f"Progress: {hand_num:,} hands, bankroll: ${bankroll:,.0f}")
-    
-    # Calculate final stats
-    elapsed_time = time.time() - start_time
-    stats['final_bankroll'] = bankroll
-    stats['starting_bankroll'] = args.bankroll
-    stats['win_rate'] = stats['wins'] / stats['total_hands'] if stats['total_hands'] > 0 else 0
-    stats['loss_rate'] = stats['losses'] / stats['total_hands'] if stats['total_hands'] > 0 else 0
-    stats['push_rate'] = stats['pushes'] / stats['total_hands'] if stats['total_hands'] > 0 else 0
-    stats['avg_bet'] = stats['total_wagered'] / stats['total_hands'] if stats['total_hands'] > 0 else 0
-    stats['roi'] = stats['total_won_lost'] / stats['total_wagered'] if stats['total_wagered'] > 0 else 0
-    stats['hands_per_hour'] = (stats['total_hands'] / elapsed_time * 3600) if elapsed_time > 0 else 0
-    stats['max_bankroll'] = max_bankroll
-    stats['min_bankroll'] = min_bankroll
-    
-    return stats
+    return run_strategy_simulation(CountingStrategyPlayer(strategy), args.hands,
+                                   num_decks=args.decks, penetration=args.penetration,
+                                   min_bet=args.min_bet, bankroll=args.bankroll,
+                                   seed=args.seed, verbose=True)
 
 
 def main():
@@ -183,6 +66,8 @@ Examples:
                         help='Minimum bet amount')
     parser.add_argument('--bankroll', type=float, default=10000,
                         help='Starting bankroll')
+    parser.add_argument('--seed', type=int,
+                        help='Random seed for reproducible shoes')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Show detailed results')
     parser.add_argument('--output', '-o', type=str,
@@ -0,0 +1,287 @@
+"""
+Shared simulation loop for strategy CLIs, the optimizer and the API.
+
+Strategies subclass SimulationStrategy (bet, act, observe, reset) and
+rounds are played by the headless RoundEngine on an array-backed shoe, so
+every entry point gets the same rules, accounting and speed.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from card import Card
+from hand import Hand
+from deck import ArrayDeck
+from game import Action
+from strategy import BasicStrategy
+from strategy_table import CompiledStrategy
+from seeding import SeedLike
+from outcome_tape import OutcomeTape
+from hand_history import HandHistoryWriter
+from analytics import bet_unit_counts, unit_counts_to_distribution
+from dealer_probabilities import full_shoe, value_index
+from expected_values import best_action
+from round_engine import (RoundEngine, RESULT_LOSE, RESULT_PUSH, RESULT_WIN, RESULT_BLACKJACK)
+
+
+# Bets buffered between bincount updates of the bet distribution
+_BET_CHUNK = 65536
+
+
+class SimulationStrategy(ABC):
+    """
+    Base class for strategies driven by run_strategy_simulation.
+    
+    bet() sizes the next round, act() decides for one hand given the actions
+    currently allowed, observe() is shown every dealt card and reset() is
+    called when the shoe is reshuffled. true_count() is the count the
+    strategy bets on, recorded on outcome tapes.
+    """
+    
+    @abstractmethod
+    def bet(self, min_bet: float) -> float:
+        ...
+    
+    @abstractmethod
+    def act(self, hand: Hand, dealer_up_card: Card, can_double: bool,
+            can_split: bool, can_surrender: bool) -> Action:
+        ...
+    
+    def observe(self, card: Card):
+        pass
+    
+    def reset(self):
+        pass
+    
+    def true_count(self) -> float:
+        return 0.0
+
+
+class BasicStrategyPlayer(SimulationStrategy):
+    """
+    Basic strategy with flat minimum bets, from BasicStrategy's tables or a
+    given compiled table (e.g. strategy_generator.basic_strategy_table)
+    """
+    
+    table = BasicStrategy.compiled_table()
+    
+    def __init__(self, table: Optional[CompiledStrategy] = None):
+        if table is not None:
+            self.table = table
+    
+    def bet(self, min_bet: float) -> float:
+        return min_bet
+    
+    def act(self, hand: Hand, dealer_up_card: Card, can_double: bool,
+            can_split: bool, can_surrender: bool) -> Action:
+        return self.table.get_action(hand, dealer_up_card, can_double, can_split, can_surrender)
+
+
+class CountingStrategyPlayer(SimulationStrategy):
+    """
+    Adapter for counting strategies such as DadStrategy and ConfigurableStrategy
+    (get_bet_amount, get_action and a counting_system with count_card and reset).
+    
+    Every dealt card is counted as it is observed except the dealer's hole
+    card (the fourth card of a round), which is held back until the round is
+    over and counted before the next bet, so playing deviations never see it.
+    A reshuffle discards a held hole card along with the rest of the count.
+    """
+    
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self._get_bet = strategy.get_bet_amount
+        self._count_card = strategy.counting_system.count_card
+        self._reset_count = strategy.counting_system.reset
+        self._round_cards = 0
+        self._hole_card = None
+    
+    def _reveal_hole_card(self):
+        if self._hole_card is not None:
+            self._count_card(self._hole_card)
+            self._hole_card = None
+    
+    def bet(self, min_bet: float) -> float:
+        self._reveal_hole_card()
+        self._round_cards = 0
+        return self._get_bet(min_bet)
+    
+    def observe(self, card: Card):
+        self._round_cards += 1
+        if self._round_cards == 4:
+            self._hole_card = card
+        else:
+            self._count_card(card)
+    
+    def reset(self):
+        self._hole_card = None
+        self._reset_count()
+    
+    def true_count(self) -> float:
+        """Count the next bet is sized on (the last round's hole card included)"""
+        self._reveal_hole_card()
+        return self.strategy.counting_system.get_true_count(self.strategy.total_decks)
+    
+    def act(self, hand: Hand, dealer_up_card: Card, can_double: bool,
+            can_split: bool, can_surrender: bool) -> Action:
+        return self.strategy.get_action(hand, dealer_up_card, can_split, can_double, can_surrender)
+
+
+class PerfectPlayer(SimulationStrategy):
+    """
+    Composition-dependent perfect play with flat minimum bets: every decision
+    takes the action with the highest exact EV for the unseen cards
+    (expected_values). num_decks must match the simulated shoe.
+    
+    Dealt cards are removed from the tracked composition as they are
+    observed, except the dealer's hole card (the fourth card of a round),
+    which stays unseen until the next bet.
+    """
+    
+    def __init__(self, num_decks: int = 6):
+        self.num_decks = num_decks
+        self._round_cards = 0
+        self.reset()
+    
+    def reset(self):
+        self._composition = list(full_shoe(self.num_decks))
+        self._hole_card = None
+    
+    def bet(self, min_bet: float) -> float:
+        if self._hole_card is not None:
+            self._composition[value_index(self._hole_card)] -= 1
+            self._hole_card = None
+        self._round_cards = 0
+        return min_bet
+    
+    def observe(self, card: Card):
+        self._round_cards += 1
+        if self._round_cards == 4:
+            self._hole_card = card
+        else:
+            self._composition[value_index(card)] -= 1
+    
+    def act(self, hand: Hand, dealer_up_card: Card, can_double: bool,
+            can_split: bool, can_surrender: bool) -> Action:
+        return best_action(hand, dealer_up_card, tuple(self._composition),
+                           can_double, can_split, can_surrender)
+
+
+def run_strategy_simulation(strategy: SimulationStrategy,
+                            num_hands: int,
+                            num_decks: int = 6,
+                            penetration: float = 72,
+                            min_bet: float = 10,
+                            bankroll: float = 1000,
+                            seed: SeedLike = None,
+                            verbose: bool = False,
+                            tape: Optional[OutcomeTape] = None,
+                            history: Optional[HandHistoryWriter] = None) -> Dict[str, Any]:
+    """
+    Play up to num_hands rounds and return the statistics dict the CLIs print.
+    
+    The shoe is reshuffled once the remaining fraction falls to
+    penetration / 100, as in the original CLI loops. Play stops when the
+    bankroll drops below min_bet. Each round is appended to tape and to
+    history when they are given, with the strategy's true count at bet time.
+    """
+    deck = ArrayDeck(num_decks, penetration / 100, seed)
+    deck.add_observer(strategy.observe, strategy.reset)
+    engine = RoundEngine(deck)
+    strategy.reset()
+    
+    get_bet = strategy.bet
+    policy = strategy.act
+    play_round = engine.play_round
+    results = engine.results
+    record = tape.record if tape is not None else None
+    if history is not None:
+        policy = history.record_policy(policy)
+    
+    starting_bankroll = bankroll
+    max_bankroll = min_bankroll = bankroll
+    total_hands = wins = losses = pushes = blackjacks = surrenders = 0
+    total_wagered = 0
+    # Bets are counted by units in chunks with np.bincount
+    bets: List[float] = []
+    unit_counts = None
+    
+    start_time = time.time()
+    
+    for hand_num in range(num_hands):
+        # Check if player is bust
+        if bankroll < min_bet:
+            if verbose:
+                print(f"Bust out after {hand_num} hands!")
+            break
+        
+        # Get bet amount
+        if record is not None or history is not None:
+            true_count = strategy.true_count()
+        bet_amount = min(get_bet(min_bet), bankroll)  # Can't bet more than bankroll
+        bets.append(bet_amount)
+        if len(bets) == _BET_CHUNK:
+            unit_counts = bet_unit_counts(bets, min_bet, unit_counts)
+            bets.clear()
+        
+        net = play_round(bet_amount, policy, bankroll)
+        if record is not None:
+            record(true_count, net / bet_amount, engine.num_hands, engine.splits, engine.doubles,
+                   [(results[i], engine.payouts[i] / bet_amount) for i in range(engine.num_hands)])
+        if history is not None:
+            history.record_round(engine, bet_amount, true_count)
+        
+        total_hands += 1
+        total_wagered += engine.total_bet
+        for i in range(engine.num_hands):
+            result = results[i]
+            if result == RESULT_WIN:
+                wins += 1
+            elif result == RESULT_BLACKJACK:
+                wins += 1
+                blackjacks += 1
+            elif result == RESULT_LOSE:
+                losses += 1
+            elif result == RESULT_PUSH:
+                pushes += 1
+            else:
+                surrenders += 1
+        
+        # Update bankroll tracking
+        bankroll += net
+        if bankroll > max_bankroll:
+            max_bankroll = bankroll
+        elif bankroll < min_bankroll:
+            min_bankroll = bankroll
+        
+        # Progress update
+        if verbose and hand_num > 0 and hand_num % 10000 == 0:
+            print(f"Progress: {hand_num:,} hands, bankroll: ${bankroll:,.0f}")
+    
+    elapsed_time = time.time() - start_time
+    total_won_lost = bankroll - starting_bankroll
+    if bets:
+        unit_counts = bet_unit_counts(bets, min_bet, unit_counts)
+    bet_distribution = unit_counts_to_distribution(unit_counts) if unit_counts is not None else {}
+    
+    return {
+        'total_hands': total_hands,
+        'wins': wins,
+        'losses': losses,
+        'pushes': pushes,
+        'blackjacks': blackjacks,
+        'surrenders': surrenders,
+        'total_wagered': total_wagered,
+        'total_won_lost': total_won_lost,
+        'bet_distribution': bet_distribution,
+        'final_bankroll': bankroll,
+        'starting_bankroll': starting_bankroll,
+        'win_rate': wins / total_hands if total_hands > 0 else 0,
+        'loss_rate': losses / total_hands if total_hands > 0 else 0,
+        'push_rate': pushes / total_hands if total_hands > 0 else 0,
+        'avg_bet': total_wagered / total_hands if total_hands > 0 else 0,
+        'roi': total_won_lost / total_wagered if total_wagered > 0 else 0,
+        'hands_per_hour': (total_hands / elapsed_time * 3600) if elapsed_time > 0 else 0,
+        'max_bankroll': max_bankroll,
+        'min_bankroll': min_bankroll
+    }
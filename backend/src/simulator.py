@@ -1,13 +1,17 @@
 import time
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import numpy as np
 from concurrent.futures import ProcessPoolExecutor, as_completed
-import json
 
-from game import BlackjackGame, GameState, Action
 from strategy import ComputerPlayer, StrategyType, BettingStrategy
-from deck import Deck
+from deck import Deck, ArrayDeck, ShoeBuffer, ReplayDeck
+from seeding import SeedLike, spawn_seeds
+from running_stats import RunningStats
+from outcome_tape import OutcomeTape
+from hand_history import HandHistoryWriter
+from round_engine import (RoundEngine, RESULT_NAMES, RESULT_LOSE, RESULT_PUSH,
+                          RESULT_WIN, RESULT_BLACKJACK)
 
 
 @dataclass
@@ -28,6 +32,8 @@ class SimulationResult:
     max_bankroll: int
     min_bankroll: int
     bust_out: bool  # Did player lose all money
+    net_stats: RunningStats = field(default_factory=RunningStats)  # Net win/loss per hand
+    unit_stats: RunningStats = field(default_factory=RunningStats)  # Net per unit bet (EV)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -45,145 +51,420 @@ class SimulationResult:
             'hands_per_hour': self.hands_per_hour,
             'max_bankroll': self.max_bankroll,
             'min_bankroll': self.min_bankroll,
-            'bust_out': self.bust_out
+            'bust_out': self.bust_out,
+            'net_per_hand': self.net_stats.to_dict(),
+            'ev_per_unit': self.unit_stats.to_dict()
         }
 
 
-class BlackjackSimulator:
-    """Runs simulations of blackjack games with computer players"""
+def merge_results(results: List[SimulationResult]) -> SimulationResult:
+    """
+    Merge results of independent sessions into one.
     
-    def __init__(self, 
-                 num_decks: int = 6,
-                 shuffle_threshold: float = 0.25,
-                 min_bet: int = 5,
-                 max_bet: int = 500):
-        self.num_decks = num_decks
-        self.shuffle_threshold = shuffle_threshold
-        self.min_bet = min_bet
-        self.max_bet = max_bet
+    Sessions are laid end to end: each one's profit/loss continues from
+    where the previous one ended, so the bankroll extremes are those of the
+    combined path. All sessions must share the same starting bankroll.
+    """
+    starting_bankroll = results[0].starting_bankroll
+    offset = 0
+    max_bankroll = min_bankroll = starting_bankroll
+    for result in results:
+        max_bankroll = max(max_bankroll, result.max_bankroll + offset)
+        min_bankroll = min(min_bankroll, result.min_bankroll + offset)
+        offset += result.profit_loss
+    
+    total_hands = sum(r.total_hands for r in results)
+    total_wins = sum(r.total_wins for r in results)
+    total_losses = sum(r.total_losses for r in results)
+    total_pushes = sum(r.total_pushes for r in results)
+    total_decisions = total_wins + total_losses + total_pushes
+    
+    # Combined rate: hands over the summed per-session time
+    hours = sum(r.total_hands / r.hands_per_hour for r in results if r.hands_per_hour > 0)
+    
+    return SimulationResult(
+        total_hands=total_hands,
+        total_wins=total_wins,
+        total_losses=total_losses,
+        total_pushes=total_pushes,
+        total_blackjacks=sum(r.total_blackjacks for r in results),
+        total_surrenders=sum(r.total_surrenders for r in results),
+        starting_bankroll=starting_bankroll,
+        ending_bankroll=starting_bankroll + offset,
+        profit_loss=offset,
+        win_rate=(total_wins / total_decisions * 100) if total_decisions > 0 else 0,
+        roi=(offset / starting_bankroll * 100) if starting_bankroll > 0 else 0,
+        hands_per_hour=total_hands / hours if hours > 0 else 0,
+        max_bankroll=max_bankroll,
+        min_bankroll=min_bankroll,
+        bust_out=any(r.bust_out for r in results),
+        net_stats=RunningStats.combine(r.net_stats for r in results),
+        unit_stats=RunningStats.combine(r.unit_stats for r in results)
+    )
+
+
+def paired_difference(values: List[float], baseline: List[float]) -> Dict[str, Optional[float]]:
+    """
+    Statistics of values[i] - baseline[i] for runs paired by seed.
+    
+    variance_reduction is how many times smaller the variance of the
+    difference is than it would be for independent runs (None when the
+    paired difference has no variance).
+    """
+    values = np.asarray(values, dtype=float)
+    baseline = np.asarray(baseline, dtype=float)
+    diffs = values - baseline
+    n = len(diffs)
+    
+    mean_diff = float(diffs.mean())
+    std_diff = float(diffs.std(ddof=1)) if n > 1 else 0.0
+    std_error = std_diff / np.sqrt(n)
+    independent_variance = float(values.var(ddof=1) + baseline.var(ddof=1)) if n > 1 else 0.0
+    
+    return {
+        'mean_diff': mean_diff,
+        'std_diff': std_diff,
+        'std_error': std_error,
+        'ci_low': mean_diff - 1.96 * std_error,
+        'ci_high': mean_diff + 1.96 * std_error,
+        'variance_reduction': independent_variance / std_diff ** 2 if std_diff > 0 else None
+    }
+
+
+def _simulate_shard(settings: tuple, spec: tuple, num_hands: int,
+                    seed: np.random.SeedSequence,
+                    target_std_error: Optional[float] = None) -> SimulationResult:
+    """Process-pool worker: rebuild simulator and player from plain tuples and run a shard"""
+    num_decks, shuffle_threshold, min_bet, max_bet = settings
+    playing_strategy, betting_strategy, base_bet, bankroll = spec
+    simulator = BlackjackSimulator(num_decks, shuffle_threshold, min_bet, max_bet)
+    player = ComputerPlayer(
+        playing_strategy=StrategyType(playing_strategy),
+        betting_strategy=BettingStrategy(betting_strategy),
+        base_bet=base_bet,
+        bankroll=bankroll
+    )
+    return simulator.simulate_hands(player, num_hands, seed=seed,
+                                    target_std_error=target_std_error)
+
+
+class SimulationSession:
+    """
+    One player's run through a deck, playable in several calls to run().
+    
+    Keeps the running tallies and bankroll extremes between calls so a
+    simulation can be advanced in chunks (e.g. in lock-step with others).
+    """
+    
+    def __init__(self, simulator: 'BlackjackSimulator', player: ComputerPlayer,
+                 deck: Deck, verbose: bool = False, tape: Optional[OutcomeTape] = None,
+                 history: Optional[HandHistoryWriter] = None):
+        self.min_bet = simulator.min_bet
+        self.max_bet = simulator.max_bet
+        self.player = player
+        self.deck = deck
+        self.engine = RoundEngine(deck)
+        self.verbose = verbose
+        self.tape = tape
+        self.history = history
         
-    def simulate_hands(self,
-                      player: ComputerPlayer,
-                      num_hands: int,
-                      verbose: bool = False) -> SimulationResult:
-        """Simulate a number of hands with a computer player"""
-        
-        game = BlackjackGame(self.num_decks, self.shuffle_threshold)
-        game.min_bet = self.min_bet
-        game.max_bet = self.max_bet
-        
-        # Track statistics
-        stats = {
-            'wins': 0,
-            'losses': 0,
-            'pushes': 0,
-            'blackjacks': 0,
-            'surrenders': 0
-        }
+        # Tallies, indexed by round_engine result code
+        self.result_counts = [0] * len(RESULT_NAMES)
+        self.surrenders = 0
+        self.net_stats = RunningStats()
+        self.unit_stats = RunningStats()
+        self.hands_played = 0
+        self.elapsed_time = 0.0
+        self.finished = False
+        
+        self.starting_bankroll = player.betting_system.bankroll
+        self.max_bankroll = self.starting_bankroll
+        self.min_bankroll = self.starting_bankroll
+    
+    def run(self, num_hands: int) -> int:
+        """Play up to num_hands more hands and return how many were played"""
+        player = self.player
+        deck = self.deck
+        engine = self.engine
+        verbose = self.verbose
+        min_bet = self.min_bet
+        max_bet = self.max_bet
         
-        starting_bankroll = player.betting_system.bankroll
-        max_bankroll = starting_bankroll
-        min_bankroll = starting_bankroll
+        result_counts = self.result_counts
+        surrenders = self.surrenders
+        results = engine.results
+        payouts = engine.payouts
+        update_result = player.betting_system.update_result
+        add_net = self.net_stats.add
+        add_unit = self.unit_stats.add
+        record = self.tape.record if self.tape is not None else None
+        max_bankroll = self.max_bankroll
+        min_bankroll = self.min_bankroll
+        
+        # The policy closure reads true_count as it is updated each round
+        true_count = 0.0
+        
+        def policy(hand, dealer_up_card, can_double, can_split, can_surrender):
+            return player.choose_action(hand, dealer_up_card, can_double, can_split,
+                                        can_surrender, true_count)
+        
+        history = self.history
+        if history is not None:
+            policy = history.record_policy(policy)
         
         start_time = time.time()
+        hand_num = self.hands_played
+        last_hand = hand_num + num_hands
         
-        for hand_num in range(num_hands):
+        while hand_num < last_hand:
+            bankroll = player.betting_system.bankroll
+            
             # Check if player is bust
-            if player.betting_system.bankroll < self.min_bet:
+            if bankroll < min_bet:
                 if verbose:
                     print(f"Player bust out after {hand_num} hands")
+                self.finished = True
                 break
-                
+            
             # Get bet amount
-            true_count = game.deck.get_true_count()
+            true_count = deck.get_true_count()
             bet_amount = player.get_bet(true_count)
-            bet_amount = min(bet_amount, player.betting_system.bankroll)
-            bet_amount = max(self.min_bet, min(bet_amount, self.max_bet))
+            bet_amount = min(bet_amount, bankroll)
+            bet_amount = max(min_bet, min(bet_amount, max_bet))
             
-            # Start new round
-            game.player_bankroll = player.betting_system.bankroll
-            game.place_bet(bet_amount)
-            game.deal_initial_cards()
+            # Play the round
+            net = engine.play_round(bet_amount, policy, bankroll)
+            surrenders += engine.surrenders
+            add_net(net)
+            add_unit(net / bet_amount)
+            if record is not None:
+                record(true_count, net / bet_amount, engine.num_hands, engine.splits, engine.doubles,
+                       [(results[i], payouts[i] / bet_amount) for i in range(engine.num_hands)])
+            if history is not None:
+                history.record_round(engine, bet_amount, true_count)
             
-            # Play the hand
-            while game.state == GameState.PLAYER_TURN:
-                current_hand = game.player_hands[game.current_hand_index]
-                dealer_up_card = game.dealer_hand.cards[0]
-                valid_actions = game.get_valid_actions()
+            # Tally results by code
+            for i in range(engine.num_hands):
+                result = results[i]
+                result_counts[result] += 1
                 
-                action = player.get_action(current_hand, dealer_up_card, valid_actions, true_count)
-                game.player_action(action)
-                
-                if action == Action.SURRENDER:
-                    stats['surrenders'] += 1
+                # Update player's betting system
+                update_result(RESULT_NAMES[result], payouts[i])
             
-            # Get results
-            if game.state == GameState.ROUND_OVER:
-                results = game.get_round_results()
-                
-                for result in results:
-                    if result['result'] == 'win':
-                        stats['wins'] += 1
-                    elif result['result'] == 'lose':
-                        stats['losses'] += 1
-                    elif result['result'] == 'push':
-                        stats['pushes'] += 1
-                    elif result['result'] == 'blackjack':
-                        stats['blackjacks'] += 1
-                        stats['wins'] += 1
-                    
-                    # Update player's betting system
-                    player.betting_system.update_result(result['result'], result['payout'])
-                
-                # Update bankroll tracking
-                player.betting_system.bankroll = game.player_bankroll
-                max_bankroll = max(max_bankroll, player.betting_system.bankroll)
-                min_bankroll = min(min_bankroll, player.betting_system.bankroll)
-                
-                if verbose and hand_num % 100 == 0:
-                    print(f"Hand {hand_num}: Bankroll = ${player.betting_system.bankroll}")
+            # Update bankroll tracking
+            bankroll += net
+            player.betting_system.bankroll = bankroll
+            if bankroll > max_bankroll:
+                max_bankroll = bankroll
+            elif bankroll < min_bankroll:
+                min_bankroll = bankroll
             
-            # Reset for next round
-            game.reset_round()
+            if verbose and hand_num % 100 == 0:
+                print(f"Hand {hand_num}: Bankroll = ${bankroll}")
+            hand_num += 1
         
-        end_time = time.time()
-        elapsed_time = end_time - start_time
+        played = hand_num - self.hands_played
+        self.hands_played = hand_num
+        self.surrenders = surrenders
+        self.max_bankroll = max_bankroll
+        self.min_bankroll = min_bankroll
+        self.elapsed_time += time.time() - start_time
+        return played
+    
+    def run_to_precision(self, max_hands: int, target_std_error: float,
+                         check_every: int = 1000) -> int:
+        """
+        Play until the standard error of EV per unit bet is at most
+        target_std_error, checking every check_every hands, or until
+        max_hands more hands have been played. Returns the hands played.
+        """
+        played = 0
+        while played < max_hands and not self.finished:
+            played += self.run(min(check_every, max_hands - played))
+            stats = self.unit_stats
+            if stats.count > 1 and stats.std_error <= target_std_error:
+                break
+        return played
+    
+    def result(self) -> SimulationResult:
+        """Summarize the hands played so far"""
+        counts = self.result_counts
+        wins = counts[RESULT_WIN] + counts[RESULT_BLACKJACK]
+        losses = counts[RESULT_LOSE]
+        pushes = counts[RESULT_PUSH]
         
-        # Calculate final statistics
-        total_hands_played = hand_num + 1
+        total_hands_played = self.hands_played
+        elapsed_time = self.elapsed_time
         hands_per_hour = (total_hands_played / elapsed_time) * 3600 if elapsed_time > 0 else 0
         
-        total_decisions = stats['wins'] + stats['losses'] + stats['pushes']
-        win_rate = (stats['wins'] / total_decisions * 100) if total_decisions > 0 else 0
+        total_decisions = wins + losses + pushes
+        win_rate = (wins / total_decisions * 100) if total_decisions > 0 else 0
         
-        ending_bankroll = player.betting_system.bankroll
+        starting_bankroll = self.starting_bankroll
+        ending_bankroll = self.player.betting_system.bankroll
         profit_loss = ending_bankroll - starting_bankroll
         roi = (profit_loss / starting_bankroll * 100) if starting_bankroll > 0 else 0
         
         return SimulationResult(
             total_hands=total_hands_played,
-            total_wins=stats['wins'],
-            total_losses=stats['losses'],
-            total_pushes=stats['pushes'],
-            total_blackjacks=stats['blackjacks'],
-            total_surrenders=stats['surrenders'],
+            total_wins=wins,
+            total_losses=losses,
+            total_pushes=pushes,
+            total_blackjacks=counts[RESULT_BLACKJACK],
+            total_surrenders=self.surrenders,
             starting_bankroll=starting_bankroll,
             ending_bankroll=ending_bankroll,
             profit_loss=profit_loss,
             win_rate=win_rate,
             roi=roi,
             hands_per_hour=hands_per_hour,
-            max_bankroll=max_bankroll,
-            min_bankroll=min_bankroll,
-            bust_out=ending_bankroll < self.min_bet
+            max_bankroll=self.max_bankroll,
+            min_bankroll=self.min_bankroll,
+            bust_out=ending_bankroll < self.min_bet,
+            net_stats=RunningStats.combine([self.net_stats]),
+            unit_stats=RunningStats.combine([self.unit_stats])
         )
+
+
+class BlackjackSimulator:
+    """Runs simulations of blackjack games with computer players"""
+    
+    def __init__(self, 
+                 num_decks: int = 6,
+                 shuffle_threshold: float = 0.25,
+                 min_bet: int = 5,
+                 max_bet: int = 500):
+        self.num_decks = num_decks
+        self.shuffle_threshold = shuffle_threshold
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+    
+    def simulate_hands(self,
+                      player: ComputerPlayer,
+                      num_hands: int,
+                      verbose: bool = False,
+                      shards: int = 1,
+                      max_workers: Optional[int] = None,
+                      seed: SeedLike = None,
+                      target_std_error: Optional[float] = None,
+                      check_every: int = 1000,
+                      tape: Optional[OutcomeTape] = None,
+                      history: Optional[HandHistoryWriter] = None) -> SimulationResult:
+        """
+        Simulate a number of hands with a computer player.
+        
+        With shards > 1 the run is split into that many independent sessions
+        played across a process pool, each starting from the player's
+        bankroll with its own stream spawned from seed, and the shard
+        results are merged into one SimulationResult. Shards rebuild the
+        player from its playing and betting strategies, so only a plain
+        ComputerPlayer can be sharded.
+        
+        With target_std_error the run stops early, at a multiple of
+        check_every hands, once the standard error of EV per unit bet
+        (unit_stats) is at most target_std_error; num_hands is then the cap.
+        Shards each aim for target_std_error * sqrt(shards) so the merged
+        result reaches about the target.
+        
+        Each round is appended to tape and to history when they are given
+        (see outcome_tape and hand_history).
+        """
+        if target_std_error is not None and target_std_error <= 0:
+            raise ValueError("target_std_error must be positive")
+        if (tape is not None or history is not None) and shards > 1:
+            raise ValueError("Outcome tapes and hand histories can only be recorded with shards=1")
+        if shards > 1 and type(player) is not ComputerPlayer:
+            raise ValueError(f"Sharded runs rebuild a plain ComputerPlayer; "
+                             f"{type(player).__name__} can only be simulated with shards=1")
+        
+        if shards > 1:
+            return self._simulate_sharded(player, num_hands, shards, max_workers, seed,
+                                          target_std_error)
+        
+        session = SimulationSession(self, player, ArrayDeck(self.num_decks, self.shuffle_threshold, seed),
+                                    verbose, tape, history)
+        if target_std_error is None:
+            session.run(num_hands)
+        else:
+            session.run_to_precision(num_hands, target_std_error, check_every)
+        return session.result()
+    
+    def simulate_players(self,
+                         players: List[ComputerPlayer],
+                         num_hands: int,
+                         seed: SeedLike = None,
+                         chunk_hands: int = 256) -> List[SimulationResult]:
+        """
+        Simulate several players over one shared sequence of shoes.
+        
+        Each shoe is shuffled once and replayed to every player, so each
+        player's result is the same as simulate_hands with this seed. Players
+        advance in lock-step chunks of chunk_hands and shoes every remaining
+        player has moved past are dropped from the shared buffer.
+        """
+        source = ShoeBuffer(self.num_decks, seed)
+        sessions = [SimulationSession(self, player, ReplayDeck(source, self.shuffle_threshold))
+                    for player in players]
+        
+        hands_left = num_hands
+        while hands_left > 0:
+            active = [session for session in sessions if not session.finished]
+            if not active:
+                break
+            chunk = min(chunk_hands, hands_left)
+            for session in active:
+                session.run(chunk)
+            hands_left -= chunk
+            source.evict_before(min(session.deck.shoe_index for session in active))
+        
+        return [session.result() for session in sessions]
+    
+    def _simulate_sharded(self,
+                          player: ComputerPlayer,
+                          num_hands: int,
+                          shards: int,
+                          max_workers: Optional[int],
+                          seed: SeedLike,
+                          target_std_error: Optional[float] = None) -> SimulationResult:
+        """Run one simulation as shards across a process pool and merge them"""
+        settings = (self.num_decks, self.shuffle_threshold, self.min_bet, self.max_bet)
+        spec = (player.playing_strategy.value, player.betting_system.strategy.value,
+                player.betting_system.base_bet, player.betting_system.bankroll)
+        
+        # Spread the hands as evenly as possible over the shards
+        sizes = [num_hands // shards + (1 if i < num_hands % shards else 0) for i in range(shards)]
+        sizes = [size for size in sizes if size > 0]
+        seeds = spawn_seeds(seed, len(sizes))
+        shard_target = None if target_std_error is None else target_std_error * np.sqrt(len(sizes))
+        
+        start_time = time.time()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            shard_results = list(executor.map(_simulate_shard, [settings] * len(sizes),
+                                              [spec] * len(sizes), sizes, seeds,
+                                              [shard_target] * len(sizes)))
+        elapsed_time = time.time() - start_time
+        
+        result = merge_results(shard_results)
+        if elapsed_time > 0:
+            result.hands_per_hour = result.total_hands / elapsed_time * 3600
+        player.betting_system.bankroll = result.ending_bankroll
+        return result
     
     def compare_strategies(self,
                           num_hands: int = 10000,
                           num_simulations: int = 10,
                           starting_bankroll: int = 1000,
-                          base_bet: int = 10) -> Dict[str, Dict[str, Any]]:
-        """Run simulations comparing different strategies"""
+                          base_bet: int = 10,
+                          seed: SeedLike = None,
+                          paired: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Run simulations comparing different strategies.
+        
+        With paired=True every strategy's nth simulation plays the same
+        shoes (common random numbers), and each strategy also reports
+        'paired_vs_baseline': statistics of its per-simulation ROI minus
+        the first strategy's.
+        """
         
         strategies_to_test = [
             (StrategyType.BASIC, BettingStrategy.FLAT),
@@ -194,26 +475,38 @@ class BlackjackSimulator:
             (StrategyType.AGGRESSIVE, BettingStrategy.FLAT),
         ]
         
+        def make_player(playing_strat, betting_strat):
+            return ComputerPlayer(
+                playing_strategy=playing_strat,
+                betting_strategy=betting_strat,
+                base_bet=base_bet,
+                bankroll=starting_bankroll
+            )
+        
+        # runs[k][n] is the nth simulation of the kth strategy
+        runs: List[List[SimulationResult]] = [[] for _ in strategies_to_test]
+        if paired:
+            # Play all strategies over each simulation's shoes in one pass
+            for simulation_seed in spawn_seeds(seed, num_simulations):
+                players = [make_player(*strategy) for strategy in strategies_to_test]
+                for strategy_runs, result in zip(runs, self.simulate_players(players, num_hands,
+                                                                             seed=simulation_seed)):
+                    strategy_runs.append(result)
+        else:
+            strategy_seeds = spawn_seeds(seed, len(strategies_to_test))
+            for strategy, strategy_runs, strategy_seed in zip(strategies_to_test, runs, strategy_seeds):
+                for simulation_seed in strategy_seed.spawn(num_simulations):
+                    strategy_runs.append(self.simulate_hands(make_player(*strategy), num_hands,
+                                                             verbose=False, seed=simulation_seed))
+        
         results = {}
+        baseline_rois = None
         
-        for playing_strat, betting_strat in strategies_to_test:
+        for (playing_strat, betting_strat), strategy_results in zip(strategies_to_test, runs):
             strategy_name = f"{playing_strat.value}_{betting_strat.value}"
             print(f"\nTesting {strategy_name}...")
             
-            strategy_results = []
-            
-            # Run multiple simulations for statistical significance
-            for sim_num in range(num_simulations):
-                player = ComputerPlayer(
-                    playing_strategy=playing_strat,
-                    betting_strategy=betting_strat,
-                    base_bet=base_bet,
-                    bankroll=starting_bankroll
-                )
-                
-                result = self.simulate_hands(player, num_hands, verbose=False)
-                strategy_results.append(result)
-                
+            for sim_num, result in enumerate(strategy_results):
                 print(f"  Simulation {sim_num + 1}/{num_simulations}: "
                       f"ROI={result.roi:.2f}%, Final=${result.ending_bankroll}")
             
@@ -230,23 +523,33 @@ class BlackjackSimulator:
                 'std_roi': std_roi,
                 'avg_final_bankroll': avg_final_bankroll,
                 'bust_rate': bust_rate,
+                # Pooled over every hand of every simulation
+                'ev_per_unit': RunningStats.combine(r.unit_stats for r in strategy_results).to_dict(),
                 'simulations': [r.to_dict() for r in strategy_results]
             }
+            
+            if paired:
+                rois = [r.roi for r in strategy_results]
+                if baseline_rois is None:
+                    baseline_rois = rois
+                results[strategy_name]['paired_vs_baseline'] = paired_difference(rois, baseline_rois)
         
         return results
     
     def run_parallel_simulations(self,
                                strategy_configs: List[Dict[str, Any]],
                                num_hands: int = 10000,
-                               max_workers: Optional[int] = None) -> List[SimulationResult]:
+                               max_workers: Optional[int] = None,
+                               seed: SeedLike = None) -> List[SimulationResult]:
         """Run multiple simulations in parallel"""
         
         results = []
+        config_seeds = spawn_seeds(seed, len(strategy_configs))
         
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
             # Submit all simulations
             future_to_config = {}
-            for config in strategy_configs:
+            for config, config_seed in zip(strategy_configs, config_seeds):
                 player = ComputerPlayer(
                     playing_strategy=StrategyType(config['playing_strategy']),
                     betting_strategy=BettingStrategy(config['betting_strategy']),
@@ -254,7 +557,8 @@ class BlackjackSimulator:
                     bankroll=config.get('bankroll', 1000)
                 )
                 
-                future = executor.submit(self.simulate_hands, player, num_hands, False)
+                future = executor.submit(self.simulate_hands, player, num_hands, False,
+                                         seed=config_seed)
                 future_to_config[future] = config
             
             # Collect results as they complete
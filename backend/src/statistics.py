@@ -1,7 +1,10 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from hand import Hand
 from card import Card, Rank
 from strategy import BasicStrategy
+from game import Action
+from dealer_probabilities import Composition, final_value_probabilities, full_shoe, remove_cards
+from expected_values import action_evs
 
 
 class BlackjackStatistics:
@@ -14,6 +17,9 @@ class BlackjackStatistics:
         7: 4/52, 8: 4/52, 9: 4/52, 10: 16/52, 11: 4/52  # 11 is Ace
     }
     
+    # Shoe assumed for dealer probabilities when no composition is given
+    DEFAULT_SHOE = full_shoe(6)
+    
     @classmethod
     def calculate_bust_probability(cls, hand: Hand, remaining_cards: int = 52) -> float:
         """Calculate the probability of busting if we take one more card"""
@@ -38,69 +44,44 @@ class BlackjackStatistics:
         return bust_probability
     
     @classmethod
-    def calculate_dealer_bust_probability(cls, dealer_up_card: Card) -> float:
-        """Calculate probability of dealer busting based on up card"""
-        # These are approximate probabilities based on simulations
-        # Dealer hits on 16 and below, stands on 17 and above
-        dealer_bust_probabilities = {
-            2: 0.353,   # Dealer showing 2
-            3: 0.373,   # Dealer showing 3
-            4: 0.402,   # Dealer showing 4
-            5: 0.428,   # Dealer showing 5
-            6: 0.424,   # Dealer showing 6
-            7: 0.262,   # Dealer showing 7
-            8: 0.236,   # Dealer showing 8
-            9: 0.228,   # Dealer showing 9
-            10: 0.214,  # Dealer showing 10
-            11: 0.115   # Dealer showing Ace
-        }
-        
-        up_value = dealer_up_card.value
-        return dealer_bust_probabilities.get(up_value, 0.25)
+    def _dealer_probabilities(cls, dealer_up_card: Card, composition: Optional[Composition],
+                              no_blackjack: bool) -> Dict:
+        if composition is None:
+            composition = remove_cards(cls.DEFAULT_SHOE, [dealer_up_card])
+        return final_value_probabilities(dealer_up_card, composition, no_blackjack)
     
     @classmethod
-    def calculate_dealer_final_value_probabilities(cls, dealer_up_card: Card) -> Dict[int, float]:
+    def calculate_dealer_bust_probability(cls, dealer_up_card: Card,
+                                          composition: Optional[Composition] = None,
+                                          no_blackjack: bool = False) -> float:
+        """
+        Calculate probability of dealer busting based on up card.
+        
+        composition holds the unseen cards (see dealer_probabilities);
+        without it a fresh DEFAULT_SHOE less the up card is assumed.
+        no_blackjack conditions on the dealer not holding a natural.
+        """
+        return cls._dealer_probabilities(dealer_up_card, composition, no_blackjack)['bust']
+    
+    @classmethod
+    def calculate_dealer_final_value_probabilities(cls, dealer_up_card: Card,
+                                                   composition: Optional[Composition] = None,
+                                                   no_blackjack: bool = False) -> Dict[int, float]:
         """Calculate probability distribution of dealer's final hand value"""
-        # Simplified probabilities based on dealer up card
-        # In reality, these depend on deck composition
-        up_value = dealer_up_card.value
-        
-        # These are approximate probabilities
-        if up_value == 11:  # Ace
-            return {
-                17: 0.130, 18: 0.130, 19: 0.130, 20: 0.130, 
-                21: 0.365,  # Higher chance of 21 with Ace
-                'bust': 0.115
-            }
-        elif up_value >= 7:  # 7, 8, 9, 10
-            return {
-                17: 0.370 if up_value == 7 else 0.130,
-                18: 0.140 if up_value == 8 else 0.130,
-                19: 0.120 if up_value == 9 else 0.120,
-                20: 0.180 if up_value == 10 else 0.120,
-                21: 0.075,
-                'bust': cls.calculate_dealer_bust_probability(dealer_up_card)
-            }
-        else:  # 2-6 (dealer weak cards)
-            base_prob = 0.155
-            return {
-                17: base_prob,
-                18: base_prob,
-                19: base_prob,
-                20: base_prob,
-                21: base_prob,
-                'bust': cls.calculate_dealer_bust_probability(dealer_up_card)
-            }
+        # Exact for the composition; dealer naturals count as 21
+        return cls._dealer_probabilities(dealer_up_card, composition, no_blackjack)
     
     @classmethod
-    def calculate_win_probability(cls, player_hand: Hand, dealer_up_card: Card) -> Dict[str, float]:
-        """Calculate win/lose/push probabilities for current hand"""
+    def calculate_win_probability(cls, player_hand: Hand, dealer_up_card: Card,
+                                  composition: Optional[Composition] = None,
+                                  no_blackjack: bool = False) -> Dict[str, float]:
+        """Calculate win/lose/push probabilities for current hand if it stands"""
         player_value = player_hand.value
         
         if player_value > 21:
             return {'win': 0.0, 'lose': 1.0, 'push': 0.0}
         
-        dealer_probs = cls.calculate_dealer_final_value_probabilities(dealer_up_card)
+        dealer_probs = cls.calculate_dealer_final_value_probabilities(dealer_up_card, composition, no_blackjack)
         
         win_prob = 0.0
         lose_prob = 0.0
@@ -218,33 +199,23 @@ class BlackjackStatistics:
         return f"Basic strategy recommends: {recommended_action}"
     
     @classmethod
-    def calculate_expected_value(cls, action: str, player_hand: Hand, 
-                                dealer_up_card: Card, bet: int = 1) -> float:
-        """Calculate expected value of an action (simplified)"""
-        # This is a simplified EV calculation
-        # Real EV would require full deck composition analysis
-        
-        win_probs = cls.calculate_win_probability(player_hand, dealer_up_card)
-        
-        if action == 'stand':
-            ev = (win_probs['win'] * bet) - (win_probs['lose'] * bet)
-        elif action == 'hit':
-            # Simplified: assume hitting improves hand by average of 5
-            # and has bust probability
-            bust_prob = cls.calculate_bust_probability(player_hand)
-            if bust_prob > 0.5:
-                ev = -bet * bust_prob
-            else:
-                ev = (win_probs['win'] * bet * 0.9) - (win_probs['lose'] * bet * 1.1)
-        elif action == 'double':
-            # Double the bet, but only get one card
-            ev = 2 * ((win_probs['win'] * bet) - (win_probs['lose'] * bet)) * 0.95
-        elif action == 'split':
-            # Assume each split hand has 75% of original EV
-            ev = 1.5 * ((win_probs['win'] * bet) - (win_probs['lose'] * bet))
-        elif action == 'surrender':
-            ev = -0.5 * bet
-        else:
-            ev = 0
-        
-        return ev
\ No newline at end of file
+    def calculate_expected_value(cls, action: str, player_hand: Hand,
+                                 dealer_up_card: Card, bet: int = 1,
+                                 composition: Optional[Composition] = None) -> float:
+        """
+        Calculate expected value of an action.
+        
+        Exact for the unseen cards in composition (see expected_values);
+        without it a fresh DEFAULT_SHOE less the dealt cards is assumed.
+        """
+        if composition is None:
+            composition = remove_cards(cls.DEFAULT_SHOE, player_hand.cards + [dealer_up_card])
+        
+        try:
+            action = Action(action)
+        except ValueError:
+            return 0
+        evs = action_evs(player_hand, dealer_up_card, composition,
+                         can_double=action == Action.DOUBLE, can_split=action == Action.SPLIT,
+                         can_surrender=action == Action.SURRENDER)
+        return evs.get(action, 0) * bet
@@ -3,6 +3,7 @@ from typing import Dict, Tuple, Optional
 from hand import Hand
 from card import Card, Rank
 from game import Action
+from strategy_table import CompiledStrategy
 
 
 class StrategyType(Enum):
@@ -81,42 +82,27 @@ class BasicStrategy:
             return 'A'
         return dealer_card.value
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Subclasses that replace a table get their own compiled copy
+        if any(name in cls.__dict__ for name in ('HARD_STRATEGY', 'SOFT_STRATEGY', 'SPLIT_STRATEGY')):
+            cls._compiled_table = CompiledStrategy(cls.HARD_STRATEGY, cls.SOFT_STRATEGY, cls.SPLIT_STRATEGY)
+    
+    @classmethod
+    def compiled_table(cls) -> CompiledStrategy:
+        """Strategy tables compiled into a flat lookup table"""
+        return cls._compiled_table
+    
     @classmethod
-    def get_action(cls, player_hand: Hand, dealer_up_card: Card, can_double: bool = True, can_split: bool = True) -> Action:
+    def get_action(cls, player_hand: Hand, dealer_up_card: Card, can_double: bool = True, can_split: bool = True,
+                   can_surrender: bool = True) -> Action:
         """Get recommended action based on basic strategy"""
-        dealer_key = cls.get_dealer_up_card_key(dealer_up_card)
-        
-        # Check for splitting pairs first
-        if can_split and player_hand.can_split() and len(player_hand.cards) == 2:
-            pair_value = player_hand.cards[0].value
-            if pair_value in cls.SPLIT_STRATEGY and dealer_key in cls.SPLIT_STRATEGY[pair_value]:
-                if cls.SPLIT_STRATEGY[pair_value][dealer_key] == 'Y':
-                    return Action.SPLIT
-        
-        # Check soft hands
-        if player_hand.is_soft:
-            soft_total = player_hand.value
-            if soft_total in cls.SOFT_STRATEGY and dealer_key in cls.SOFT_STRATEGY[soft_total]:
-                action_code = cls.SOFT_STRATEGY[soft_total][dealer_key]
-            else:
-                action_code = 'S'  # Default to stand
-        else:
-            # Hard hands
-            hard_total = player_hand.value
-            if hard_total in cls.HARD_STRATEGY and dealer_key in cls.HARD_STRATEGY[hard_total]:
-                action_code = cls.HARD_STRATEGY[hard_total][dealer_key]
-            else:
-                action_code = 'S'  # Default to stand
-        
-        # Convert strategy code to Action
-        if action_code == 'H':
-            return Action.HIT
-        elif action_code == 'S':
-            return Action.STAND
-        elif action_code == 'D':
-            return Action.DOUBLE if can_double else Action.HIT
-        else:
-            return Action.STAND
+        return cls._compiled_table.get_action(player_hand, dealer_up_card, can_double, can_split, can_surrender)
+
+
+BasicStrategy._compiled_table = CompiledStrategy(
+    BasicStrategy.HARD_STRATEGY, BasicStrategy.SOFT_STRATEGY, BasicStrategy.SPLIT_STRATEGY
+)
 
 
 class BettingSystem:
@@ -209,34 +195,43 @@ class ComputerPlayer:
     def get_action(self, player_hand: Hand, dealer_up_card: Card, 
                    valid_actions: list, true_count: float = 0) -> Action:
         """Decide on action based on strategy"""
+        return self.choose_action(player_hand, dealer_up_card,
+                                  Action.DOUBLE in valid_actions,
+                                  Action.SPLIT in valid_actions,
+                                  Action.SURRENDER in valid_actions,
+                                  true_count)
+    
+    def choose_action(self, player_hand: Hand, dealer_up_card: Card,
+                      can_double: bool, can_split: bool, can_surrender: bool,
+                      true_count: float = 0) -> Action:
+        """Decide on action from allowed-action flags (no action list needed)"""
+        basic_action = self.basic_strategy.get_action(player_hand, dealer_up_card, can_double, can_split,
+                                                      can_surrender)
         
         if self.playing_strategy == StrategyType.BASIC:
             # Use basic strategy
-            can_double = Action.DOUBLE in valid_actions
-            can_split = Action.SPLIT in valid_actions
-            return self.basic_strategy.get_action(player_hand, dealer_up_card, can_double, can_split)
+            return basic_action
             
         elif self.playing_strategy == StrategyType.CONSERVATIVE:
             # More conservative: stand on 12+ vs dealer 2-6
             if player_hand.value >= 12 and dealer_up_card.value <= 6:
                 return Action.STAND
-            return self.basic_strategy.get_action(player_hand, dealer_up_card)
+            return basic_action
             
         elif self.playing_strategy == StrategyType.AGGRESSIVE:
             # More aggressive: double more often
-            if player_hand.value in [9, 10, 11] and Action.DOUBLE in valid_actions:
+            if player_hand.value in (9, 10, 11) and can_double:
                 return Action.DOUBLE
-            return self.basic_strategy.get_action(player_hand, dealer_up_card)
+            return basic_action
             
         elif self.playing_strategy == StrategyType.CARD_COUNTING:
             # Adjust strategy based on count
-            basic_action = self.basic_strategy.get_action(player_hand, dealer_up_card)
             
             # With high count, be more aggressive
             if true_count >= 3:
-                if player_hand.value == 12 and dealer_up_card.value in [2, 3]:
+                if player_hand.value == 12 and dealer_up_card.value in (2, 3):
                     return Action.STAND
-                if player_hand.value == 16 and dealer_up_card.value == 10 and Action.SURRENDER in valid_actions:
+                if player_hand.value == 16 and dealer_up_card.value == 10 and can_surrender:
                     return Action.STAND  # Don't surrender with high count
                     
             # With low count, be more conservative  
@@ -249,4 +244,4 @@ class ComputerPlayer:
             return basic_action
         
         # Default to basic strategy
-        return self.basic_strategy.get_action(player_hand, dealer_up_card)
\ No newline at end of file
+        return basic_action
@@ -0,0 +1,177 @@
+"""
+Rule-set-specific basic strategy derived by combinatorial analysis.
+
+For every dealer up card, each two-card hand is solved exactly
+(expected_values) against a full shoe less the three dealt cards, and the
+action EVs of hands with the same total are averaged, weighted by how
+likely each hand is. The best action per total gives a total-dependent
+basic strategy in the HARD/SOFT/SPLIT letter format of BasicStrategy.
+
+Generating a table takes a while, so tables are cached as JSON under
+DEFAULT_CACHE_DIR, keyed by a hash of the rule set, and later loads only
+read and compile the file.
+
+Rules the game does not vary (the dealer stands on all 17s, doubling on
+any two cards and after splits, no re-splitting or surrender after a
+split) are part of GENERATOR_VERSION, which is
+hashed with the rule set so a change to them invalidates cached tables.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+from strategy_table import CompiledStrategy, StrategyTable, DEALER_KEYS
+from dealer_probabilities import full_shoe, NUM_VALUES, ACE_INDEX, TEN_INDEX
+from expected_values import stand_ev, hit_ev, double_ev, split_ev, SURRENDER_EV
+
+
+GENERATOR_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'strategy_cache')
+
+# Hard value (aces 1) of the card at each composition index
+_HARD_VALUES = tuple(range(2, 11)) + (1,)
+
+# Composition index -> split table key (card value, aces 11)
+_PAIR_KEYS = tuple(range(2, 12))
+
+# Rows the generator fills: every total a two-card hand can make
+HARD_TOTALS = range(4, 22)
+SOFT_TOTALS = range(12, 22)
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """The rules a basic strategy is generated for"""
+    num_decks: int = 6
+    surrender: bool = False  # Late surrender of the first two cards
+
+
+def rules_hash(rules: RuleSet) -> str:
+    """Stable key of a rule set (and the generator version) for cached tables"""
+    key = json.dumps({'version': GENERATOR_VERSION, **asdict(rules)}, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def _letter(evs: Tuple[float, float, float], surrender: bool) -> str:
+    """Strategy letter for averaged (stand, hit, double) EVs"""
+    stand, hit, double = evs
+    if surrender and SURRENDER_EV > max(stand, hit, double):
+        return 'Rh' if hit > stand else 'Rs'
+    if double > max(stand, hit):
+        return 'D' if hit > stand else 'Ds'
+    return 'H' if hit > stand else 'S'
+
+
+def generate_tables(rules: RuleSet = RuleSet()) -> Tuple[StrategyTable, StrategyTable, StrategyTable]:
+    """Derive (hard, soft, split) strategy tables for rules"""
+    hard: StrategyTable = {total: {} for total in HARD_TOTALS}
+    soft: StrategyTable = {total: {} for total in SOFT_TOTALS}
+    split: StrategyTable = {key: {} for key in _PAIR_KEYS}
+    
+    for up_index, dealer_key in enumerate(DEALER_KEYS):
+        shoe = list(full_shoe(rules.num_decks))
+        shoe[up_index] -= 1
+        # Weighted (stand, hit, double) EV sums and weights per (soft, total)
+        sums: Dict[Tuple[bool, int], list] = {}
+        
+        for first in range(NUM_VALUES):
+            for second in range(first, NUM_VALUES):
+                if {first, second} == {ACE_INDEX, TEN_INDEX}:
+                    continue  # Naturals are not played
+                composition = list(shoe)
+                composition[first] -= 1
+                composition[second] -= 1
+                if min(composition) < 0:
+                    continue
+                composition = tuple(composition)
+                weight = shoe[first] * (shoe[second] - (first == second))
+                if first != second:
+                    weight *= 2
+                
+                hand_hard = _HARD_VALUES[first] + _HARD_VALUES[second]
+                has_ace = ACE_INDEX in (first, second)
+                is_soft = has_ace and hand_hard <= 11
+                value = hand_hard + 10 if is_soft else hand_hard
+                evs = (stand_ev(value, up_index, composition),
+                       hit_ev(hand_hard, has_ace, up_index, composition),
+                       double_ev(hand_hard, has_ace, up_index, composition))
+                
+                row = sums.setdefault((is_soft, value), [0.0, 0.0, 0.0, 0])
+                for k in range(3):
+                    row[k] += weight * evs[k]
+                row[3] += weight
+                
+                if first == second:
+                    best = max(evs)
+                    if rules.surrender:
+                        best = max(best, SURRENDER_EV)
+                    split_better = split_ev(first, up_index, composition) > best
+                    split[_PAIR_KEYS[first]][dealer_key] = 'Y' if split_better else 'N'
+        
+        for (is_soft, value), row in sums.items():
+            table = soft if is_soft else hard
+            table[value][dealer_key] = _letter(tuple(total / row[3] for total in row[:3]), rules.surrender)
+        # 21 without a natural is only reached by drawing
+        hard[21][dealer_key] = 'S'
+        soft[21][dealer_key] = 'S'
+    
+    return hard, soft, split
+
+
+def cache_path(rules: RuleSet, cache_dir: str = DEFAULT_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f'basic_strategy_{rules_hash(rules)}.json')
+
+
+def save_tables(path: str, rules: RuleSet, hard: StrategyTable, soft: StrategyTable,
+                split: StrategyTable):
+    """Write tables as JSON (dict keys become strings)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = {'rules': asdict(rules), 'version': GENERATOR_VERSION,
+            'hard': hard, 'soft': soft, 'split': split}
+    # Write to a temporary file first so a crash never leaves a partial table
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w') as f:
+        json.dump(data, f, indent=1)
+    os.replace(temp_path, path)
+
+
+def _restore_keys(table: Dict[str, Dict[str, str]]) -> StrategyTable:
+    return {int(total): {(key if key == 'A' else int(key)): letter for key, letter in row.items()}
+            for total, row in table.items()}
+
+
+def load_tables(path: str) -> Tuple[StrategyTable, StrategyTable, StrategyTable]:
+    """Read tables written by save_tables"""
+    with open(path) as f:
+        data = json.load(f)
+    return _restore_keys(data['hard']), _restore_keys(data['soft']), _restore_keys(data['split'])
+
+
+def basic_strategy_tables(rules: RuleSet = RuleSet(), cache_dir: Optional[str] = DEFAULT_CACHE_DIR
+                          ) -> Tuple[StrategyTable, StrategyTable, StrategyTable]:
+    """
+    (hard, soft, split) tables for rules, read from the on-disk cache when
+    they have been generated before and generated (then cached) otherwise.
+    cache_dir=None skips the disk cache.
+    """
+    path = cache_path(rules, cache_dir) if cache_dir is not None else None
+    if path is not None and os.path.exists(path):
+        return load_tables(path)
+    tables = generate_tables(rules)
+    if path is not None:
+        save_tables(path, rules, *tables)
+    return tables
+
+
+_compiled: Dict[Tuple[RuleSet, Optional[str]], CompiledStrategy] = {}
+
+
+def basic_strategy_table(rules: RuleSet = RuleSet(),
+                         cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> CompiledStrategy:
+    """Compiled basic_strategy_tables(), kept for the life of the process"""
+    key = (rules, cache_dir)
+    if key not in _compiled:
+        _compiled[key] = CompiledStrategy(*basic_strategy_tables(rules, cache_dir))
+    return _compiled[key]
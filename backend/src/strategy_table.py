@@ -0,0 +1,120 @@
+"""
+Compilation of HARD/SOFT/SPLIT strategy tables into flat lookup tables
+"""
+
+from typing import Any, Dict, Optional
+import numpy as np
+from hand import Hand
+from card import Card
+from game import Action
+
+
+# Dealer up card keys as used by the strategy tables, in index order
+DEALER_KEYS = (2, 3, 4, 5, 6, 7, 8, 9, 10, 'A')
+NUM_DEALER_CARDS = len(DEALER_KEYS)
+
+# Integer action codes stored in compiled tables
+HIT, STAND, DOUBLE, SPLIT, SURRENDER = range(5)
+CODE_ACTIONS = (Action.HIT, Action.STAND, Action.DOUBLE, Action.SPLIT, Action.SURRENDER)
+
+# Hand-state ids: hard totals map to themselves, soft totals to SOFT_OFFSET + total
+SOFT_OFFSET = 32
+NUM_STATES = 2 * SOFT_OFFSET
+NUM_PAIR_VALUES = 12  # Indexed by card value, 2-11
+
+# Strategy letter -> (code when doubling is allowed, code when it is not)
+LETTER_CODES = {
+    'H': (HIT, HIT),
+    'S': (STAND, STAND),
+    'D': (DOUBLE, HIT),
+    'Ds': (DOUBLE, STAND),
+    'R': (SURRENDER, SURRENDER),
+    'Rh': (SURRENDER, HIT),
+    'Rs': (SURRENDER, STAND),
+}
+
+# Surrender letter -> code when surrender is not allowed
+SURRENDER_FALLBACKS = {'R': HIT, 'Rh': HIT, 'Rs': STAND}
+
+StrategyTable = Dict[int, Dict[Any, str]]
+
+
+def hand_state_id(hand: Hand) -> int:
+    """Row of a compiled table for the hand's current total"""
+    return hand.value + SOFT_OFFSET if hand.is_soft else hand.value
+
+
+def dealer_index(dealer_up_card: Card) -> int:
+    """Column of a compiled table for the dealer up card (ace is last)"""
+    return dealer_up_card.value - 2
+
+
+class CompiledStrategy:
+    """
+    Dense lookup tables compiled from HARD/SOFT/SPLIT strategy dicts.
+    
+    Cells are addressed by (hand-state id, dealer index). Missing cells and
+    '?' cells take the fallback strategy's action, or the default letter when
+    there is no fallback. The NumPy views (codes, no_double_codes,
+    no_surrender_codes, split_codes) hold the same data for vectorized
+    consumers; no_surrender_codes replaces a SURRENDER code when the hand
+    cannot surrender.
+    """
+    
+    def __init__(self, hard: StrategyTable, soft: StrategyTable, split: StrategyTable,
+                 default: str = 'S', fallback: Optional['CompiledStrategy'] = None):
+        self.codes = np.empty((NUM_STATES, NUM_DEALER_CARDS), dtype=np.int8)
+        self.no_double_codes = np.empty((NUM_STATES, NUM_DEALER_CARDS), dtype=np.int8)
+        self.no_surrender_codes = np.empty((NUM_STATES, NUM_DEALER_CARDS), dtype=np.int8)
+        self.split_codes = np.zeros((NUM_PAIR_VALUES, NUM_DEALER_CARDS), dtype=bool)
+        
+        for state in range(NUM_STATES):
+            if state >= SOFT_OFFSET:
+                row = soft.get(state - SOFT_OFFSET, {})
+            else:
+                row = hard.get(state, {})
+            for column, dealer_key in enumerate(DEALER_KEYS):
+                letter = row.get(dealer_key)
+                if letter in (None, '?') and fallback is not None:
+                    with_double = fallback.codes[state, column]
+                    without_double = fallback.no_double_codes[state, column]
+                    without_surrender = fallback.no_surrender_codes[state, column]
+                else:
+                    if letter is None or letter == '?':
+                        letter = default
+                    with_double, without_double = LETTER_CODES.get(letter, (STAND, STAND))
+                    without_surrender = SURRENDER_FALLBACKS.get(letter, with_double)
+                self.codes[state, column] = with_double
+                self.no_double_codes[state, column] = without_double
+                self.no_surrender_codes[state, column] = without_surrender
+        
+        for pair_value, row in split.items():
+            for column, dealer_key in enumerate(DEALER_KEYS):
+                self.split_codes[pair_value, column] = row.get(dealer_key) == 'Y'
+        
+        # Flat tuples for the scalar path: one indexed read per decision
+        self._actions = tuple(CODE_ACTIONS[code] for code in self.codes.ravel())
+        self._no_double_actions = tuple(CODE_ACTIONS[code] for code in self.no_double_codes.ravel())
+        self._no_surrender_actions = tuple(CODE_ACTIONS[code] for code in self.no_surrender_codes.ravel())
+        self._splits = tuple(bool(flag) for flag in self.split_codes.ravel())
+    
+    def get_action(self, player_hand: Hand, dealer_up_card: Card, can_double: bool = True,
+                   can_split: bool = True, can_surrender: bool = True) -> Action:
+        """
+        Look up the action for a hand against a dealer up card. Surrender is
+        only returned for the first two cards of an unsplit hand.
+        """
+        column = dealer_up_card.value - 2
+        
+        cards = player_hand.cards
+        two_cards = len(cards) == 2 and not player_hand.is_split_hand
+        if (can_split and two_cards and cards[0].value == cards[1].value
+                and self._splits[cards[0].value * NUM_DEALER_CARDS + column]):
+            return Action.SPLIT
+        
+        state = player_hand.value + SOFT_OFFSET if player_hand.is_soft else player_hand.value
+        index = state * NUM_DEALER_CARDS + column
+        action = self._actions[index] if can_double else self._no_double_actions[index]
+        if action is Action.SURRENDER and not (can_surrender and two_cards):
+            return self._no_surrender_actions[index]
+        return action
@@ -0,0 +1,111 @@
+"""
+Gaussian-process surrogate for sample-efficient parameter search.
+
+Points live on the unit cube. The GP uses an isotropic squared-exponential
+kernel on standardized targets; its length scale and noise level are picked
+by maximum marginal likelihood over a small grid, which is enough for the
+few hundred noisy evaluations a strategy search makes and needs nothing
+beyond NumPy.
+
+propose_batch picks the next points to evaluate by expected improvement
+over a candidate set. Points after the first are chosen with the "kriging
+believer" heuristic: each chosen point is added to the model with its
+predicted mean as a pretend result, which flattens the improvement around
+it, so a batch spreads out instead of piling onto one optimum.
+"""
+
+import math
+from typing import Callable, Optional, Tuple
+import numpy as np
+
+
+_erf = np.vectorize(math.erf, otypes=[np.float64])
+
+
+def _sq_dists(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.maximum((a * a).sum(1)[:, None] + (b * b).sum(1)[None, :] - 2 * a @ b.T, 0.0)
+
+
+class GaussianProcess:
+    """GP regression with hyperparameters chosen by marginal likelihood"""
+    
+    LENGTH_SCALES = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6)
+    NOISE_LEVELS = (1e-4, 1e-3, 1e-2, 0.1, 0.3, 1.0)  # Relative to the target variance
+    
+    def fit(self, X: np.ndarray, y: np.ndarray, length_scale: Optional[float] = None,
+            noise: Optional[float] = None) -> 'GaussianProcess':
+        """Fit to points X (n x d) and targets y; fixed hyperparameters skip the search"""
+        self.X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        self.y_mean = y.mean()
+        self.y_std = y.std() or 1.0
+        z = (y - self.y_mean) / self.y_std
+        sq = _sq_dists(self.X, self.X)
+        
+        length_scales = self.LENGTH_SCALES if length_scale is None else (length_scale,)
+        noise_levels = self.NOISE_LEVELS if noise is None else (noise,)
+        best = None
+        for scale in length_scales:
+            kernel = np.exp(-0.5 * sq / scale ** 2)
+            for level in noise_levels:
+                try:
+                    lower = np.linalg.cholesky(kernel + level * np.eye(len(z)))
+                except np.linalg.LinAlgError:
+                    continue
+                v = np.linalg.solve(lower, z)
+                log_likelihood = -0.5 * v @ v - np.log(np.diag(lower)).sum()
+                if best is None or log_likelihood > best[0]:
+                    best = (log_likelihood, scale, level, lower, v)
+        
+        _, self.length_scale, self.noise, self._lower, v = best
+        self._alpha = np.linalg.solve(self._lower.T, v)
+        return self
+    
+    def predict(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation of the underlying function at X"""
+        cross = np.exp(-0.5 * _sq_dists(np.asarray(X, dtype=np.float64), self.X) / self.length_scale ** 2)
+        mean = cross @ self._alpha
+        v = np.linalg.solve(self._lower, cross.T)
+        variance = np.maximum(1.0 - (v * v).sum(axis=0), 1e-12)
+        return mean * self.y_std + self.y_mean, np.sqrt(variance) * self.y_std
+
+
+def expected_improvement(mean: np.ndarray, std: np.ndarray, best: float,
+                         xi: float = 0.0) -> np.ndarray:
+    """Expected amount by which each prediction beats best (maximizing)"""
+    improvement = mean - best - xi
+    z = improvement / std
+    cdf = 0.5 * (1.0 + _erf(z / math.sqrt(2.0)))
+    pdf = np.exp(-0.5 * z * z) / math.sqrt(2.0 * math.pi)
+    return improvement * cdf + std * pdf
+
+
+def propose_batch(X: np.ndarray, y: np.ndarray, candidates: np.ndarray, batch_size: int,
+                  key: Callable[[np.ndarray], tuple] = tuple) -> np.ndarray:
+    """
+    Up to batch_size rows of candidates to evaluate next, given the points
+    X evaluated so far and their results y. Candidates with the same key as
+    an evaluated or already chosen point are skipped.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    model = GaussianProcess().fit(X, y)
+    best = y.max()
+    taken = {key(x) for x in X}
+    keys = [key(c) for c in candidates]
+    available = np.array([k not in taken for k in keys])
+    chosen = []
+    
+    while len(chosen) < batch_size and available.any():
+        mean, std = model.predict(candidates)
+        scores = np.where(available, expected_improvement(mean, std, best), -np.inf)
+        pick = int(np.argmax(scores))
+        chosen.append(candidates[pick])
+        available &= np.array([k != keys[pick] for k in keys])
+        
+        # Believe the model's prediction for the chosen point
+        X = np.vstack([X, candidates[pick]])
+        y = np.append(y, mean[pick])
+        model = GaussianProcess().fit(X, y, model.length_scale, model.noise)
+    
+    return np.array(chosen).reshape(len(chosen), candidates.shape[1])
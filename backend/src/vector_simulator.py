@@ -0,0 +1,359 @@
+"""
+Vectorized multi-shoe simulator.
+
+Advances many independent shoes ("lanes") in lock-step with NumPy arrays:
+every step plays one round in each lane, with dealing, hand totals,
+decisions from a compiled strategy table and dealer play all done as array
+operations. Rounds are then laid end to end (step by step, lane by lane)
+to form the bankroll path of a single player, so the result has the same
+fields as BlackjackSimulator.simulate_hands.
+
+Rules follow BlackjackGame with one simplification suited to flat
+betting: doubles and splits are always affordable.
+"""
+
+import time
+import numpy as np
+
+from card import CARDS
+from deck import shuffle_position
+from seeding import SeedLike, as_seed_sequence, spawn_rng
+from game import DEALER_STAND_VALUE, BLACKJACK_PAYOUT
+from strategy import ComputerPlayer, StrategyType, BettingStrategy, BasicStrategy
+from strategy_table import (CompiledStrategy, HIT, DOUBLE, SPLIT, SURRENDER,
+                            SOFT_OFFSET)
+from simulator import SimulationResult
+from running_stats import RunningStats
+
+
+# A pair splits once: split hands cannot re-split
+MAX_HANDS = 2
+
+# Hard points of every card in one deck (ace counts 1)
+_DECK_POINTS = np.array([1 if card.is_ace else card.value for card in CARDS], dtype=np.int8)
+
+# Strategy table column and split-table row for a card's hard points
+_DEALER_COLUMN = np.array([0, 9, 0, 1, 2, 3, 4, 5, 6, 7, 8], dtype=np.intp)
+_PAIR_ROW = np.array([0, 11, 2, 3, 4, 5, 6, 7, 8, 9, 10], dtype=np.intp)
+
+
+class VectorSimulator:
+    """Simulates flat-bet play of a compiled strategy over many shoes at once"""
+    
+    def __init__(self,
+                 num_decks: int = 6,
+                 shuffle_threshold: float = 0.25,
+                 min_bet: int = 5,
+                 max_bet: int = 500,
+                 num_lanes: int = 4096,
+                 seed: SeedLike = None):
+        self.num_decks = num_decks
+        self.shuffle_threshold = shuffle_threshold
+        self.min_bet = min_bet
+        self.max_bet = max_bet
+        self.num_lanes = num_lanes
+        self.seed_sequence = as_seed_sequence(seed)
+        self.rng = spawn_rng(self.seed_sequence)
+        
+        self.shoe_size = len(_DECK_POINTS) * num_decks
+        self.cut = max(shuffle_position(self.shoe_size, shuffle_threshold), 1)
+        self._shoe = np.tile(_DECK_POINTS, num_decks)
+    
+    def simulate_hands(self,
+                       player: ComputerPlayer,
+                       num_hands: int,
+                       verbose: bool = False) -> SimulationResult:
+        """Simulate a number of hands with a basic-strategy, flat-betting player"""
+        if (player.playing_strategy != StrategyType.BASIC
+                or player.betting_system.strategy != BettingStrategy.FLAT):
+            raise ValueError("VectorSimulator only supports basic strategy with flat betting")
+        
+        result = self.simulate_table(BasicStrategy.compiled_table(), num_hands,
+                                     player.betting_system.base_bet,
+                                     player.betting_system.bankroll, verbose)
+        player.betting_system.bankroll = result.ending_bankroll
+        return result
+    
+    def simulate_table(self,
+                       table: CompiledStrategy,
+                       num_hands: int,
+                       base_bet: int = 10,
+                       bankroll: int = 1000,
+                       verbose: bool = False) -> SimulationResult:
+        """
+        Play num_hands rounds with a fixed bet, using table for every decision.
+        
+        Play stops early (bust out) once the bankroll can no longer cover the bet.
+        """
+        bet = max(self.min_bet, min(base_bet, self.max_bet))
+        lanes = self.num_lanes
+        self._new_shoes()
+        
+        starting_bankroll = bankroll
+        max_bankroll = min_bankroll = bankroll
+        wins = losses = pushes = blackjacks = surrenders = 0
+        hands_played = 0
+        bust_out = bankroll < bet
+        net_stats = RunningStats()
+        unit_stats = RunningStats()
+        
+        start_time = time.time()
+        
+        while hands_played < num_hands and not bust_out:
+            net, counts = self._play_step(table, bet)
+            
+            # Lay this step's rounds onto the bankroll path
+            step = min(lanes, num_hands - hands_played)
+            path = bankroll + np.cumsum(net[:step])
+            broke = np.flatnonzero(path < bet)
+            if len(broke):
+                step = int(broke[0]) + 1
+                path = path[:step]
+                bust_out = True
+            
+            step_counts = counts[:, :step].sum(axis=1)
+            wins += int(step_counts[0])
+            losses += int(step_counts[1])
+            pushes += int(step_counts[2])
+            blackjacks += int(step_counts[3])
+            surrenders += int(step_counts[4])
+            
+            net_stats.add_batch(net[:step])
+            unit_stats.add_batch(net[:step] / bet)
+            
+            bankroll = int(path[-1])
+            max_bankroll = max(max_bankroll, int(path.max()))
+            min_bankroll = min(min_bankroll, int(path.min()))
+            hands_played += step
+            
+            if verbose and bust_out:
+                print(f"Player bust out after {hands_played} hands")
+        
+        elapsed_time = time.time() - start_time
+        hands_per_hour = (hands_played / elapsed_time) * 3600 if elapsed_time > 0 else 0
+        
+        total_decisions = wins + losses + pushes
+        win_rate = (wins / total_decisions * 100) if total_decisions > 0 else 0
+        profit_loss = bankroll - starting_bankroll
+        roi = (profit_loss / starting_bankroll * 100) if starting_bankroll > 0 else 0
+        
+        return SimulationResult(
+            total_hands=hands_played,
+            total_wins=wins,
+            total_losses=losses,
+            total_pushes=pushes,
+            total_blackjacks=blackjacks,
+            total_surrenders=surrenders,
+            starting_bankroll=starting_bankroll,
+            ending_bankroll=bankroll,
+            profit_loss=profit_loss,
+            win_rate=win_rate,
+            roi=roi,
+            hands_per_hour=hands_per_hour,
+            max_bankroll=max_bankroll,
+            min_bankroll=min_bankroll,
+            bust_out=bust_out,
+            net_stats=net_stats,
+            unit_stats=unit_stats
+        )
+    
+    def _shuffled_shoes(self, count: int) -> np.ndarray:
+        """count freshly shuffled shoes, one per row"""
+        return self.rng.permuted(np.broadcast_to(self._shoe, (count, self.shoe_size)), axis=1)
+    
+    def _new_shoes(self):
+        """
+        Give every lane a fresh shoe.
+        
+        Each lane's buffer holds the first cut cards of its current shoe
+        followed by a whole fresh shoe, so a round that crosses the cut card
+        carries on into the next shoe just like Deck's reshuffle on deal.
+        """
+        lanes = self.num_lanes
+        self.buffer = np.empty((lanes, self.cut + self.shoe_size), dtype=np.int8)
+        self.buffer[:, :self.cut] = self._shuffled_shoes(lanes)[:, :self.cut]
+        self.buffer[:, self.cut:] = self._shuffled_shoes(lanes)
+        self.position = np.zeros(lanes, dtype=np.intp)
+    
+    def _advance_shoes(self):
+        """Move lanes that passed the cut card on to their next shoe"""
+        cut = self.cut
+        passed = np.flatnonzero(self.position >= cut)
+        if len(passed):
+            buffer = self.buffer
+            buffer[passed, :cut] = buffer[passed, cut:2 * cut]
+            buffer[passed, cut:] = self._shuffled_shoes(len(passed))
+            self.position[passed] -= cut
+    
+    def _deal(self, lanes: np.ndarray) -> np.ndarray:
+        """Deal the next card in each of the given lanes"""
+        position = self.position
+        cards = self.buffer[lanes, position[lanes]]
+        position[lanes] += 1
+        return cards
+    
+    def _play_step(self, table: CompiledStrategy, bet: int):
+        """
+        Play one round in every lane.
+        
+        Returns the net win/loss per lane and a (5, lanes) array of win, loss,
+        push, blackjack and surrender counts per lane.
+        """
+        self._advance_shoes()
+        lanes = self.num_lanes
+        every_lane = np.arange(lanes)
+        deal = self._deal
+        
+        # Per-hand state, one row per hand slot
+        hard = np.zeros((MAX_HANDS, lanes), dtype=np.int16)
+        aces = np.zeros((MAX_HANDS, lanes), dtype=bool)
+        num_cards = np.zeros((MAX_HANDS, lanes), dtype=np.int8)
+        first_card = np.zeros((MAX_HANDS, lanes), dtype=np.int8)
+        second_card = np.zeros((MAX_HANDS, lanes), dtype=np.int8)
+        bet_units = np.zeros((MAX_HANDS, lanes), dtype=np.int8)
+        num_hands = np.ones(lanes, dtype=np.int8)
+        total_units = np.ones(lanes, dtype=np.int64)
+        surrendered = np.zeros(lanes, dtype=np.int64)
+        
+        # Deal cards (player, dealer, player, dealer)
+        player_first = deal(every_lane)
+        dealer_first = deal(every_lane)
+        player_second = deal(every_lane)
+        dealer_second = deal(every_lane)
+        
+        first_card[0] = player_first
+        second_card[0] = player_second
+        hard[0] = player_first + player_second
+        aces[0] = (player_first == 1) | (player_second == 1)
+        num_cards[0] = 2
+        bet_units[0] = 1
+        
+        dealer_hard = (dealer_first + dealer_second).astype(np.int16)
+        dealer_aces = (dealer_first == 1) | (dealer_second == 1)
+        up_column = _DEALER_COLUMN[dealer_first]
+        
+        player_blackjack = aces[0] & (hard[0] == 11)
+        dealer_blackjack = dealer_aces & (dealer_hard == 11)
+        
+        codes = table.codes
+        no_double_codes = table.no_double_codes
+        no_surrender_codes = table.no_surrender_codes
+        split_codes = table.split_codes
+        
+        # Play each hand slot in turn, lanes deciding together
+        active = np.flatnonzero(~player_blackjack & ~dealer_blackjack)
+        for slot in range(MAX_HANDS):
+            playing = active[num_hands[active] > slot] if slot else active
+            
+            while len(playing):
+                slot_hard = hard[slot, playing]
+                soft = aces[slot, playing] & (slot_hard <= 11)
+                state = slot_hard + soft * (10 + SOFT_OFFSET)
+                columns = up_column[playing]
+                two_cards = num_cards[slot, playing] == 2
+                
+                action = np.where(two_cards, codes[state, columns], no_double_codes[state, columns])
+                
+                # Only the original hand, before it splits, may split or surrender
+                if slot == 0:
+                    can_surrender = two_cards & (num_hands[playing] == 1)
+                else:
+                    can_surrender = np.zeros(len(playing), dtype=bool)
+                cannot_surrender = (action == SURRENDER) & ~can_surrender
+                action[cannot_surrender] = no_surrender_codes[state, columns][cannot_surrender]
+                if slot == 0:
+                    pair_card = first_card[0, playing]
+                    can_split = can_surrender & (pair_card == second_card[0, playing])
+                    wants_split = split_codes[_PAIR_ROW[pair_card], columns]
+                    action[can_split & wants_split] = SPLIT
+                
+                hitting = playing[action == HIT]
+                if len(hitting):
+                    card = deal(hitting)
+                    hard[slot, hitting] += card
+                    aces[slot, hitting] |= card == 1
+                    num_cards[slot, hitting] += 1
+                    hitting = hitting[hard[slot, hitting] <= 21]
+                
+                doubling = playing[action == DOUBLE]
+                if len(doubling):
+                    card = deal(doubling)
+                    hard[slot, doubling] += card
+                    aces[slot, doubling] |= card == 1
+                    num_cards[slot, doubling] += 1
+                    bet_units[slot, doubling] = 2
+                    total_units[doubling] += 1
+                
+                surrendering = playing[action == SURRENDER]
+                if len(surrendering):
+                    bet_units[slot, surrendering] = 0
+                    surrendered[surrendering] = 1
+                
+                splitting = playing[action == SPLIT]
+                if len(splitting):
+                    new_slot = num_hands[splitting]
+                    kept = first_card[slot, splitting]
+                    moved = second_card[slot, splitting]
+                    
+                    card = deal(splitting)
+                    first_card[slot, splitting] = kept
+                    second_card[slot, splitting] = card
+                    hard[slot, splitting] = kept + card
+                    aces[slot, splitting] = (kept == 1) | (card == 1)
+                    num_cards[slot, splitting] = 2
+                    
+                    card = deal(splitting)
+                    first_card[new_slot, splitting] = moved
+                    second_card[new_slot, splitting] = card
+                    hard[new_slot, splitting] = moved + card
+                    aces[new_slot, splitting] = (moved == 1) | (card == 1)
+                    num_cards[new_slot, splitting] = 2
+                    bet_units[new_slot, splitting] = 1
+                    
+                    num_hands[splitting] += 1
+                    total_units[splitting] += 1
+                
+                playing = np.concatenate((hitting, splitting))
+        
+        soft_hands = aces & (hard <= 11)
+        value = hard + soft_hands * 10
+        in_play = bet_units > 0
+        
+        # Dealer doesn't play if all player hands are bust or surrendered, or
+        # to a natural (paid before the dealer plays)
+        dealer_playing = np.flatnonzero(~dealer_blackjack & ~player_blackjack
+                                        & (in_play & (value <= 21)).any(axis=0))
+        while len(dealer_playing):
+            dealer_value = dealer_hard[dealer_playing] + 10 * (
+                dealer_aces[dealer_playing] & (dealer_hard[dealer_playing] <= 11))
+            dealer_playing = dealer_playing[dealer_value < DEALER_STAND_VALUE]
+            if len(dealer_playing):
+                card = deal(dealer_playing)
+                dealer_hard[dealer_playing] += card
+                dealer_aces[dealer_playing] |= card == 1
+        
+        dealer_value = dealer_hard + 10 * (dealer_aces & (dealer_hard <= 11))
+        dealer_bust = dealer_value > 21
+        
+        # Settle every hand the same way RoundEngine does
+        natural = np.zeros((MAX_HANDS, lanes), dtype=bool)
+        natural[0] = player_blackjack
+        standing = in_play & (value <= 21)
+        blackjack = natural & ~dealer_blackjack
+        beats = dealer_bust | (~natural & ~dealer_blackjack & (value > dealer_value))
+        win = standing & ~natural & beats
+        push = standing & ~dealer_bust & (natural == dealer_blackjack) & ~natural & (value == dealer_value)
+        push |= standing & ~dealer_bust & natural & dealer_blackjack
+        lose = in_play & ~win & ~blackjack & ~push
+        
+        payout = (win * (2 * bet) + push * bet) * bet_units.astype(np.int64)
+        net = (payout.sum(axis=0) + blackjack[0] * int(bet * BLACKJACK_PAYOUT)
+               + surrendered * (bet // 2) - total_units * bet)
+        
+        counts = np.empty((5, lanes), dtype=np.int64)
+        counts[0] = win.sum(axis=0) + blackjack[0]
+        counts[1] = lose.sum(axis=0)
+        counts[2] = push.sum(axis=0)
+        counts[3] = blackjack[0]
+        counts[4] = surrendered
+        return net, counts
@@ -0,0 +1,73 @@
+"""Tests for grouped analytics over hand histories"""
+import numpy as np
+import pytest
+
+from analytics import (ev_by_true_count, ev_by_total_and_up_card, bet_distribution,
+                       bet_unit_counts, unit_counts_to_distribution, deviation_frequency)
+from configurable_strategy import ConfigurableStrategy
+from hand_history import HandHistoryWriter, open_history, iter_history
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer
+
+
+@pytest.fixture(scope="module")
+def history_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("history") / "history.bin")
+    with HandHistoryWriter(path) as writer:
+        run_strategy_simulation(CountingStrategyPlayer(ConfigurableStrategy()), 5000,
+                                bankroll=1000000, seed=7, history=writer)
+    return path
+
+
+class TestAnalytics:
+    """Test bincount reductions against direct computation"""
+    
+    def test_ev_by_true_count(self, history_path):
+        history = open_history(history_path)
+        stats = ev_by_true_count(history, bin_width=2, low=-10, high=10)
+        assert stats['count'].sum() == len(history)
+        
+        unit_net = history['net'] / history['bet']
+        in_bin = (history['true_count'] >= 0) & (history['true_count'] < 2)
+        bin_index = int(np.flatnonzero(stats['edges'] == 0)[0])
+        assert stats['count'][bin_index] == in_bin.sum()
+        assert stats['mean'][bin_index] == pytest.approx(unit_net[in_bin].mean())
+        assert stats['variance'][bin_index] == pytest.approx(unit_net[in_bin].var(ddof=1))
+    
+    def test_chunks_match_whole_history(self, history_path):
+        whole = ev_by_total_and_up_card(open_history(history_path))
+        chunked = ev_by_total_and_up_card(iter_history(history_path, chunk_rounds=700))
+        assert np.array_equal(whole['count'], chunked['count'])
+        assert np.allclose(whole['mean'], chunked['mean'])
+    
+    def test_total_and_up_card_grid(self, history_path):
+        history = open_history(history_path)
+        grid = ev_by_total_and_up_card(history)
+        assert grid['count'].shape == (2, 22, 12)
+        assert grid['count'].sum() == len(history)
+        # No hand can be a soft total below 12 or face a dealer up card below 2
+        assert grid['count'][1, :12].sum() == 0
+        assert grid['count'][:, :, :2].sum() == 0
+    
+    def test_bet_distribution(self, history_path):
+        history = open_history(history_path)
+        distribution = bet_distribution(iter_history(history_path, chunk_rounds=1000), 10)
+        assert sum(distribution.values()) == len(history)
+        assert distribution[1] == (history['bet'] == 10).sum()
+        
+        counts = bet_unit_counts([10, 10, 30], 10)
+        counts = bet_unit_counts([50, 10], 10, counts)
+        assert unit_counts_to_distribution(counts) == {1: 3, 3: 1, 5: 1}
+    
+    def test_deviation_frequency(self, history_path):
+        history = open_history(history_path)
+        deviations = ConfigurableStrategy().deviations
+        frequency = deviation_frequency(history, deviations)
+        assert set(frequency) == set(deviations)
+        
+        deviation = deviations['16_vs_10_stand']
+        hard_16_vs_10 = ((history['player_total'] == 16) & (history['soft'] == 0)
+                         & (history['actions'][:, 0] != 255)
+                         & np.isin(history['dealer_cards'][:, 0], [8, 9, 10, 11]))
+        assert frequency['16_vs_10_stand']['opportunities'] == hard_16_vs_10.sum()
+        assert frequency['16_vs_10_stand']['fired'] == \
+            (hard_16_vs_10 & (history['true_count'] > deviation['count_threshold'])).sum()
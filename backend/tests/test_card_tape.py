@@ -0,0 +1,102 @@
+"""Tests for card tapes and vectorized recounting"""
+import itertools
+import numpy as np
+import pytest
+
+from configurable_strategy import ConfigurableStrategy, ConfigurableCountingSystem
+from outcome_tape import OutcomeTape
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer, SimulationStrategy
+from card_tape import CardTape, seen_rank_counts, true_counts, ramp_bet_matrix, recount
+from optimize_strategy import generate_parameter_grid, recount_search
+
+
+def record(num_hands, seed, config=None, bankroll=1e9):
+    card_tape = CardTape(CountingStrategyPlayer(ConfigurableStrategy(config)))
+    outcome_tape = OutcomeTape()
+    stats = run_strategy_simulation(card_tape, num_hands, bankroll=bankroll, seed=seed, tape=outcome_tape)
+    return card_tape, outcome_tape, stats
+
+
+class TestSeenRankCounts:
+    """Test the per-bet rank counts since the last shuffle"""
+    
+    def test_mid_round_shuffle(self):
+        # Bets after 0, 3 and 5 cards; the shoe is reshuffled after the 4th card
+        rank_codes = np.array([0, 1, 1, 12, 5, 5, 7], dtype=np.uint8)
+        seen = seen_rank_counts(rank_codes, np.array([0, 4]), np.array([0, 3, 5]))
+        assert seen.sum(axis=1).tolist() == [0, 3, 1]
+        assert seen[1, 1] == 2 and seen[1, 0] == 1
+        assert seen[2, 5] == 1
+    
+    def test_shuffle_at_bet(self):
+        seen = seen_rank_counts(np.array([3, 3, 3], dtype=np.uint8), np.array([0, 2]), np.array([0, 2]))
+        assert seen.sum(axis=1).tolist() == [0, 0]
+
+
+class TestRecount:
+    """Test recounting recorded simulations against live counting"""
+    
+    def test_own_count_reproduces_simulation(self):
+        card_tape, outcome_tape, stats = record(3000, seed=5)
+        config = ConfigurableStrategy().config
+        codes, shuffles, bets = card_tape.to_arrays()
+        counts = true_counts(seen_rank_counts(codes, shuffles, bets), [config])[:, 0]
+        assert counts == pytest.approx(outcome_tape.to_array()['true_count'], abs=1e-5)
+        
+        result = recount(card_tape, outcome_tape, [config], bankroll=1e9)[0]
+        assert result['profit_loss'] == pytest.approx(stats['total_won_lost'])
+        assert result['total_wagered'] == pytest.approx(stats['total_wagered'])
+        assert result['roi'] == pytest.approx(stats['roi'])
+    
+    def test_other_counts_match_live_counting(self):
+        """Recounted true counts equal those of counting systems watching the same cards"""
+        configs = list(itertools.islice(generate_parameter_grid(), 0, 3000, 1000))
+        systems = [ConfigurableCountingSystem(config['counting']) for config in configs]
+        live = []
+        
+        class Watcher(SimulationStrategy):
+            """Plays like player while the other systems count the same cards"""
+            
+            def __init__(self, player):
+                self.player = player
+            
+            def act(self, *decision):
+                return self.player.act(*decision)
+            
+            def observe(self, card):
+                self.player.observe(card)
+                for system in systems:
+                    system.count_card(card)
+            
+            def reset(self):
+                self.player.reset()
+                for system in systems:
+                    system.reset()
+            
+            def bet(self, min_bet):
+                live.append([system.get_true_count(6) for system in systems])
+                return self.player.bet(min_bet)
+        
+        card_tape = CardTape(Watcher(CountingStrategyPlayer(ConfigurableStrategy())))
+        run_strategy_simulation(card_tape, 2000, bankroll=1e9, seed=6)
+        codes, shuffles, bets = card_tape.to_arrays()
+        assert true_counts(seen_rank_counts(codes, shuffles, bets), configs) == pytest.approx(np.array(live))
+    
+    def test_ramp_bets(self):
+        config = ConfigurableStrategy().config
+        strategy = ConfigurableStrategy()
+        counts = np.array([[-3.0], [4.9], [5.0], [9.99], [10.0], [500.0]])
+        expected = []
+        for count in counts[:, 0]:
+            strategy.counting_system.get_true_count = lambda total_decks=6, count=count: count
+            expected.append(strategy.get_bet_amount(10))
+        assert ramp_bet_matrix(counts, [config])[:, 0].tolist() == expected
+    
+    def test_recount_search(self):
+        configs = list(itertools.islice(generate_parameter_grid(), 0, 600, 20))
+        best_config, results = recount_search(num_hands=300, max_workers=2, seed=7, top_k=3,
+                                              block_size=8, configs=configs)
+        assert len(results) == 3 and results[0]['config'] == best_config
+        # Confirmed ROIs come from full simulations on the recorded shoes
+        assert all('recount_roi' in result for result in results)
+        assert best_config in configs
@@ -0,0 +1,99 @@
+"""Tests for exact dealer outcome probabilities"""
+import pytest
+
+from card import Card, Rank, Suit
+from deck import Deck
+from statistics import BlackjackStatistics
+from dealer_probabilities import (
+    dealer_outcomes, final_value_probabilities, composition_from_ranks, full_shoe,
+    remove_cards, unseen_composition, value_index, BUST, BLACKJACK, ACE_INDEX, TEN_INDEX
+)
+
+
+def brute_force(up_index, composition, no_blackjack=False):
+    """Enumerate every ordered draw without any memoization"""
+    values = list(range(2, 11)) + [1]
+    outcome = [0.0] * 7
+    
+    def walk(hard, aces, cards, counts, p):
+        value = hard + 10 if aces and hard <= 11 else hard
+        if cards == 2 and value == 21:
+            outcome[BLACKJACK] += p
+            return
+        if value >= 17:
+            outcome[value - 17 if value <= 21 else BUST] += p
+            return
+        total = sum(counts)
+        for index, count in enumerate(counts):
+            if count:
+                counts[index] -= 1
+                walk(hard + values[index], aces + (index == ACE_INDEX), cards + 1,
+                     counts, p * count / total)
+                counts[index] += 1
+    
+    walk(values[up_index], int(up_index == ACE_INDEX), 1, list(composition), 1.0)
+    if no_blackjack:
+        natural = outcome[BLACKJACK]
+        outcome = [p / (1 - natural) for p in outcome]
+        outcome[BLACKJACK] = 0.0
+    return outcome
+
+
+class TestDealerOutcomes:
+    """Test exact dealer probabilities against enumeration and known values"""
+    
+    # A depleted single deck small enough to enumerate
+    SMALL = (2, 1, 2, 1, 2, 1, 1, 2, 5, 2)
+    
+    @pytest.mark.parametrize("up_index", [0, 4, 5, TEN_INDEX, ACE_INDEX])
+    @pytest.mark.parametrize("no_blackjack", [False, True])
+    def test_matches_enumeration(self, up_index, no_blackjack):
+        exact = dealer_outcomes(up_index, self.SMALL, no_blackjack)
+        assert exact == pytest.approx(brute_force(up_index, self.SMALL, no_blackjack))
+        assert sum(exact) == pytest.approx(1.0)
+    
+    def test_six_deck_values(self):
+        """Stand-on-17 bust rates for a fresh six-deck shoe"""
+        shoe = full_shoe(6)
+        six = Card(Rank.SIX, Suit.HEARTS)
+        ace = Card(Rank.ACE, Suit.HEARTS)
+        assert final_value_probabilities(six, remove_cards(shoe, [six]))['bust'] == pytest.approx(0.4228, abs=1e-4)
+        assert final_value_probabilities(ace, remove_cards(shoe, [ace]))['bust'] == pytest.approx(0.1155, abs=1e-4)
+        assert final_value_probabilities(ace, remove_cards(shoe, [ace]), no_blackjack=True)['bust'] == \
+            pytest.approx(0.1670, abs=1e-4)
+    
+    def test_forced_draws(self):
+        """With only tens left a six up card must bust"""
+        composition = tuple([0] * TEN_INDEX + [3, 0])
+        assert dealer_outcomes(value_index(Card(Rank.SIX, Suit.CLUBS)), composition)[BUST] == 1.0
+    
+    def test_cached(self):
+        dealer_outcomes.cache_clear()
+        dealer_outcomes(3, self.SMALL)
+        dealer_outcomes(3, self.SMALL)
+        assert dealer_outcomes.cache_info().hits == 1
+    
+    def test_deck_composition(self):
+        deck = Deck(num_decks=1, seed=3)
+        hole = deck.deal()
+        composition = composition_from_ranks(deck.get_remaining_composition())
+        assert sum(composition) == 51
+        assert composition[TEN_INDEX] == 16 - (hole.value == 10 and not hole.is_ace)
+        assert unseen_composition(deck, [hole]) == full_shoe(1)
+
+
+class TestBlackjackStatistics:
+    """Test the statistics methods backed by the exact calculation"""
+    
+    def test_composition_changes_odds(self):
+        up = Card(Rank.FIVE, Suit.SPADES)
+        default = BlackjackStatistics.calculate_dealer_bust_probability(up)
+        assert default == pytest.approx(0.4184, abs=1e-4)
+        rich = list(remove_cards(full_shoe(1), [up]))
+        rich[TEN_INDEX] += 16
+        assert BlackjackStatistics.calculate_dealer_bust_probability(up, tuple(rich)) > default
+    
+    def test_final_values_format(self):
+        probabilities = BlackjackStatistics.calculate_dealer_final_value_probabilities(Card(Rank.KING, Suit.SPADES))
+        assert set(probabilities) == {17, 18, 19, 20, 21, 'bust'}
+        assert sum(probabilities.values()) == pytest.approx(1.0)
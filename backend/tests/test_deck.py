@@ -0,0 +1,213 @@
+"""Tests for the list-backed and array-backed shoes"""
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from card import Rank, card_from_code
+from deck import Deck, ArrayDeck, ShoeBuffer, ReplayDeck
+from dad_strategy import DadStrategy
+from game import Action
+from round_engine import RoundEngine
+from simulation_engine import CountingStrategyPlayer
+from simulator import BlackjackSimulator
+from strategy import ComputerPlayer
+
+
+class TestArrayDeck:
+    """Test the uint8 array-backed shoe"""
+    
+    def test_contains_every_card_num_decks_times(self):
+        """A fresh shoe holds each of the 52 cards once per deck"""
+        deck = ArrayDeck(num_decks=6)
+        counts = Counter(card.code for card in deck.cards)
+        assert len(counts) == 52
+        assert set(counts.values()) == {6}
+    
+    def test_deal_returns_flyweight_cards(self):
+        """Dealt cards are the shared instances for their code"""
+        deck = ArrayDeck(num_decks=1)
+        card = deck.deal()
+        assert card is card_from_code(card.code)
+        assert deck.dealt_cards == [card]
+    
+    def test_matches_deck_bookkeeping(self):
+        """Remaining cards, penetration and count agree with Deck semantics"""
+        deck = ArrayDeck(num_decks=2, shuffle_threshold=0.25)
+        dealt = [deck.deal() for _ in range(20)]
+        assert deck.remaining_cards == 104 - 20
+        assert deck.penetration == pytest.approx(20 / 104)
+        assert deck.get_running_count() == sum(card.count_value for card in dealt)
+    
+    @pytest.mark.parametrize("threshold", [0.25, 0.72])
+    def test_reshuffles_at_same_point_as_deck(self, threshold):
+        """The array shoe reshuffles after the same number of cards as Deck"""
+        reference = Deck(num_decks=1, shuffle_threshold=threshold)
+        deck = ArrayDeck(num_decks=1, shuffle_threshold=threshold)
+        for _ in range(52 * 3):
+            reference.deal()
+            deck.deal()
+            assert deck.remaining_cards == reference.remaining_cards
+    
+    def test_seeded_shoe_is_reproducible(self):
+        """Two shoes with the same seed deal the same cards"""
+        first = ArrayDeck(6, seed=7)
+        second = ArrayDeck(6, seed=7)
+        assert [first.deal() for _ in range(400)] == [second.deal() for _ in range(400)]
+
+
+class TestIncrementalCounts:
+    """Test that counts and composition are maintained on every deal"""
+    
+    @pytest.mark.parametrize("deck_class", [Deck, ArrayDeck])
+    def test_running_count_and_composition(self, deck_class):
+        """Running count and remaining ranks track the dealt cards"""
+        deck = deck_class(num_decks=2, shuffle_threshold=0.25)
+        dealt = [deck.deal() for _ in range(30)]
+        assert deck.get_running_count() == sum(card.count_value for card in dealt)
+        
+        composition = deck.get_remaining_composition()
+        assert sum(composition) == deck.remaining_cards
+        for card in dealt:
+            composition[card.rank_code] += 1
+        assert composition == [8] * 13
+    
+    @pytest.mark.parametrize("deck_class", [Deck, ArrayDeck])
+    def test_registered_count_system(self, deck_class):
+        """Registered linear systems are updated per card, including cards dealt before registration"""
+        deck = deck_class(num_decks=1, shuffle_threshold=0.0)
+        values = {Rank.ACE: -3, Rank.FIVE: 5}
+        dealt = [deck.deal() for _ in range(10)]
+        deck.register_count_system("custom", values)
+        dealt += [deck.deal() for _ in range(10)]
+        assert deck.get_count("custom") == sum(values.get(card.rank, 0) for card in dealt)
+    
+    def test_counts_reset_on_shuffle(self):
+        """Shuffling restores a full composition and zero counts"""
+        deck = ArrayDeck(num_decks=1)
+        deck.register_count_system("aces", {Rank.ACE: 1})
+        for _ in range(20):
+            deck.deal()
+        deck.shuffle()
+        assert deck.get_running_count() == 0
+        assert deck.get_count("aces") == 0
+        assert deck.get_remaining_composition() == [4] * 13
+
+
+class TestDeckObservers:
+    """Test card and shuffle observers registered on a deck"""
+    
+    @pytest.mark.parametrize("deck_class", [Deck, ArrayDeck])
+    def test_every_card_published_once(self, deck_class):
+        """Observers see each dealt card once, then the reshuffle it triggers"""
+        deck = deck_class(num_decks=1, shuffle_threshold=0.5)
+        events = []
+        deck.add_observer(lambda card: events.append(card.code), lambda: events.append("shuffle"))
+        dealt = [deck.deal().code for _ in range(26)]
+        assert events == dealt + ["shuffle"]
+    
+    def test_remove_observer(self):
+        deck = ArrayDeck(num_decks=1)
+        seen = []
+        deck.add_observer(seen.append)
+        deck.deal()
+        deck.remove_observer(seen.append)
+        deck.deal()
+        assert len(seen) == 1
+    
+    def test_counting_player_holds_hole_card(self):
+        """Hits and split cards are counted as dealt, the hole card only once the round is over"""
+        deck = ArrayDeck(num_decks=6, shuffle_threshold=0.25, seed=9)
+        strategy = DadStrategy()
+        counter = strategy.counting_system
+        player = CountingStrategyPlayer(strategy)
+        deck.add_observer(player.observe, player.reset)
+        engine = RoundEngine(deck)
+        player.reset()
+        checked = []
+        
+        def count_of(cards):
+            return sum(counter.count_values[card.rank] for card in cards)
+        
+        def policy(hand, dealer_up_card, can_double, can_split, can_surrender):
+            hole_card = engine.dealer_hand.cards[1]
+            dealt = deck.dealt_cards
+            checked.append(counter.cards_seen == len(dealt) - 1 and
+                           counter.running_count == count_of(dealt) - counter.count_values[hole_card.rank])
+            if can_split:
+                return Action.SPLIT
+            return Action.HIT if hand.value < 17 else Action.STAND
+        
+        # Rounds before the first reshuffle
+        for _ in range(30):
+            engine.play_round(player.bet(10), policy)
+            # Revealed before the next bet is sized
+            player.true_count()
+            dealt = deck.dealt_cards
+            assert counter.cards_seen == len(dealt)
+            assert counter.running_count == count_of(dealt)
+        assert checked and all(checked)
+
+
+class TestSeeding:
+    """Test seeded, per-shoe random streams"""
+    
+    @pytest.mark.parametrize("deck_class", [Deck, ArrayDeck])
+    def test_same_seed_same_shoes(self, deck_class):
+        """Decks with the same seed replay the same shoes, across reshuffles"""
+        first = deck_class(num_decks=1, shuffle_threshold=0.25, seed=3)
+        second = deck_class(num_decks=1, shuffle_threshold=0.25, seed=3)
+        assert [first.deal().code for _ in range(200)] == [second.deal().code for _ in range(200)]
+    
+    @pytest.mark.parametrize("deck_class", [Deck, ArrayDeck])
+    def test_each_shoe_gets_its_own_stream(self, deck_class):
+        """Successive shoes and different seeds are shuffled differently"""
+        deck = deck_class(num_decks=1, seed=3)
+        first_shoe = [deck.deal().code for _ in range(10)]
+        deck.shuffle()
+        second_shoe = [deck.deal().code for _ in range(10)]
+        other = deck_class(num_decks=1, seed=4)
+        assert first_shoe != second_shoe
+        assert first_shoe != [other.deal().code for _ in range(10)]
+    
+    def test_seed_sequence_is_not_advanced(self):
+        """Passing a SeedSequence twice gives the same shoes both times"""
+        seed = np.random.SeedSequence(5)
+        first = ArrayDeck(6, seed=seed)
+        second = ArrayDeck(6, seed=seed)
+        assert [first.deal() for _ in range(50)] == [second.deal() for _ in range(50)]
+    
+    def test_seeded_simulation_is_reproducible(self):
+        """simulate_hands with a seed gives identical results"""
+        simulator = BlackjackSimulator()
+        first = simulator.simulate_hands(ComputerPlayer(bankroll=100000), 500, seed=9)
+        second = simulator.simulate_hands(ComputerPlayer(bankroll=100000), 500, seed=9)
+        assert first.to_dict() == {**second.to_dict(), 'hands_per_hour': first.hands_per_hour}
+
+
+class TestShoeBuffer:
+    """Test shoes shared between replaying decks"""
+    
+    def test_replay_matches_seeded_array_deck(self):
+        """A ReplayDeck deals exactly what ArrayDeck with the same seed deals"""
+        reference = ArrayDeck(1, 0.25, seed=8)
+        replay = ReplayDeck(ShoeBuffer(1, seed=8), 0.25)
+        assert [replay.deal().code for _ in range(300)] == [reference.deal().code for _ in range(300)]
+    
+    def test_decks_share_shoes_and_evict(self):
+        """Decks read the same buffered shoes; evicted shoes are released"""
+        source = ShoeBuffer(1, seed=2)
+        fast = ReplayDeck(source, 0.25)
+        slow = ReplayDeck(source, 0.25)
+        for _ in range(120):
+            fast.deal()
+        assert fast.shoe_index == 3
+        assert source.buffered_shoes == 4
+        
+        source.evict_before(slow.shoe_index)
+        assert source.buffered_shoes == 4
+        slow.shuffle()
+        source.evict_before(min(fast.shoe_index, slow.shoe_index))
+        assert source.buffered_shoes == 3
+        with pytest.raises(ValueError):
+            source.shoe(0)
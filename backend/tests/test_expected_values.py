@@ -0,0 +1,173 @@
+"""Tests for the combinatorial EV engine and perfect-play simulation"""
+import random
+import numpy as np
+import pytest
+
+from card import Card, Rank, Suit, CARDS
+from hand import Hand
+from deck import ArrayDeck
+from game import Action
+from round_engine import RoundEngine
+from statistics import BlackjackStatistics
+from simulation_engine import PerfectPlayer, run_strategy_simulation
+from dealer_probabilities import full_shoe, remove_cards, unseen_composition, value_index
+from expected_values import action_evs, best_action, stand_ev, hand_state, split_ev
+
+
+def make_hand(*ranks):
+    hand = Hand()
+    for rank in ranks:
+        hand.add_card(Card(rank, Suit.HEARTS))
+    return hand
+
+
+def evs_for(ranks, up_rank, num_decks=6):
+    hand = make_hand(*ranks)
+    up = Card(up_rank, Suit.CLUBS)
+    return action_evs(hand, up, remove_cards(full_shoe(num_decks), hand.cards + [up]))
+
+
+def brute_force_hit(hard, has_ace, up_index, composition):
+    """Best of hit and stand by plain recursion, without the engine's caches"""
+    value = hard + 10 if has_ace and hard <= 11 else hard
+    if value > 21:
+        return -1.0
+    best = stand_ev.__wrapped__(value, up_index, composition)
+    if value == 21:
+        return best
+    total = sum(composition)
+    hit = 0.0
+    for index, count in enumerate(composition):
+        if count:
+            drawn = composition[:index] + (count - 1,) + composition[index + 1:]
+            card_value = 1 if index == 9 else index + 2
+            hit += count / total * brute_force_hit(hard + card_value, has_ace or index == 9, up_index, drawn)
+    return max(best, hit)
+
+
+class SplitShoe:
+    """Deals a fixed pair and up card every round, then cards drawn at random from the rest of the shoe"""
+    
+    def __init__(self, pair_rank, up_rank, num_decks=6, seed=0):
+        self.opening = [Card(pair_rank, Suit.HEARTS), Card(up_rank, Suit.CLUBS), Card(pair_rank, Suit.SPADES)]
+        self.rest = list(CARDS) * num_decks
+        for card in self.opening:
+            self.rest.remove(next(c for c in self.rest if (c.rank, c.suit) == (card.rank, card.suit)))
+        self.random = random.Random(seed)
+        self.new_round()
+    
+    def new_round(self):
+        self.dealt = 0
+    
+    def deal(self):
+        if self.dealt < len(self.opening):
+            card = self.opening[self.dealt]
+        else:
+            # Partial Fisher-Yates shuffle of the rest of the shoe
+            index = self.dealt - len(self.opening)
+            pick = self.random.randrange(index, len(self.rest))
+            self.rest[index], self.rest[pick] = self.rest[pick], self.rest[index]
+            card = self.rest[index]
+        self.dealt += 1
+        return card
+
+
+class TestActionEVs:
+    """Test exact action EVs against known six-deck values"""
+    
+    def test_sixteen_against_ten(self):
+        evs = evs_for((Rank.TEN, Rank.SIX), Rank.TEN)
+        assert evs[Action.STAND] == pytest.approx(-0.541, abs=2e-3)
+        assert evs[Action.HIT] == pytest.approx(-0.535, abs=2e-3)
+        assert evs[Action.SURRENDER] == -0.5
+    
+    def test_eleven_doubles(self):
+        evs = evs_for((Rank.SIX, Rank.FIVE), Rank.SIX)
+        assert evs[Action.DOUBLE] == pytest.approx(0.68, abs=0.01)
+        assert evs[Action.DOUBLE] > evs[Action.HIT] > evs[Action.STAND]
+    
+    def test_split_only_for_pairs(self):
+        assert Action.SPLIT not in evs_for((Rank.TEN, Rank.SIX), Rank.TEN)
+        evs = evs_for((Rank.EIGHT, Rank.EIGHT), Rank.TEN)
+        assert evs[Action.SPLIT] == pytest.approx(-0.48, abs=0.01)
+        assert best_action(make_hand(Rank.EIGHT, Rank.EIGHT), Card(Rank.TEN, Suit.CLUBS),
+                           remove_cards(full_shoe(6), [Card(Rank.EIGHT, Suit.HEARTS)] * 2 +
+                                        [Card(Rank.TEN, Suit.CLUBS)])) == Action.SPLIT
+    
+    def test_hit_matches_recursion(self):
+        """Hitting agrees with an uncached recursion on a small composition"""
+        hand = make_hand(Rank.FIVE, Rank.SEVEN)
+        up = Card(Rank.NINE, Suit.CLUBS)
+        composition = (2, 1, 2, 1, 1, 2, 1, 2, 5, 2)
+        hard, has_ace = hand_state(hand)
+        evs = action_evs(hand, up, composition)
+        assert max(evs[Action.HIT], evs[Action.STAND]) == \
+            pytest.approx(brute_force_hit(hard, has_ace, value_index(up), composition))
+    
+    def test_composition_matters(self):
+        """Extra tens make standing on 16 against a 6 better"""
+        hand = make_hand(Rank.TEN, Rank.SIX)
+        up = Card(Rank.SIX, Suit.CLUBS)
+        full = remove_cards(full_shoe(1), hand.cards + [up])
+        rich = list(full)
+        rich[8] += 12
+        assert action_evs(hand, up, tuple(rich))[Action.STAND] > action_evs(hand, up, full)[Action.STAND]
+    
+    def test_statistics_expected_value(self):
+        hand = make_hand(Rank.SIX, Rank.FIVE)
+        up = Card(Rank.SIX, Suit.CLUBS)
+        ev = BlackjackStatistics.calculate_expected_value('double', hand, up, 10)
+        assert ev == pytest.approx(10 * evs_for((Rank.SIX, Rank.FIVE), Rank.SIX)[Action.DOUBLE])
+
+
+class TestSplitEV:
+    """Test split EVs against rounds played out by RoundEngine"""
+    
+    @pytest.mark.parametrize("pair_rank", [Rank.ACE, Rank.EIGHT])
+    def test_split_matches_engine(self, pair_rank):
+        shoe = SplitShoe(pair_rank, Rank.SIX, seed=4)
+        engine = RoundEngine(shoe)
+        composition = remove_cards(full_shoe(6), shoe.opening)
+        
+        def policy(hand, up, can_double, can_split, can_surrender):
+            if engine.splits == 0:
+                return Action.SPLIT
+            # Each hand plays on the composition it was evaluated with: the
+            # shoe less the opening cards and its own draws
+            return best_action(hand, up, remove_cards(composition, hand.cards[1:]),
+                               can_double, False, can_surrender)
+        
+        nets = np.empty(40000)
+        for i in range(len(nets)):
+            shoe.new_round()
+            nets[i] = engine.play_round(10, policy) / 10
+        
+        ev = split_ev(value_index(shoe.opening[0]), value_index(shoe.opening[1]), composition)
+        std_error = nets.std() / np.sqrt(len(nets))
+        assert abs(nets.mean() - ev) < 4 * std_error
+
+
+class TestPerfectPlayer:
+    """Test the perfect-play simulation strategy"""
+    
+    def test_tracks_unseen_cards(self):
+        """At every decision the tracked composition is the deck plus the hole card"""
+        deck = ArrayDeck(2, 0.25, seed=11)
+        player = PerfectPlayer(num_decks=2)
+        deck.add_observer(player.observe, player.reset)
+        engine = RoundEngine(deck)
+        checked = []
+        
+        def policy(hand, up, can_double, can_split, can_surrender):
+            expected = unseen_composition(deck, engine.dealer_hand.cards[1:])
+            checked.append(tuple(player._composition) == expected)
+            return player.act(hand, up, can_double, can_split, can_surrender)
+        
+        for _ in range(60):
+            engine.play_round(player.bet(10), policy)
+        assert checked and all(checked)
+    
+    def test_simulation(self):
+        results = run_strategy_simulation(PerfectPlayer(6), 200, seed=3, bankroll=100000)
+        assert results['total_hands'] == 200
+        assert results['wins'] + results['losses'] + results['pushes'] > 0
@@ -0,0 +1,53 @@
+"""Tests for incremental hand evaluation"""
+import pytest
+
+from card import Card, Rank, Suit
+from hand import Hand
+
+
+def make_hand(*ranks):
+    hand = Hand()
+    for rank in ranks:
+        hand.add_card(Card(rank, Suit.SPADES))
+    return hand
+
+
+class TestHandValues:
+    """Test totals maintained by add_card()"""
+    
+    @pytest.mark.parametrize("ranks,value,hard,soft", [
+        ((Rank.TEN, Rank.SIX), 16, 16, False),
+        ((Rank.ACE, Rank.SIX), 17, 7, True),
+        ((Rank.ACE, Rank.ACE), 12, 2, True),
+        ((Rank.ACE, Rank.SIX, Rank.NINE), 16, 16, False),
+        ((Rank.ACE, Rank.ACE, Rank.NINE), 21, 11, True),
+        ((Rank.KING, Rank.QUEEN, Rank.FIVE), 25, 25, False),
+    ])
+    def test_value_hard_total_and_soft_flag(self, ranks, value, hard, soft):
+        """Best value, hard total and soft flag follow blackjack rules"""
+        hand = make_hand(*ranks)
+        assert hand.value == value
+        assert hand.get_values() == (value, hard)
+        assert hand.is_soft is soft
+        assert hand.is_bust is (value > 21)
+    
+    def test_blackjack(self):
+        """Two-card 21 is a blackjack unless the hand came from a split"""
+        hand = make_hand(Rank.ACE, Rank.KING)
+        assert hand.is_blackjack
+        hand.is_split_hand = True
+        assert not hand.is_blackjack
+        assert not make_hand(Rank.SEVEN, Rank.SEVEN, Rank.SEVEN).is_blackjack
+    
+    def test_pop_card_updates_totals(self):
+        """Removing a card for a split restores the one-card totals"""
+        hand = make_hand(Rank.ACE, Rank.ACE)
+        card = hand.pop_card()
+        assert card.rank == Rank.ACE
+        assert (hand.value, hand.hard_total, hand.is_soft) == (11, 1, True)
+    
+    def test_clear_resets_totals(self):
+        """A cleared hand evaluates like a new one"""
+        hand = make_hand(Rank.ACE, Rank.NINE)
+        hand.clear()
+        assert (hand.value, hand.hard_total, hand.aces, hand.is_soft) == (0, 0, 0, False)
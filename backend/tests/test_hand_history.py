@@ -0,0 +1,73 @@
+"""Tests for memory-mapped hand-history files"""
+import numpy as np
+
+from hand_history import (HandHistoryWriter, open_history, iter_history, ACTION_CODES,
+                          NO_CARD, NO_ACTION)
+from game import Action
+from round_engine import RESULT_SURRENDER
+from simulator import BlackjackSimulator
+from simulation_engine import run_strategy_simulation, BasicStrategyPlayer
+from strategy import ComputerPlayer, StrategyType, BettingStrategy
+
+
+def simulate_to(path, num_hands, seed=1, buffer_rounds=65536):
+    simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+    player = ComputerPlayer(StrategyType.BASIC, BettingStrategy.FLAT, base_bet=10, bankroll=1000000)
+    with HandHistoryWriter(path, buffer_rounds) as writer:
+        result = simulator.simulate_hands(player, num_hands, seed=seed, history=writer)
+    return result
+
+
+class TestHandHistory:
+    """Test writing and memory-mapping hand histories"""
+    
+    def test_records_match_simulation(self, tmp_path):
+        path = str(tmp_path / "history.bin")
+        result = simulate_to(path, 2000, buffer_rounds=300)
+        history = open_history(path)
+        assert isinstance(history, np.memmap)
+        assert len(history) == 2000
+        assert history['net'].sum() == result.profit_loss
+        assert np.all(history['bet'] == 10)
+        assert (history['results'] == RESULT_SURRENDER).sum() == result.total_surrenders
+    
+    def test_cards_and_actions(self, tmp_path):
+        path = str(tmp_path / "history.bin")
+        simulate_to(path, 2000)
+        history = open_history(path)
+        
+        # Every round has two dealer cards and a first hand with at least two cards
+        assert np.all(history['dealer_cards'][:, :2] != NO_CARD)
+        assert np.all(history['player_cards'][:, 0, :2] != NO_CARD)
+        
+        split = history['num_hands'] > 1
+        assert np.all(history['actions'][split, 0] == ACTION_CODES[Action.SPLIT])
+        assert np.all(history['pair'][split] == 1)
+        
+        # Hard 20 always stands (unless the dealer's natural ended the round first)
+        decided = history['actions'][:, 0] != NO_ACTION
+        hard_20 = (history['player_total'] == 20) & (history['soft'] == 0) & ~split & decided
+        assert np.all(history['actions'][hard_20, 0] == ACTION_CODES[Action.STAND])
+        assert np.all(history['player_cards'][hard_20, 0, 2] == NO_CARD)
+    
+    def test_appends_and_chunks(self, tmp_path):
+        path = str(tmp_path / "history.bin")
+        simulate_to(path, 500, seed=1)
+        simulate_to(path, 700, seed=2)
+        assert len(open_history(path)) == 1200
+        assert [len(chunk) for chunk in iter_history(path, chunk_rounds=512)] == [512, 512, 176]
+    
+    def test_strategy_engine_history(self, tmp_path):
+        path = str(tmp_path / "history.bin")
+        with HandHistoryWriter(path) as writer:
+            stats = run_strategy_simulation(BasicStrategyPlayer(), 1000, bankroll=1000000,
+                                            seed=3, history=writer)
+        history = open_history(path)
+        assert history['net'].sum() == stats['total_won_lost']
+        assert len(history) == stats['total_hands']
+    
+    def test_empty_history(self, tmp_path):
+        path = str(tmp_path / "history.bin")
+        HandHistoryWriter(path).close()
+        assert len(open_history(path)) == 0
+        assert list(iter_history(path)) == []
@@ -0,0 +1,238 @@
+"""Tests for the strategy optimizer"""
+import csv
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+
+from seeding import spawn_seeds
+from configurable_strategy import ConfigurableStrategy
+from surrogate import GaussianProcess, propose_batch
+from result_store import ResultStore, result_key
+import optimize_strategy as optimizer
+from optimize_strategy import (optimize_strategy, successive_halving, model_based_search,
+                               run_simulation_with_config, generate_parameter_grid,
+                               imap_bounded, chunked, evaluate_configs, TopK, ConfigSpace,
+                               SIMULATION_RULES)
+
+
+class TestGridSearch:
+    """Test the streaming grid search"""
+    
+    def test_imap_bounded_limits_in_flight(self):
+        """Tasks are drawn from the iterator only as results are consumed"""
+        drawn = []
+        running = []
+        peak = [0]
+        lock = threading.Lock()
+        
+        def task(i):
+            with lock:
+                running.append(i)
+                peak[0] = max(peak[0], len(running))
+            with lock:
+                running.remove(i)
+            return i * i
+        
+        def tasks():
+            for i in range(50):
+                drawn.append(i)
+                yield (i,)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = imap_bounded(executor, task, tasks(), 3)
+            first = next(results)
+            assert len(drawn) <= 4
+            rest = list(results)
+        assert sorted([first] + rest) == [i * i for i in range(50)]
+        assert peak[0] <= 3
+    
+    def test_chunked(self):
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    
+    def test_top_k(self):
+        top = TopK(3)
+        for roi in [0.1, -0.2, 0.5, 0.3, 0.5, -1.0]:
+            top.push(roi, {'roi': roi})
+        assert [entry['roi'] for entry in top.results()] == [0.5, 0.5, 0.3]
+    
+    def test_optimize_small_grid(self, tmp_path):
+        configs = list(itertools.islice(generate_parameter_grid(), 5))
+        best_config, results, csv_filename = optimize_strategy(
+            num_hands=100, max_workers=2, output_dir=str(tmp_path), seed=1,
+            top_k=3, chunk_size=2, configs=configs
+        )
+        with open(csv_filename) as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 6
+        assert len(results) == 3
+        assert results[0]['config'] == best_config
+        assert results[0]['roi'] == max(float(row[0]) for row in rows[1:])
+
+
+class TestSuccessiveHalving:
+    """Test racing configurations by successive halving"""
+    
+    def test_rounds_and_survivors(self):
+        configs = list(itertools.islice(generate_parameter_grid(), 9))
+        best_config, results, rounds = successive_halving(
+            min_hands=100, max_hands=900, eta=3, max_workers=2, seed=4, chunk_size=2, configs=configs
+        )
+        assert [(r['configs'], r['hands']) for r in rounds] == [(9, 100), (3, 300), (1, 900)]
+        assert len(results) == 1 and results[0]['config'] == best_config
+        
+        # Survivors of the first round are the best three on the shared shoes
+        shoe_seed = spawn_seeds(4, 1)[0]
+        first_round = sorted(range(9), key=lambda i: (
+            -run_simulation_with_config(configs[i], 100, seed=shoe_seed)['roi'], i))
+        assert best_config in [configs[i] for i in first_round[:3]]
+    
+    def test_no_configs(self):
+        """A round without results reports no best ROI instead of failing to print it"""
+        best_config, results, rounds = successive_halving(max_workers=1, configs=[])
+        assert best_config is None and results == []
+        assert rounds[0]['best_roi'] is None
+    
+    def test_invalid_eta(self):
+        with pytest.raises(ValueError):
+            successive_halving(eta=1, configs=[])
+
+
+class TestModelBasedSearch:
+    """Test the surrogate model and Bayesian optimization"""
+    
+    def test_gaussian_process_fits(self):
+        rng = np.random.default_rng(0)
+        X = rng.random((30, 1))
+        y = np.sin(6 * X[:, 0])
+        mean, std = GaussianProcess().fit(X, y).predict(np.array([[0.3], [0.7]]))
+        assert mean == pytest.approx(np.sin([1.8, 4.2]), abs=0.05)
+        assert (std < 0.1).all()
+    
+    def test_batch_is_distinct_and_near_optimum(self):
+        """A batch spreads out around the maximum of a smooth function"""
+        X = np.linspace(0, 1, 9)[:, None]
+        y = -(X[:, 0] - 0.62) ** 2
+        candidates = np.linspace(0, 1, 101)[:, None]
+        batch = propose_batch(X, y, candidates, 3)
+        assert len({tuple(point) for point in batch}) == 3
+        assert abs(batch[0, 0] - 0.62) < 0.1
+    
+    def test_config_space_round_trip(self):
+        space = ConfigSpace()
+        config = ConfigurableStrategy().config
+        rebuilt = space.to_config(space.from_config(config))
+        assert rebuilt['counting'] == config['counting']
+        assert rebuilt['betting']['count_threshold'] == config['betting']['count_threshold']
+        assert rebuilt['deviations'] == config['deviations']
+        assert space.snap(np.full(space.dimensions, 0.5)) == pytest.approx(
+            space.snap(space.snap(np.full(space.dimensions, 0.5))))
+    
+    def test_search(self):
+        best_config, results, history = model_based_search(
+            num_hands=100, budget=10, batch_size=3, initial=4, max_workers=2, seed=5
+        )
+        assert [batch['evaluations'] for batch in history] == [4, 7, 10]
+        assert results[0]['config'] == best_config
+        assert results[0]['roi'] == history[-1]['best_roi']
+        
+        # Every evaluated configuration is distinct and replays on the shared shoes
+        space = ConfigSpace()
+        assert len({space.key(space.from_config(r['config'])) for r in results}) == 10
+        shoe_seed = spawn_seeds(5, 2)[0]
+        assert run_simulation_with_config(best_config, 100, seed=shoe_seed)['roi'] == results[0]['roi']
+        assert best_config['deviations']['11_vs_5_double']['count_threshold'] == \
+            best_config['deviations']['11_vs_6_double']['count_threshold']
+
+
+class TestResultStore:
+    """Test resuming optimization from stored results"""
+    
+    def test_keys(self):
+        config = next(generate_parameter_grid())
+        shoe_seed = spawn_seeds(1, 1)[0]
+        key = result_key(config, 100, shoe_seed, SIMULATION_RULES)
+        assert key == result_key(dict(config), 100, spawn_seeds(1, 1)[0], dict(SIMULATION_RULES))
+        assert key != result_key(config, 200, shoe_seed, SIMULATION_RULES)
+        assert key != result_key(config, 100, spawn_seeds(2, 1)[0], SIMULATION_RULES)
+        assert key != result_key(config, 100, shoe_seed, {**SIMULATION_RULES, 'num_decks': 2})
+    
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / 'results.sqlite')
+        with ResultStore(path) as store:
+            store.put_many([('a', {'x': 1}, 100, {'roi': 0.5})])
+            assert store.get('b') is None
+        with ResultStore(path) as store:
+            assert store.get('a') == {'roi': 0.5}
+            assert len(store) == 1
+    
+    def test_skips_stored_configs(self, tmp_path, monkeypatch):
+        configs = list(itertools.islice(generate_parameter_grid(), 6))
+        calls = []
+        
+        def fake_simulation(config, num_hands, seed=None):
+            calls.append(config)
+            return {'roi': float(len(calls)), 'win_rate': 0.4, 'hands_played': num_hands,
+                    'final_bankroll': 10000}
+        
+        monkeypatch.setattr(optimizer, 'run_simulation_with_config', fake_simulation)
+        with ResultStore(str(tmp_path / 'results.sqlite')) as store, \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            first = list(evaluate_configs(executor, enumerate(configs[:4]), 100, 7, 2, 2, store))
+            assert len(calls) == 4 and len(store) == 4
+            
+            # A rerun over more configs only simulates the new ones
+            second = list(evaluate_configs(executor, enumerate(configs), 100, 7, 2, 2, store))
+            assert len(calls) == 6 and len(store) == 6
+            assert sorted((r for r in second if r[0] < 4), key=lambda r: r[0]) == sorted(first, key=lambda r: r[0])
+            
+            # A different seed is a different simulation
+            list(evaluate_configs(executor, enumerate(configs[:1]), 100, 8, 2, 2, store))
+            assert len(calls) == 7
+    
+    def test_stored_results_stream(self, tmp_path, monkeypatch):
+        """A fully stored rerun yields each result as soon as it is looked up"""
+        configs = list(itertools.islice(generate_parameter_grid(), 6))
+        monkeypatch.setattr(optimizer, 'run_simulation_with_config',
+                            lambda config, num_hands, seed=None: {'roi': 0.0})
+        read = []
+        
+        def indexed_configs():
+            for index, config in enumerate(configs):
+                read.append(index)
+                yield index, config
+        
+        with ResultStore(str(tmp_path / 'results.sqlite')) as store, \
+                ThreadPoolExecutor(max_workers=2) as executor:
+            list(evaluate_configs(executor, enumerate(configs), 100, 7, 2, 2, store))
+            results = evaluate_configs(executor, indexed_configs(), 100, 7, 2, 2, store)
+            assert next(results)[0] == 0
+            assert read == [0]
+            assert [index for index, _, _ in results] == [1, 2, 3, 4, 5]
+    
+    def test_resumed_search_matches(self, tmp_path):
+        configs = list(itertools.islice(generate_parameter_grid(), 4))
+        with ResultStore(str(tmp_path / 'results.sqlite')) as store:
+            first = optimize_strategy(num_hands=100, max_workers=2, output_dir=str(tmp_path), seed=3,
+                                      chunk_size=2, configs=configs[:2], store=store)[1]
+            results = optimize_strategy(num_hands=100, max_workers=2, output_dir=str(tmp_path), seed=3,
+                                        chunk_size=2, configs=configs, store=store)[1]
+            assert len(store) == 4
+        fresh = optimize_strategy(num_hands=100, max_workers=2, output_dir=str(tmp_path), seed=3,
+                                  chunk_size=2, configs=configs)[1]
+        assert [r['roi'] for r in results] == [r['roi'] for r in fresh]
+        assert {r['roi'] for r in first} <= {r['roi'] for r in results}
+
+
+class TestMain:
+    """Test the command line entry point"""
+    
+    def test_no_results(self, tmp_path, monkeypatch, capsys):
+        """A search that yields nothing reports no best config and writes no output"""
+        monkeypatch.setattr(optimizer, 'optimize_strategy', lambda *args, **kwargs: (None, [], None))
+        output = tmp_path / 'best.json'
+        monkeypatch.setattr('sys.argv', ['optimize_strategy.py', '--no-store', '--output', str(output)])
+        optimizer.main()
+        assert 'No configurations were evaluated' in capsys.readouterr().out
+        assert not output.exists()
@@ -0,0 +1,99 @@
+"""Tests for outcome tape recording and betting replay"""
+import numpy as np
+import pytest
+
+from configurable_strategy import ConfigurableStrategy
+from outcome_tape import (OutcomeTape, TAPE_DTYPE, HAND_DTYPE, replay_bets,
+                          replay_betting_strategy, replay_configurable)
+from simulation_engine import run_strategy_simulation, CountingStrategyPlayer
+from simulator import BlackjackSimulator
+from strategy import ComputerPlayer, StrategyType, BettingStrategy
+from round_engine import RESULT_NAMES
+
+
+def make_tape(unit_nets):
+    tape = np.zeros(len(unit_nets), dtype=TAPE_DTYPE)
+    tape['unit_net'] = unit_nets
+    tape['hands'] = 1
+    return tape
+
+
+def make_hands(unit_nets):
+    """One hand per round, settled at even money"""
+    hands = np.zeros(len(unit_nets), dtype=HAND_DTYPE)
+    codes = {-1: RESULT_NAMES.index('lose'), 0: RESULT_NAMES.index('push'),
+             1: RESULT_NAMES.index('win')}
+    hands['result'] = [codes[net] for net in unit_nets]
+    hands['unit_payout'] = [max(net, 0) * 2 for net in unit_nets]
+    return hands
+
+
+class TestRecording:
+    """Test tapes recorded by the simulators"""
+    
+    @pytest.mark.parametrize("betting_strategy", list(BettingStrategy))
+    def test_replay_matches_simulation(self, betting_strategy):
+        """A flat-bet tape replays every betting system exactly as simulated"""
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        recorder = ComputerPlayer(StrategyType.BASIC, BettingStrategy.FLAT, base_bet=10, bankroll=100000)
+        tape = OutcomeTape()
+        simulator.simulate_hands(recorder, 3000, seed=5, tape=tape)
+        assert len(tape) == 3000
+        
+        player = ComputerPlayer(StrategyType.BASIC, betting_strategy, base_bet=10, bankroll=100000)
+        result = simulator.simulate_hands(player, 3000, seed=5)
+        replay = replay_betting_strategy(tape.to_array(), betting_strategy, base_bet=10,
+                                         bankroll=100000, hands=tape.hands_array())
+        assert replay['total_hands'] == result.total_hands
+        assert replay['profit_loss'] == pytest.approx(result.profit_loss)
+    
+    def test_ramp_replay_matches_simulation(self):
+        """Replaying a strategy's own ramp reproduces the run that recorded it"""
+        tape = OutcomeTape()
+        stats = run_strategy_simulation(CountingStrategyPlayer(ConfigurableStrategy()), 3000,
+                                        bankroll=1000000, seed=2, tape=tape)
+        replay = replay_configurable(tape.to_array(), ConfigurableStrategy(), min_bet=10,
+                                     bankroll=1000000)
+        assert replay['profit_loss'] == pytest.approx(stats['total_won_lost'])
+        assert replay['total_wagered'] == pytest.approx(stats['total_wagered'])
+    
+    def test_save_and_load(self, tmp_path):
+        tape = OutcomeTape()
+        tape.record(1.5, -1.0)
+        tape.record(-2.0, 2.0, hands=2, splits=1, doubles=1, hand_results=[(2, 2.0), (2, 2.0)])
+        path = str(tmp_path / "tape.bin")
+        tape.save(path)
+        loaded = OutcomeTape.load(path)
+        assert loaded.dtype == TAPE_DTYPE
+        assert loaded.tolist() == tape.to_array().tolist()
+        assert OutcomeTape.load_hands(path).tolist() == tape.hands_array().tolist()
+
+
+class TestReplay:
+    """Test vectorized bet sizing and bankroll replay"""
+    
+    def test_martingale_follows_hand_results(self):
+        unit_nets = [-1, -1, 1, -1, 0, -1]
+        tape = make_tape(unit_nets)
+        replay = replay_betting_strategy(tape, BettingStrategy.MARTINGALE, base_bet=10,
+                                         bankroll=1000, hands=make_hands(unit_nets))
+        # BettingSystem doubles its doubled bet after a loss: 10, 40, 80, 10, 40, 10
+        assert replay['profit_loss'] == -10 - 40 + 80 - 10 + 0 - 10
+    
+    def test_hand_results_required(self):
+        tape = make_tape([1, -1])
+        with pytest.raises(ValueError):
+            replay_betting_strategy(tape, BettingStrategy.ONE_THREE_TWO_SIX)
+    
+    def test_bet_cut_to_bankroll_then_bust(self):
+        tape = make_tape([-1, -1, -1, 1])
+        replay = replay_bets(tape, np.full(4, 20.0), bankroll=25, min_bet=5)
+        assert replay['total_hands'] == 2
+        assert replay['ending_bankroll'] == 0
+        assert replay['bust_out']
+    
+    def test_kelly_without_hand_results(self):
+        tape = make_tape([1, -1])
+        replay = replay_betting_strategy(tape, BettingStrategy.KELLY_CRITERION, base_bet=10,
+                                         bankroll=1000)
+        assert replay['profit_loss'] == 0
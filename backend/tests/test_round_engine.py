@@ -0,0 +1,118 @@
+"""Tests for the headless round engine"""
+import pytest
+
+from card import Card, Rank, Suit
+from deck import ArrayDeck
+from game import BlackjackGame, GameState, Action
+from strategy import BasicStrategy, ComputerPlayer, StrategyType
+from round_engine import RoundEngine, RESULT_NAMES
+
+
+def basic_policy(hand, up_card, can_double, can_split, can_surrender):
+    return BasicStrategy.get_action(hand, up_card, can_double, can_split, can_surrender)
+
+
+class StackedDeck:
+    """Deals the given ranks in order"""
+    
+    def __init__(self, *ranks):
+        self.cards = [Card(rank, Suit.HEARTS) for rank in ranks]
+    
+    def deal(self):
+        return self.cards.pop(0)
+
+
+def play_game_round(game, bet):
+    """Play one BlackjackGame round with basic strategy and return the results"""
+    game.reset_round()
+    game.place_bet(bet)
+    game.deal_initial_cards()
+    if game.state == GameState.DEALER_TURN:
+        game._play_dealer_hand()
+    
+    while game.state == GameState.PLAYER_TURN:
+        hand = game.player_hands[game.current_hand_index]
+        valid = game.get_valid_actions()
+        action = basic_policy(hand, game.dealer_hand.cards[0], Action.DOUBLE in valid,
+                              Action.SPLIT in valid, Action.SURRENDER in valid)
+        if action == Action.DOUBLE and action not in valid:
+            action = Action.HIT
+        if action not in valid:
+            action = Action.STAND
+        game.player_action(action)
+    
+    return game.get_round_results()
+
+
+class TestRoundEngine:
+    """Test RoundEngine against the BlackjackGame state machine"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_blackjack_game(self, seed):
+        """Identical shoes give identical results and bankrolls"""
+        game = BlackjackGame(deck=ArrayDeck(6, 0.25, seed=seed))
+        game.player_bankroll = 100000
+        engine = RoundEngine(ArrayDeck(6, 0.25, seed=seed))
+        bankroll = 100000
+        
+        for _ in range(500):
+            results = play_game_round(game, 10)
+            bankroll += engine.play_round(10, basic_policy, bankroll)
+            
+            assert [r['result'] for r in results] == \
+                [RESULT_NAMES[engine.results[i]] for i in range(engine.num_hands)]
+            assert [r['payout'] for r in results] == engine.payouts[:engine.num_hands]
+            assert bankroll == game.player_bankroll
+    
+    def test_limited_bankroll_blocks_double_and_split(self):
+        """Doubles and splits need the bet to still be available"""
+        engine = RoundEngine(ArrayDeck(6, seed=0))
+        seen = []
+        
+        def policy(hand, up_card, can_double, can_split, can_surrender):
+            seen.append((can_double, can_split))
+            return Action.DOUBLE
+        
+        for _ in range(50):
+            engine.play_round(10, policy, bankroll=15)
+            assert engine.doubles == 0
+            assert engine.total_bet == 10
+        assert not any(can_double or can_split for can_double, can_split in seen)
+    
+    @pytest.mark.parametrize("strategy", [StrategyType.CONSERVATIVE, StrategyType.AGGRESSIVE])
+    def test_computer_player_respects_allowed_actions(self, strategy):
+        """Computer players never pick an action that is not allowed"""
+        player = ComputerPlayer(playing_strategy=strategy, bankroll=10000)
+        engine = RoundEngine(ArrayDeck(6, seed=4))
+        
+        def policy(hand, up_card, can_double, can_split, can_surrender):
+            action = player.choose_action(hand, up_card, can_double, can_split, can_surrender)
+            assert action is not Action.DOUBLE or can_double
+            assert action is not Action.SPLIT or can_split
+            return action
+        
+        for _ in range(200):
+            engine.play_round(10, policy, bankroll=20)
+    
+    def test_natural_paid_before_dealer_plays(self):
+        """A natural is paid 3:2 and the dealer does not draw to it"""
+        engine = RoundEngine(StackedDeck(Rank.ACE, Rank.SIX, Rank.KING, Rank.TEN, Rank.TEN))
+        assert engine.play_round(10, basic_policy) == 15
+        assert RESULT_NAMES[engine.results[0]] == 'blackjack'
+        assert len(engine.dealer_hand.cards) == 2
+    
+    def test_both_split_hands_are_split_hands(self):
+        """After a split neither hand re-splits, surrenders or counts A-10 as a natural"""
+        engine = RoundEngine(StackedDeck(Rank.ACE, Rank.SIX, Rank.ACE, Rank.TEN,
+                                         Rank.KING, Rank.NINE, Rank.TEN))
+        allowed = []
+        
+        def policy(hand, up_card, can_double, can_split, can_surrender):
+            if engine.splits == 0:
+                return Action.SPLIT
+            allowed.append((can_split, can_surrender))
+            return Action.STAND
+        
+        assert engine.play_round(10, policy) == 20
+        assert allowed == [(False, False), (False, False)]
+        assert [RESULT_NAMES[engine.results[i]] for i in range(2)] == ['win', 'win']
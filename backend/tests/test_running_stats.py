@@ -0,0 +1,41 @@
+"""Tests for streaming statistics accumulators"""
+import numpy as np
+import pytest
+
+from running_stats import RunningStats
+
+
+class TestRunningStats:
+    """Test RunningStats against NumPy over the full list of values"""
+    
+    def setup_method(self):
+        self.values = np.random.default_rng(0).normal(-0.5, 11.0, 1000)
+    
+    def test_matches_numpy(self):
+        stats = RunningStats()
+        for value in self.values:
+            stats.add(value)
+        assert stats.count == 1000
+        assert stats.mean == pytest.approx(self.values.mean())
+        assert stats.variance == pytest.approx(self.values.var(ddof=1))
+        assert stats.std_error == pytest.approx(self.values.std(ddof=1) / np.sqrt(1000))
+        low, high = stats.confidence_interval()
+        assert high - low == pytest.approx(2 * 1.96 * stats.std_error)
+    
+    def test_merge_and_batch(self):
+        """Merging accumulators of parts equals one accumulator over the whole"""
+        parts = [RunningStats() for _ in range(3)]
+        for part, chunk in zip(parts, np.array_split(self.values, 3)):
+            part.add_batch(chunk)
+        merged = RunningStats.combine(parts)
+        assert merged.count == 1000
+        assert merged.mean == pytest.approx(self.values.mean())
+        assert merged.variance == pytest.approx(self.values.var(ddof=1))
+    
+    def test_empty_and_single_value(self):
+        stats = RunningStats()
+        assert stats.to_dict()['std_error'] == 0.0
+        stats.add(5.0)
+        assert stats.mean == 5.0
+        assert stats.variance == 0.0
+        assert stats.confidence_interval() == (5.0, 5.0)
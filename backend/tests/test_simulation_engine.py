@@ -0,0 +1,106 @@
+"""Tests for the shared strategy simulation loop"""
+from types import SimpleNamespace
+
+from card import Card, Rank, Suit
+from game import Action
+from hand import Hand
+from strategy import BasicStrategy
+from strategy_table import CompiledStrategy
+from dad_strategy import DadStrategy
+from optimize_strategy import run_simulation_with_config, generate_parameter_grid
+from simulate_dad_strategy import run_simulation, run_basic_strategy_simulation
+from simulation_engine import (run_strategy_simulation, BasicStrategyPlayer,
+                               CountingStrategyPlayer)
+
+
+class RecordingStrategy(BasicStrategyPlayer):
+    """Basic strategy that records the cards it sees and its resets"""
+    
+    def __init__(self):
+        self.seen = 0
+        self.resets = 0
+    
+    def observe(self, card):
+        self.seen += 1
+    
+    def reset(self):
+        self.resets += 1
+
+
+class TestRunStrategySimulation:
+    """Test run_strategy_simulation"""
+    
+    def test_same_seed_same_result(self):
+        first = run_strategy_simulation(CountingStrategyPlayer(DadStrategy()), 2000, seed=5)
+        second = run_strategy_simulation(CountingStrategyPlayer(DadStrategy()), 2000, seed=5)
+        first.pop('hands_per_hour')
+        second.pop('hands_per_hour')
+        assert first == second
+    
+    def test_accounting(self):
+        stats = run_strategy_simulation(BasicStrategyPlayer(), 5000, bankroll=100000, seed=1)
+        assert stats['total_hands'] == 5000
+        assert stats['bet_distribution'] == {1: 5000}
+        assert stats['final_bankroll'] - stats['starting_bankroll'] == stats['total_won_lost']
+        # Doubles and splits add to the amount wagered
+        assert stats['total_wagered'] > 5000 * 10
+        assert stats['wins'] + stats['losses'] + stats['pushes'] >= 5000
+    
+    def test_tallies_surrenders(self):
+        """Surrendered hands are tallied apart from pushes"""
+        table = CompiledStrategy(hard={16: {10: 'Rh'}}, soft={}, split={},
+                                 fallback=BasicStrategy.compiled_table())
+        stats = run_strategy_simulation(BasicStrategyPlayer(table), 5000, bankroll=100000, seed=1)
+        assert stats['surrenders'] > 0
+        assert run_strategy_simulation(BasicStrategyPlayer(), 5000, bankroll=100000, seed=1)['surrenders'] == 0
+    
+    def test_resets_on_reshuffle(self):
+        strategy = RecordingStrategy()
+        run_strategy_simulation(strategy, 3000, num_decks=1, penetration=50,
+                                bankroll=100000, seed=2)
+        # One reset up front, then one per 26 cards dealt from the single deck
+        assert strategy.resets == 1 + strategy.seen // 26
+    
+    def test_stops_when_bust(self):
+        stats = run_strategy_simulation(BasicStrategyPlayer(), 100000, min_bet=10,
+                                        bankroll=20, seed=3)
+        assert stats['total_hands'] < 100000
+        assert stats['final_bankroll'] < 10
+
+
+class TestCountingStrategyPlayer:
+    """Test the adapter for counting strategies"""
+    
+    def test_deviations_respect_allowed_actions(self):
+        """A doubling deviation hits when the hand cannot double"""
+        strategy = DadStrategy()
+        strategy.counting_system.running_count = 100  # True count far above +10
+        player = CountingStrategyPlayer(strategy)
+        hand = Hand()
+        hand.add_card(Card(Rank.SIX, Suit.HEARTS))
+        hand.add_card(Card(Rank.FIVE, Suit.CLUBS))
+        up = Card(Rank.FIVE, Suit.SPADES)
+        assert player.act(hand, up, True, False, True) == Action.DOUBLE
+        assert player.act(hand, up, False, False, True) == Action.HIT
+
+
+class TestEntryPoints:
+    """Test the CLI and optimizer wrappers around the shared loop"""
+    
+    def args(self, **overrides):
+        values = dict(hands=500, decks=6, penetration=72, min_bet=10, bankroll=1000, seed=4)
+        values.update(overrides)
+        return SimpleNamespace(**values)
+    
+    def test_cli_simulations(self):
+        for run in (run_simulation, run_basic_strategy_simulation):
+            stats = run(self.args())
+            assert stats['total_hands'] > 0
+            assert stats['starting_bankroll'] == 1000
+            assert 'bet_distribution' in stats
+    
+    def test_optimizer_simulation(self):
+        config = next(generate_parameter_grid())
+        result = run_simulation_with_config(config, num_hands=500, seed=4)
+        assert set(result) == {'roi', 'win_rate', 'hands_played', 'final_bankroll'}
+        assert result == run_simulation_with_config(config, num_hands=500, seed=4)
@@ -0,0 +1,191 @@
+"""Tests for BlackjackSimulator runs and result merging"""
+import pytest
+
+from simulator import BlackjackSimulator, SimulationResult, merge_results, paired_difference
+from strategy import ComputerPlayer, StrategyType, BettingStrategy
+
+
+def make_result(hands, wins, ending, max_bankroll, min_bankroll, start=1000):
+    return SimulationResult(
+        total_hands=hands, total_wins=wins, total_losses=hands - wins, total_pushes=0,
+        total_blackjacks=0, total_surrenders=0, starting_bankroll=start,
+        ending_bankroll=ending, profit_loss=ending - start, win_rate=0, roi=0,
+        hands_per_hour=3600, max_bankroll=max_bankroll,
+        min_bankroll=min_bankroll, bust_out=False
+    )
+
+
+class TestMergeResults:
+    """Test merging of independent session results"""
+    
+    def test_sessions_are_laid_end_to_end(self):
+        """Profit carries over between sessions and extremes follow the combined path"""
+        merged = merge_results([
+            make_result(10, 6, ending=1050, max_bankroll=1080, min_bankroll=990),
+            make_result(10, 3, ending=900, max_bankroll=1010, min_bankroll=880),
+        ])
+        assert merged.total_hands == 20
+        assert merged.total_wins == 9
+        assert merged.total_losses == 11
+        assert merged.ending_bankroll == 950
+        assert merged.profit_loss == -50
+        assert merged.max_bankroll == 1080
+        assert merged.min_bankroll == 930
+        assert merged.roi == -5
+        assert merged.hands_per_hour == 3600
+
+
+class TestShardedSimulation:
+    """Test splitting one run across a process pool"""
+    
+    def test_shards_cover_all_hands(self):
+        """Every requested hand is played across the shards"""
+        simulator = BlackjackSimulator()
+        player = ComputerPlayer(bankroll=1000000)
+        result = simulator.simulate_hands(player, 1001, shards=3, max_workers=2, seed=7)
+        assert result.total_hands == 1001
+        assert player.betting_system.bankroll == result.ending_bankroll
+    
+    def test_rejects_player_subclasses(self):
+        """Shards would replace a subclass with a plain ComputerPlayer"""
+        class CautiousPlayer(ComputerPlayer):
+            pass
+        
+        simulator = BlackjackSimulator()
+        with pytest.raises(ValueError):
+            simulator.simulate_hands(CautiousPlayer(bankroll=1000000), 600, shards=2, seed=11)
+    
+    def test_seeded_runs_are_reproducible(self):
+        """The same seed gives the same sharded result"""
+        simulator = BlackjackSimulator()
+        first = simulator.simulate_hands(ComputerPlayer(bankroll=1000000), 600,
+                                         shards=2, max_workers=2, seed=11)
+        second = simulator.simulate_hands(ComputerPlayer(bankroll=1000000), 600,
+                                          shards=2, max_workers=2, seed=11)
+        assert first.ending_bankroll == second.ending_bankroll
+        assert first.total_wins == second.total_wins
+        assert first.max_bankroll == second.max_bankroll
+
+
+class TestOnlineStatistics:
+    """Test the per-hand accumulators carried by SimulationResult"""
+    
+    def test_net_stats_match_profit(self):
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        player = ComputerPlayer(StrategyType.BASIC, BettingStrategy.FLAT, base_bet=10, bankroll=100000)
+        result = simulator.simulate_hands(player, 2000, seed=3)
+        assert result.net_stats.count == 2000
+        assert result.net_stats.mean * 2000 == pytest.approx(result.profit_loss)
+        assert result.unit_stats.mean == pytest.approx(result.net_stats.mean / 10)
+        
+        report = result.to_dict()['ev_per_unit']
+        assert report['ci_low'] < report['mean'] < report['ci_high']
+    
+    def test_shards_merge_statistics(self):
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        player = ComputerPlayer(StrategyType.BASIC, BettingStrategy.FLAT, base_bet=10, bankroll=100000)
+        result = simulator.simulate_hands(player, 3000, shards=3, max_workers=1, seed=3)
+        assert result.net_stats.count == 3000
+        assert result.net_stats.mean * 3000 == pytest.approx(result.profit_loss)
+
+
+class TestEarlyStopping:
+    """Test precision-targeted stopping in simulate_hands"""
+    
+    def make_player(self):
+        return ComputerPlayer(StrategyType.BASIC, BettingStrategy.FLAT, base_bet=10, bankroll=100000)
+    
+    def test_stops_once_target_reached(self):
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        result = simulator.simulate_hands(self.make_player(), 50000, seed=1,
+                                          target_std_error=0.05, check_every=100)
+        assert result.total_hands < 50000
+        assert result.total_hands % 100 == 0
+        assert result.unit_stats.std_error <= 0.05
+    
+    def test_cap_limits_hands(self):
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        result = simulator.simulate_hands(self.make_player(), 1500, seed=1,
+                                          target_std_error=1e-6, check_every=1000)
+        assert result.total_hands == 1500
+    
+    def test_same_hands_as_fixed_run(self):
+        """Stopping early plays the same hands as a fixed run of that length"""
+        simulator = BlackjackSimulator(num_decks=6, shuffle_threshold=0.25)
+        early = simulator.simulate_hands(self.make_player(), 50000, seed=2,
+                                         target_std_error=0.05, check_every=100)
+        fixed = simulator.simulate_hands(self.make_player(), early.total_hands, seed=2)
+        assert early.profit_loss == fixed.profit_loss
+    
+    def test_invalid_target(self):
+        simulator = BlackjackSimulator()
+        with pytest.raises(ValueError):
+            simulator.simulate_hands(self.make_player(), 100, target_std_error=0)
+    
+    def test_api_target_ci_width(self, client):
+        response = client.post("/api/simulation/run", json={
+            "num_hands": 50000, "starting_bankroll": 100000, "seed": 1, "target_ci_width": 0.2
+        })
+        assert response.status_code == 200
+        simulation = response.json()["simulations"][0]
+        assert simulation["total_hands"] < 50000
+        assert simulation["ev_per_unit"]["ci_high"] - simulation["ev_per_unit"]["ci_low"] <= 0.2
+
+
+class TestPairedComparison:
+    """Test common-random-numbers strategy comparison"""
+    
+    def test_paired_difference(self):
+        """Mean, spread and interval of paired differences"""
+        stats = paired_difference([3.0, 5.0, 7.0], [1.0, 2.0, 3.0])
+        assert stats['mean_diff'] == 3.0
+        assert stats['std_diff'] == 1.0
+        assert stats['ci_low'] < 3.0 < stats['ci_high']
+        assert paired_difference([1.0, 2.0], [1.0, 2.0])['variance_reduction'] is None
+    
+    def test_paired_mode_reports_differences(self):
+        """Every strategy gets paired statistics against the first one"""
+        results = BlackjackSimulator().compare_strategies(num_hands=200, num_simulations=3,
+                                                          starting_bankroll=100000,
+                                                          seed=1, paired=True)
+        baseline, *others = results.values()
+        assert baseline['paired_vs_baseline']['mean_diff'] == 0
+        for strategy in others:
+            paired = strategy['paired_vs_baseline']
+            assert paired['ci_low'] <= paired['mean_diff'] <= paired['ci_high']
+    
+    def test_paired_runs_are_reproducible(self):
+        """A seeded paired comparison replays the same simulations"""
+        simulator = BlackjackSimulator()
+        first = simulator.compare_strategies(num_hands=100, num_simulations=2, seed=4, paired=True)
+        second = simulator.compare_strategies(num_hands=100, num_simulations=2, seed=4, paired=True)
+        first_runs = first['basic_flat']['simulations']
+        second_runs = second['basic_flat']['simulations']
+        assert [r['ending_bankroll'] for r in first_runs] == [r['ending_bankroll'] for r in second_runs]
+
+
+class TestSimulatePlayers:
+    """Test several players over one shared sequence of shoes"""
+    
+    def test_matches_individual_seeded_runs(self):
+        """Each player's result equals its own simulate_hands with the seed"""
+        simulator = BlackjackSimulator()
+        strategies = [(StrategyType.BASIC, BettingStrategy.FLAT),
+                      (StrategyType.BASIC, BettingStrategy.MARTINGALE),
+                      (StrategyType.CONSERVATIVE, BettingStrategy.FLAT)]
+        shared = simulator.simulate_players(
+            [ComputerPlayer(p, b, 10, 10000) for p, b in strategies], 1500, seed=3, chunk_hands=100)
+        for (p, b), result in zip(strategies, shared):
+            alone = simulator.simulate_hands(ComputerPlayer(p, b, 10, 10000), 1500, seed=3)
+            assert result.ending_bankroll == alone.ending_bankroll
+            assert result.total_wins == alone.total_wins
+            assert result.min_bankroll == alone.min_bankroll
+    
+    def test_bust_out_player_stops_early(self):
+        """A player who busts out stops while the others keep playing"""
+        players = [ComputerPlayer(base_bet=10, bankroll=100000),
+                   ComputerPlayer(base_bet=100, bankroll=200)]
+        rich, poor = BlackjackSimulator().simulate_players(players, 3000, seed=6)
+        assert rich.total_hands == 3000
+        assert poor.bust_out
+        assert poor.total_hands < 3000
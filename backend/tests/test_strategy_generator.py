@@ -0,0 +1,72 @@
+"""Tests for rule-set-specific basic strategy generation"""
+import os
+import pytest
+
+import strategy_generator
+from strategy import BasicStrategy
+from strategy_generator import RuleSet, basic_strategy_table, basic_strategy_tables, cache_path, rules_hash
+from card import Card, Rank, Suit
+from hand import Hand
+from game import Action
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    return str(tmp_path_factory.mktemp("strategy_cache"))
+
+
+@pytest.fixture(scope="module")
+def six_deck(cache_dir):
+    return basic_strategy_tables(RuleSet(num_decks=6), cache_dir)
+
+
+class TestGenerator:
+    """Test generated tables against published basic strategy"""
+    
+    def test_matches_hand_coded_table(self, six_deck):
+        """The six-deck table agrees with BasicStrategy except where it is finer"""
+        hard, soft, split = six_deck
+        for total, row in BasicStrategy.HARD_STRATEGY.items():
+            for key, letter in row.items():
+                if (total, key) != (11, 'A'):  # Hit 11 against an ace with six decks
+                    assert hard[total][key] == letter, (total, key)
+        for total, row in BasicStrategy.SOFT_STRATEGY.items():
+            for key, letter in row.items():
+                expected = 'Ds' if (total, letter) == (18, 'D') else letter
+                assert soft[total][key] == expected, (total, key)
+        for pair_value, row in BasicStrategy.SPLIT_STRATEGY.items():
+            assert split[pair_value] == row, pair_value
+    
+    def test_rules_change_strategy(self, cache_dir):
+        hard, soft, split = basic_strategy_tables(RuleSet(num_decks=1, surrender=True), cache_dir)
+        assert hard[11]['A'] == 'D'
+        assert hard[16][10] == 'Rh'
+        assert hard[17]['A'] == 'S'
+    
+    def test_surrender_letters_compile(self, cache_dir):
+        table = basic_strategy_table(RuleSet(num_decks=1, surrender=True), cache_dir)
+        hand = Hand()
+        hand.add_card(Card(Rank.TEN, Suit.HEARTS))
+        hand.add_card(Card(Rank.SIX, Suit.HEARTS))
+        up = Card(Rank.KING, Suit.CLUBS)
+        assert table.get_action(hand, up) == Action.SURRENDER
+        # After drawing (no double, no surrender) the hand hits
+        assert table.get_action(hand, up, can_double=False) == Action.HIT
+
+
+class TestCache:
+    """Test the on-disk table cache"""
+    
+    def test_cached_tables_load_without_generating(self, cache_dir, six_deck, monkeypatch):
+        path = cache_path(RuleSet(num_decks=6), cache_dir)
+        assert os.path.exists(path)
+        
+        def fail(rules):
+            raise AssertionError("tables should come from the cache")
+        
+        monkeypatch.setattr(strategy_generator, 'generate_tables', fail)
+        assert basic_strategy_tables(RuleSet(num_decks=6), cache_dir) == six_deck
+    
+    def test_rules_hash(self):
+        assert rules_hash(RuleSet()) == rules_hash(RuleSet(num_decks=6, surrender=False))
+        assert rules_hash(RuleSet(num_decks=2)) != rules_hash(RuleSet())
@@ -0,0 +1,86 @@
+"""Tests for compiled strategy lookup tables"""
+import pytest
+
+from card import Card, Rank, Suit
+from game import Action
+from hand import Hand
+from strategy import BasicStrategy
+from strategy_table import CompiledStrategy, DEALER_KEYS
+
+RANK_BY_VALUE = {2: Rank.TWO, 3: Rank.THREE, 4: Rank.FOUR, 5: Rank.FIVE, 6: Rank.SIX,
+                 7: Rank.SEVEN, 8: Rank.EIGHT, 9: Rank.NINE, 10: Rank.TEN, 11: Rank.ACE}
+LETTER_ACTIONS = {'H': Action.HIT, 'S': Action.STAND, 'D': Action.DOUBLE}
+
+
+def make_hand(*values):
+    hand = Hand()
+    for value in values:
+        hand.add_card(Card(RANK_BY_VALUE[value], Suit.CLUBS))
+    return hand
+
+
+def dealer_card(key):
+    return Card(RANK_BY_VALUE[11 if key == 'A' else key], Suit.HEARTS)
+
+
+class TestCompiledStrategy:
+    """Compiled lookups agree with the HARD/SOFT/SPLIT tables"""
+    
+    @pytest.mark.parametrize("dealer_key", DEALER_KEYS)
+    def test_hard_totals(self, dealer_key):
+        """Every hard total gives the table action"""
+        for total, row in BasicStrategy.HARD_STRATEGY.items():
+            if total <= 11:
+                hand = make_hand(2, total - 2)
+            elif total <= 20:
+                hand = make_hand(10, total - 10)
+            else:
+                hand = make_hand(10, 5, 6)
+            expected = LETTER_ACTIONS[row[dealer_key]]
+            action = BasicStrategy.get_action(hand, dealer_card(dealer_key), can_split=False)
+            assert action == expected
+    
+    @pytest.mark.parametrize("dealer_key", DEALER_KEYS)
+    def test_soft_totals(self, dealer_key):
+        """Soft totals use the SOFT table, and D becomes H when doubling is not allowed"""
+        for total, row in BasicStrategy.SOFT_STRATEGY.items():
+            if total == 21:
+                continue  # A,10 is a blackjack, not a decision
+            hand = make_hand(11, total - 11)
+            expected = LETTER_ACTIONS[row[dealer_key]]
+            assert BasicStrategy.get_action(hand, dealer_card(dealer_key)) == expected
+            no_double = BasicStrategy.get_action(hand, dealer_card(dealer_key), can_double=False)
+            assert no_double == (Action.HIT if expected == Action.DOUBLE else expected)
+    
+    @pytest.mark.parametrize("dealer_key", DEALER_KEYS)
+    def test_pairs(self, dealer_key):
+        """Pairs split exactly where the SPLIT table says Y"""
+        for pair_value, row in BasicStrategy.SPLIT_STRATEGY.items():
+            hand = make_hand(pair_value, pair_value)
+            action = BasicStrategy.get_action(hand, dealer_card(dealer_key))
+            assert (action == Action.SPLIT) == (row[dealer_key] == 'Y')
+            assert BasicStrategy.get_action(hand, dealer_card(dealer_key), can_split=False) != Action.SPLIT
+    
+    def test_missing_cells_use_fallback(self):
+        """Undefined and '?' cells take the fallback table's action"""
+        custom = CompiledStrategy(
+            hard={16: {10: '?', 9: 'R'}}, soft={}, split={},
+            fallback=BasicStrategy.compiled_table()
+        )
+        hand = make_hand(10, 6)
+        assert custom.get_action(hand, dealer_card(10)) == Action.HIT
+        assert custom.get_action(hand, dealer_card(9)) == Action.SURRENDER
+        assert custom.get_action(hand, dealer_card(2)) == Action.STAND
+    
+    def test_surrender_falls_back_when_not_allowed(self):
+        """'Rh' and 'Rs' hit or stand on hands that cannot surrender"""
+        table = CompiledStrategy(hard={16: {10: 'Rh', 9: 'Rs'}}, soft={}, split={})
+        hand = make_hand(10, 6)
+        assert table.get_action(hand, dealer_card(10)) == Action.SURRENDER
+        assert table.get_action(hand, dealer_card(10), can_surrender=False) == Action.HIT
+        assert table.get_action(hand, dealer_card(9), can_surrender=False) == Action.STAND
+        
+        # Three cards or a split hand can never surrender
+        assert table.get_action(make_hand(10, 4, 2), dealer_card(10)) == Action.HIT
+        hand.is_split_hand = True
+        assert table.get_action(hand, dealer_card(9)) == Action.STAND
@@ -0,0 +1,67 @@
+"""Tests for the vectorized multi-shoe simulator"""
+import pytest
+
+from card import CARDS
+from deck import ArrayDeck
+from round_engine import RoundEngine
+from strategy import BasicStrategy, ComputerPlayer, StrategyType, BettingStrategy
+from strategy_table import CompiledStrategy
+from vector_simulator import VectorSimulator
+
+
+class TestVectorSimulator:
+    """Test VectorSimulator against the scalar round engine"""
+    
+    @pytest.mark.parametrize("surrender", [False, True])
+    @pytest.mark.parametrize("seed", range(20))
+    def test_rounds_match_round_engine(self, seed, surrender):
+        """A lane playing a given shoe nets the same as RoundEngine on it"""
+        deck = ArrayDeck(6, 0.25, seed=seed)
+        points = [1 if CARDS[code].is_ace else CARDS[code].value for code in deck._order]
+        
+        simulator = VectorSimulator(num_lanes=1, seed=seed)
+        simulator._new_shoes()
+        simulator.buffer[0, :simulator.cut] = points[:simulator.cut]
+        engine = RoundEngine(deck)
+        table = BasicStrategy.compiled_table()
+        if surrender:
+            table = CompiledStrategy(hard={15: {10: 'Rh'}, 16: {9: 'Rh', 10: 'Rh', 'A': 'Rh'}},
+                                     soft={}, split={}, fallback=table)
+        
+        def policy(hand, up_card, can_double, can_split, can_surrender):
+            return table.get_action(hand, up_card, can_double, can_split, can_surrender)
+        
+        for _ in range(20):
+            net, counts = simulator._play_step(table, 10)
+            assert net[0] == engine.play_round(10, policy)
+            assert simulator.position[0] == deck.position
+    
+    def test_result_fields(self):
+        """Counts and bankroll path are consistent with the hands played"""
+        simulator = VectorSimulator(num_lanes=256, seed=1)
+        result = simulator.simulate_table(BasicStrategy.compiled_table(), 1000,
+                                          base_bet=10, bankroll=100000)
+        assert result.total_hands == 1000
+        assert result.total_wins + result.total_losses + result.total_pushes >= 1000
+        assert result.total_blackjacks <= result.total_wins
+        assert result.profit_loss == result.ending_bankroll - 100000
+        assert result.min_bankroll <= result.ending_bankroll <= result.max_bankroll
+        assert not result.bust_out
+    
+    def test_bust_out_stops_play(self):
+        """Play stops as soon as the bankroll cannot cover the bet"""
+        simulator = VectorSimulator(num_lanes=64, seed=2)
+        player = ComputerPlayer(base_bet=100, bankroll=300)
+        result = simulator.simulate_hands(player, 100000)
+        assert result.bust_out
+        assert result.total_hands < 100000
+        assert result.ending_bankroll < 100
+        assert player.betting_system.bankroll == result.ending_bankroll
+    
+    def test_rejects_unsupported_players(self):
+        """Only basic strategy with flat betting can be vectorized"""
+        simulator = VectorSimulator(num_lanes=8)
+        player = ComputerPlayer(playing_strategy=StrategyType.CARD_COUNTING,
+                                betting_strategy=BettingStrategy.KELLY_CRITERION)
+        with pytest.raises(ValueError):
+            simulator.simulate_hands(player, 10)